@@ -0,0 +1,78 @@
+"""
+A pytest module to benchmark the per-call overhead of FieldArray arithmetic on scalars and small arrays.
+"""
+import numpy as np
+import pytest
+
+import galois
+
+
+class Base:
+    # Placeholder variables
+    order = 2
+    ufunc_mode = "jit-calculate"
+    N = -1
+
+    def setup_method(self):
+        self.GF = galois.GF(self.order, compile=self.ufunc_mode)
+
+        np.random.seed(123456789)
+        if self.N == 0:
+            self.x = self.GF.Random()
+            self.y = self.GF.Random(low=1)
+        else:
+            self.x = self.GF.Random(self.N)
+            self.y = self.GF.Random(self.N, low=1)
+
+    def test_add(self, benchmark):
+        benchmark(np.add, self.x, self.y)
+
+    def test_subtract(self, benchmark):
+        benchmark(np.subtract, self.x, self.y)
+
+    def test_multiply(self, benchmark):
+        benchmark(np.multiply, self.x, self.y)
+
+    def test_divide(self, benchmark):
+        benchmark(np.divide, self.x, self.y)
+
+    def test_add_operator(self, benchmark):
+        benchmark(lambda: self.x + self.y)
+
+    def test_multiply_operator(self, benchmark):
+        benchmark(lambda: self.x * self.y)
+
+
+@pytest.mark.benchmark(group="GF(2^8) Scalar Arithmetic: ufunc_mode='jit-lookup'")
+class Test_GF2_8_lookup_scalar(Base):
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    N = 0
+
+
+@pytest.mark.benchmark(group="GF(2^8) Array Arithmetic: shape=(10,), ufunc_mode='jit-lookup'")
+class Test_GF2_8_lookup(Base):
+    order = 2**8
+    ufunc_mode = "jit-lookup"
+    N = 10
+
+
+@pytest.mark.benchmark(group="GF(2^8) Array Arithmetic: shape=(100,), ufunc_mode='jit-calculate'")
+class Test_GF2_8_calculate(Base):
+    order = 2**8
+    ufunc_mode = "jit-calculate"
+    N = 100
+
+
+@pytest.mark.benchmark(group="GF(257) Scalar Arithmetic: ufunc_mode='jit-lookup'")
+class Test_GF257_lookup_scalar(Base):
+    order = 257
+    ufunc_mode = "jit-lookup"
+    N = 0
+
+
+@pytest.mark.benchmark(group="GF(257) Array Arithmetic: shape=(10,), ufunc_mode='jit-lookup'")
+class Test_GF257_lookup(Base):
+    order = 257
+    ufunc_mode = "jit-lookup"
+    N = 10
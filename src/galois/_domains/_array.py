@@ -133,8 +133,14 @@ class Array(LinalgFunctionMixin, FunctionMixin, UFuncMixin, np.ndarray, metaclas
 
         For internal library use only.
         """
-        with cls._view_without_verification():
+        # This is equivalent to the `_view_without_verification()` context manager, but it is on the hot path of every
+        # arithmetic operation and the context manager's overhead is significant for small arrays
+        prev_value = cls._verify_on_view
+        cls._verify_on_view = False
+        try:
             array = array.view(cls)
+        finally:
+            cls._verify_on_view = prev_value
         return array
 
     @classmethod
@@ -318,7 +324,11 @@ class Array(LinalgFunctionMixin, FunctionMixin, UFuncMixin, np.ndarray, metaclas
     ###############################################################################
 
     @classmethod
-    def compile(cls, mode: Literal["auto", "jit-lookup", "jit-calculate", "python-calculate"]):
+    def compile(
+        cls,
+        mode: Literal["auto", "jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"],
+        parallel: bool = False,
+    ):
         """
         Recompile the just-in-time compiled ufuncs for a new calculation mode.
 
@@ -327,36 +337,61 @@ class Array(LinalgFunctionMixin, FunctionMixin, UFuncMixin, np.ndarray, metaclas
         Arguments:
             mode: The ufunc calculation mode.
 
-                - `"auto"`: Selects `"jit-lookup"` for fields with order less than :math:`2^{20}`, `"jit-calculate"`
-                  for larger fields, and `"python-calculate"` for fields whose elements cannot be represented with
-                  :obj:`numpy.int64`.
+                - `"auto"`: Selects `"jit-table"` for fields whose multiplication and division tables use at most
+                  128 KB, `"jit-lookup"` for other fields with order less than :math:`2^{20}`, `"jit-split-table"`
+                  for larger binary extension fields, `"jit-calculate"` for other larger fields, and
+                  `"python-calculate"` for fields whose elements cannot be represented with :obj:`numpy.int64`.
                 - `"jit-lookup"`: JIT compiles arithmetic ufuncs to use Zech log, log, and anti-log lookup tables for
                   efficient computation. In the few cases where explicit calculation is faster than table lookup,
                   explicit calculation is used.
                 - `"jit-calculate"`: JIT compiles arithmetic ufuncs to use explicit calculation. The `"jit-calculate"`
                   mode is designed for large fields that cannot or should not store lookup tables in RAM. Generally,
                   the `"jit-calculate"` mode is slower than `"jit-lookup"`.
+                - `"jit-split-table"`: JIT compiles arithmetic ufuncs to use explicit calculation, except that
+                  multiplication uses small split tables. For each product, the multiples of one operand by every
+                  4-bit polynomial are tabulated, and the other operand is processed 4 bits at a time with a
+                  table-driven reduction modulo the irreducible polynomial. This is only supported for binary extension
+                  fields with order greater than :math:`2^{20}`, for which it is several times faster than
+                  `"jit-calculate"`.
+                - `"jit-table"`: JIT compiles arithmetic ufuncs to use full multiplication and division tables with
+                  :math:`p^{2m}` entries each, so multiplication and division are a single table lookup. The other
+                  arithmetic is the same as `"jit-lookup"`. This is only supported for fields with order at most
+                  :math:`2^{12}`.
                 - `"python-calculate"`: Uses pure-Python ufuncs with explicit calculation. This is reserved for fields
                   whose elements cannot be represented with :obj:`numpy.int64` and instead use :obj:`numpy.object_`
                   with Python :obj:`int` (which has arbitrary precision).
+            parallel: Indicates whether to use multi-threaded JIT-compiled ufuncs for element-wise arithmetic on large
+                arrays. When enabled, arithmetic on arrays with at least :math:`2^{16}` elements is split across
+                Numba's thread pool, whose size may be set with :func:`numba.set_num_threads`. Smaller arrays and
+                reductions still use the single-threaded ufuncs. This is only supported for the JIT-compiled modes.
+                The default is `False`.
         """
         verify_isinstance(mode, str)
-        if not mode in ["auto", "jit-lookup", "jit-calculate", "python-calculate"]:
+        if not mode in ["auto", "jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"]:
             raise ValueError(
-                f"Argument 'mode' must be in ['auto', 'jit-lookup', 'jit-calculate', 'python-calculate'], not {mode!r}."
+                "Argument 'mode' must be in ['auto', 'jit-lookup', 'jit-calculate', 'jit-split-table', 'jit-table', "
+                f"'python-calculate'], not {mode!r}."
             )
         mode = cls.default_ufunc_mode if mode == "auto" else mode
         if mode not in cls.ufunc_modes:
             raise ValueError(f"Argument 'mode' must be in {cls.ufunc_modes} for {cls._name}, not {mode!r}.")
 
-        if mode == cls.ufunc_mode:
+        verify_isinstance(parallel, bool)
+        if parallel and mode == "python-calculate":
+            raise ValueError("Argument 'parallel' is only supported for the JIT-compiled modes.")
+
+        if mode == cls.ufunc_mode and parallel == cls._ufunc_parallel:
             # Don't need to rebuild these ufuncs
             return
 
         cls._ufunc_mode = mode
+        cls._ufunc_parallel = parallel
+        cls._fast_ufuncs = {}
 
-        if cls.ufunc_mode == "jit-lookup" and cls._EXP.size == 0:
+        if cls.ufunc_mode in ["jit-lookup", "jit-table"] and cls._EXP.size == 0:
             cls._build_lookup_tables()
+        if cls.ufunc_mode == "jit-table" and cls._MUL_TABLE.size == 0:
+            cls._build_arithmetic_tables()
 
     ###############################################################################
     # Element display methods
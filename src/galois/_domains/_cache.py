@@ -0,0 +1,102 @@
+"""
+A module that manages the persistent on-disk caching of JIT-compiled ufuncs and functions, and of lookup tables.
+
+Numba indexes its on-disk cache by a function's qualified name and source file. It does not consider the values of
+the global variables that are frozen into the compiled machine code. Since the ufunc and function dispatchers set
+field-specific globals before JIT compiling their implementations, each field's kernel must be given a unique
+qualified name so that cache entries from different fields never collide.
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import types
+import warnings
+from typing import Any, Callable
+
+import numba
+import numpy as np
+
+from .._options import CACHEOPTIONS
+
+
+def cache_key(*args: Any) -> str:
+    """
+    Returns a short, deterministic hex digest of the arguments. The library version is included so that cache entries
+    from a previous release are never reused.
+    """
+    from .. import __version__  # pylint: disable=import-outside-toplevel
+
+    string = repr((__version__,) + args)
+    return hashlib.sha1(string.encode("utf-8")).hexdigest()[0:16]
+
+
+def cacheable(func: Callable, key: str) -> Callable:
+    """
+    Returns a copy of `func` whose qualified name is unique to `key`. The copy shares the code object and module
+    globals of `func`, so it compiles to identical machine code, but Numba stores it in its own cache file.
+    """
+    copy = types.FunctionType(func.__code__, func.__globals__, func.__name__, func.__defaults__, func.__closure__)
+    # The last component of the qualified name must remain the function's name. Numba uses it to detect recursion.
+    scope, _, name = func.__qualname__.rpartition(".")
+    copy.__qualname__ = f"{scope or name}_{key}.{name}"
+    copy.__module__ = func.__module__
+    return copy
+
+
+@contextlib.contextmanager
+def ignore_uncacheable_warnings():
+    """
+    Suppresses Numba's warning that a kernel cannot be cached on disk. Numba does not freeze global arrays larger
+    than 1 MB (e.g., the lookup tables of large fields) into the machine code. Instead, it embeds their runtime
+    addresses. Those kernels are compiled as usual, but they are not saved to disk.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Cannot cache compiled function", category=numba.NumbaWarning)
+        yield
+
+
+def table_path(key: str) -> str:
+    """
+    Returns the path of the on-disk lookup table file for the cache key.
+    """
+    directory = CACHEOPTIONS["directory"]
+    if directory is None:
+        directory = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "galois")
+    return os.path.join(directory, f"tables_{key}.npy")
+
+
+def load_tables(key: str, size: int) -> np.ndarray | None:
+    """
+    Loads the lookup tables from disk. Returns `None` if the tables were never saved or the file is corrupt.
+
+    If the `mmap` option is set, the file is memory-mapped read-only rather than copied into memory. The operating
+    system then backs every process's tables with the same physical pages of its page cache.
+    """
+    try:
+        tables = np.load(table_path(key), mmap_mode="r" if CACHEOPTIONS["mmap"] else None)
+    except (OSError, ValueError):
+        return None
+
+    if not (tables.ndim == 1 and tables.size == size):
+        return None
+
+    return tables
+
+
+def save_tables(key: str, tables: np.ndarray):
+    """
+    Saves the lookup tables to disk. The file is written atomically, so concurrent processes never read a partially
+    written file. Failures are ignored since the cache is only an optimization.
+    """
+    path = table_path(key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), suffix=".npy", delete=False) as f:
+            np.save(f, tables)
+        os.chmod(f.name, 0o644)  # Allow other users' processes to share the tables
+        os.replace(f.name, path)
+    except OSError:
+        pass
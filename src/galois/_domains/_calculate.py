@@ -2,14 +2,19 @@
 A module containing various ufunc dispatchers with explicit calculation arithmetic added. Various algorithms for
 each type of arithmetic are implemented here.
 """
-from typing import Type
+import math
+from typing import Callable, Type
 
 import numba
 import numpy as np
+from llvmlite import ir
+from numba.core import cgutils
+from numba.extending import intrinsic
 
 from .._prime import factors
-from . import _lookup
+from . import _limbs, _lookup, _ufunc
 from ._array import Array
+from ._function import Function
 
 # pylint: disable=global-variable-undefined
 
@@ -49,6 +54,36 @@ def vector_to_int(a_vec: np.ndarray, characteristic: int, degree: int) -> int:
     return a
 
 
+@numba.jit(["int64[:, :](int64[:], int64, int64)"], nopython=True, cache=True)
+def ints_to_vectors(a: np.ndarray, characteristic: int, degree: int) -> np.ndarray:  # pragma: no cover
+    """
+    Converts a 1-D array of integer representations to an (N, degree) array of vector/polynomial representations.
+    """
+    a_vec = np.zeros((a.size, degree), dtype=np.int64)
+    for k in range(a.size):
+        q = a[k]
+        for i in range(degree - 1, -1, -1):
+            q, r = divmod(q, characteristic)
+            a_vec[k, i] = r
+
+    return a_vec
+
+
+@numba.jit(["int64[:](int64[:, :], int64, int64)"], nopython=True, cache=True)
+def vectors_to_ints(a_vec: np.ndarray, characteristic: int, degree: int) -> np.ndarray:  # pragma: no cover
+    """
+    Converts an (N, degree) array of vector/polynomial representations to a 1-D array of integer representations.
+    """
+    a = np.zeros(a_vec.shape[0], dtype=np.int64)
+    for k in range(a_vec.shape[0]):
+        s = 0
+        for i in range(degree):
+            s = s * characteristic + a_vec[k, i]
+        a[k] = s
+
+    return a
+
+
 @numba.jit(["int64[:](int64, int64)"], nopython=True, cache=True)
 def egcd(a: int, b: int) -> np.ndarray:  # pragma: no cover
     """
@@ -79,6 +114,84 @@ def egcd(a: int, b: int) -> np.ndarray:  # pragma: no cover
 EGCD = egcd
 
 
+@intrinsic
+def stack_empty(typingctx, size):  # pylint: disable=unused-argument
+    """
+    Allocates an uninitialized int64 buffer with a constant size on the stack of the calling JIT function. The buffer is
+    viewed as an array with `numba.carray()`. Unlike `np.empty()`, it is not allocated on the heap, so a small table
+    may be built for each scalar operation. The buffer must not outlive the calling function.
+    """
+    if not isinstance(size, numba.types.IntegerLiteral):
+        return None
+    n = size.literal_value
+
+    def codegen(context, builder, signature, args):  # pylint: disable=unused-argument
+        return cgutils.alloca_once(builder, context.get_value_type(numba.types.int64), size=n)
+
+    return numba.types.CPointer(numba.types.int64)(size), codegen
+
+
+@intrinsic
+def multiply_wide(typingctx, a, b):  # pylint: disable=unused-argument
+    """
+    Computes the 128-bit product of two int64 integers, interpreted as unsigned 64-bit integers. The product is
+    returned as a tuple of its high and low 64-bit words, each stored in an int64.
+    """
+    if not (isinstance(a, numba.types.Integer) and isinstance(b, numba.types.Integer)):
+        return None
+
+    def codegen(context, builder, signature, args):  # pylint: disable=unused-argument
+        i64, i128 = ir.IntType(64), ir.IntType(128)
+        a_wide = builder.zext(context.cast(builder, args[0], signature.args[0], numba.types.int64), i128)
+        b_wide = builder.zext(context.cast(builder, args[1], signature.args[1], numba.types.int64), i128)
+        c = builder.mul(a_wide, b_wide)
+        hi = builder.trunc(builder.lshr(c, ir.Constant(i128, 64)), i64)
+        lo = builder.trunc(c, i64)
+        return context.make_tuple(builder, signature.return_type, [hi, lo])
+
+    return numba.types.UniTuple(numba.types.int64, 2)(a, b), codegen
+
+
+@numba.jit(["int64(int64, int64, int64)"], nopython=True, cache=True)
+def multiply_modular_safe(a: int, b: int, modulus: int) -> int:  # pragma: no cover
+    """
+    Computes a * b % modulus, for 0 <= a, b < modulus < 2^63, without overflowing int64.
+    """
+    c = 0
+    while b > 0:
+        if b & 0b1:
+            c -= modulus - a  # Compute (c + a) % modulus
+            if c < 0:
+                c += modulus
+        a -= modulus - a  # Compute (a + a) % modulus
+        if a < 0:
+            a += modulus
+        b >>= 1
+
+    return c
+
+
+MULTIPLY_MODULAR_SAFE = multiply_modular_safe
+
+
+@numba.jit(["int64(int64, int64, int64, int64)"], nopython=True, cache=True)
+def montgomery_reduce(hi: int, lo: int, modulus: int, modulus_inv: int) -> int:  # pragma: no cover
+    """
+    Computes the Montgomery reduction T * 2^-64 % modulus of the 128-bit integer T = hi * 2^64 + lo, for
+    0 <= T < modulus * 2^64 and an odd modulus < 2^63. The argument `modulus_inv` is modulus^-1 % 2^64.
+
+    Algorithm:
+        m = lo * modulus^-1 % 2^64, so T - m * modulus is divisible by 2^64 and its low word is 0
+        (T - m * modulus) / 2^64 = hi - (m * modulus) // 2^64, which is in (-modulus, modulus)
+    """
+    m = multiply_wide(lo, modulus_inv)[1]
+    c = hi - multiply_wide(m, modulus)[0]
+    if c < 0:
+        c += modulus
+
+    return c
+
+
 @numba.jit(["int64(int64[:], int64[:])"], nopython=True, cache=True)
 def crt(remainders: np.ndarray, moduli: np.ndarray) -> int:  # pragma: no cover
     """
@@ -86,24 +199,21 @@ def crt(remainders: np.ndarray, moduli: np.ndarray) -> int:  # pragma: no cover
     """
     # Iterate through the system of congruences reducing a pair of congruences into a
     # single one. The answer to the final congruence solves all the congruences.
-    a1, m1 = remainders[0], moduli[0]
+    a1, m1 = remainders[0] % moduli[0], moduli[0]
     for a2, m2 in zip(remainders[1:], moduli[1:]):
         # Use the Extended Euclidean Algorithm to determine: b1*m1 + b2*m2 = gcd(m1, m2).
-        d, b1, b2 = EGCD(m1, m2)
+        d, b1 = EGCD(m1, m2)[0:2]
 
-        if d == 1:
-            # The moduli (m1, m2) are coprime
-            x = (a1 * b2 * m2) + (a2 * b1 * m1)  # Compute x through explicit construction
-            m1 = m1 * m2  # The new modulus
-        else:
-            # The moduli (m1, m2) are not coprime, however if a1 == b2 (mod d)
-            # then a unique solution still exists.
-            if not (a1 % d) == (a2 % d):
-                raise ArithmeticError
-            x = ((a1 * b2 * m2) + (a2 * b1 * m1)) // d  # Compute x through explicit construction
-            m1 = (m1 * m2) // d  # The new modulus
+        # If the moduli (m1, m2) are not coprime, a unique solution still exists if a1 == a2 (mod d)
+        if not (a1 % d) == (a2 % d):
+            raise ArithmeticError
 
-        a1 = x % m1  # The new equivalent remainder
+        # The solution is x = a1 + m1*k, where k = (a2 - a1)/d * b1 (mod m2/d). Each intermediate value is less than
+        # the new modulus, so nothing overflows int64.
+        m2 = m2 // d
+        k = MULTIPLY_MODULAR_SAFE(((a2 - a1) // d) % m2, b1 % m2, m2)
+        a1 = a1 + m1 * k  # The new equivalent remainder
+        m1 = m1 * m2  # The new modulus
 
     # At the end of the process x == a1 (mod m1) where a1 and m1 are the new/modified residual
     # and remainder.
@@ -112,18 +222,20 @@ def crt(remainders: np.ndarray, moduli: np.ndarray) -> int:  # pragma: no cover
 
 
 def set_helper_globals(field: Type[Array]):
-    global DTYPE, INT_TO_VECTOR, VECTOR_TO_INT, EGCD, CRT
+    global DTYPE, INT_TO_VECTOR, VECTOR_TO_INT, EGCD, MULTIPLY_MODULAR_SAFE, CRT
     if field.ufunc_mode != "python-calculate":
         DTYPE = np.int64
         INT_TO_VECTOR = int_to_vector
         VECTOR_TO_INT = vector_to_int
         EGCD = egcd
+        MULTIPLY_MODULAR_SAFE = multiply_modular_safe
         CRT = crt
     else:
         DTYPE = np.object_
         INT_TO_VECTOR = int_to_vector.py_func
         VECTOR_TO_INT = vector_to_int.py_func
         EGCD = egcd.py_func
+        MULTIPLY_MODULAR_SAFE = multiply_modular_safe.py_func
         CRT = crt.py_func
 
 
@@ -143,9 +255,10 @@ class add_modular(_lookup.add_ufunc):
 
     @staticmethod
     def calculate(a: int, b: int) -> int:
-        c = a + b
-        if c >= CHARACTERISTIC:
-            c -= CHARACTERISTIC
+        # Compute a + b - p without overflowing int64 for p up to 2^63
+        c = a - (CHARACTERISTIC - b)
+        if c < 0:
+            c += CHARACTERISTIC
         return c
 
 
@@ -155,8 +268,9 @@ class add_vector(_lookup.add_ufunc):
     """
 
     def __call__(self, ufunc, method, inputs, kwargs, meta):
-        if self.field.ufunc_mode == "jit-lookup" or method != "__call__":
-            # Use the lookup ufunc on each array entry
+        if self.field.ufunc_mode in ["jit-lookup", "jit-table"] or method != "__call__" or "out" in kwargs:
+            # Use the lookup ufunc on each array entry. The output arrays are written in-place, so they are not
+            # converted to vector representation.
             return super().__call__(ufunc, method, inputs, kwargs, meta)
 
         # Convert entire array to polynomial/vector representation, perform array operation in GF(p), and convert
@@ -167,6 +281,13 @@ class add_vector(_lookup.add_ufunc):
         output = self._convert_output_from_vector(output, meta["dtype"])
         return output
 
+    @property
+    def fast_ufunc(self):
+        if self.field.ufunc_mode not in ["jit-lookup", "jit-table"]:
+            # Converting the entire array to vector representation is more efficient than converting each element
+            return None
+        return super().fast_ufunc
+
     def set_calculate_globals(self):
         global CHARACTERISTIC, DEGREE
         CHARACTERISTIC = self.field.characteristic
@@ -207,8 +328,9 @@ class negative_vector(_lookup.negative_ufunc):
     """
 
     def __call__(self, ufunc, method, inputs, kwargs, meta):
-        if self.field.ufunc_mode == "jit-lookup" or method != "__call__":
-            # Use the lookup ufunc on each array entry
+        if self.field.ufunc_mode in ["jit-lookup", "jit-table"] or method != "__call__" or "out" in kwargs:
+            # Use the lookup ufunc on each array entry. The output arrays are written in-place, so they are not
+            # converted to vector representation.
             return super().__call__(ufunc, method, inputs, kwargs, meta)
 
         # Convert entire array to polynomial/vector representation, perform array operation in GF(p), and convert
@@ -245,10 +367,9 @@ class subtract_modular(_lookup.subtract_ufunc):
 
     @staticmethod
     def calculate(a: int, b: int) -> int:
-        if a >= b:
-            c = a - b
-        else:
-            c = CHARACTERISTIC + a - b
+        c = a - b
+        if c < 0:
+            c += CHARACTERISTIC
 
         return c
 
@@ -259,8 +380,9 @@ class subtract_vector(_lookup.subtract_ufunc):
     """
 
     def __call__(self, ufunc, method, inputs, kwargs, meta):
-        if self.field.ufunc_mode == "jit-lookup" or method != "__call__":
-            # Use the lookup ufunc on each array entry
+        if self.field.ufunc_mode in ["jit-lookup", "jit-table"] or method != "__call__" or "out" in kwargs:
+            # Use the lookup ufunc on each array entry. The output arrays are written in-place, so they are not
+            # converted to vector representation.
             return super().__call__(ufunc, method, inputs, kwargs, meta)
 
         # Convert entire array to polynomial/vector representation, perform array operation in GF(p), and convert
@@ -271,6 +393,13 @@ class subtract_vector(_lookup.subtract_ufunc):
         output = self._convert_output_from_vector(output, meta["dtype"])
         return output
 
+    @property
+    def fast_ufunc(self):
+        if self.field.ufunc_mode not in ["jit-lookup", "jit-table"]:
+            # Converting the entire array to vector representation is more efficient than converting each element
+            return None
+        return super().fast_ufunc
+
     def set_calculate_globals(self):
         global CHARACTERISTIC, DEGREE
         CHARACTERISTIC = self.field.characteristic
@@ -325,6 +454,58 @@ class multiply_binary(_lookup.multiply_ufunc):
 
         return c
 
+    def set_split_table_globals(self):
+        global DEGREE, MASK, REDUCTION_POLY, REDUCTION_TABLE
+        DEGREE = self.field.degree
+        MASK = self.field.order - 1
+        REDUCTION_POLY = self.field._irreducible_poly_int ^ self.field.order  # x^m % p(x) = p(x) - x^m
+
+        # REDUCTION_TABLE[i] = (i(x) * x^m) % p(x) for each 4-bit polynomial i(x)
+        REDUCTION_TABLE = np.zeros(16, dtype=np.int64)
+        for i in range(16):
+            c = i << DEGREE
+            for j in range(DEGREE + 3, DEGREE - 1, -1):
+                if (c >> j) & 0b1:
+                    c ^= self.field._irreducible_poly_int << (j - DEGREE)
+            REDUCTION_TABLE[i] = c
+
+    @staticmethod
+    def split_table(a: int, b: int) -> int:  # pragma: no cover
+        """
+        Algorithm:
+            The products (a(x) * i(x)) % p(x) for each 4-bit polynomial i(x) are tabulated on the stack. Then,
+            b(x) = b_k(x) * x^(4k) + ... + b_1(x) * x^4 + b_0(x) is multiplied 4 bits at a time using Horner's method.
+
+            c(x) = (...((a(x) * b_k(x)) * x^4 + a(x) * b_(k-1)(x)) * x^4 + ... + a(x) * b_0(x)) % p(x)
+
+            Each multiplication by x^4 shifts the top 4 bits of c(x) out of the field, and they are reduced
+            modulo p(x) with a single lookup in REDUCTION_TABLE.
+        """
+        # Compute x^i * a(x) % p(x) for i = 1, 2, 3, without overflowing int64 for m = 63
+        a1 = a
+        a2 = ((a1 & (MASK >> 1)) << 1) ^ (REDUCTION_POLY & -(a1 >> (DEGREE - 1)))
+        a4 = ((a2 & (MASK >> 1)) << 1) ^ (REDUCTION_POLY & -(a2 >> (DEGREE - 1)))
+        a8 = ((a4 & (MASK >> 1)) << 1) ^ (REDUCTION_POLY & -(a4 >> (DEGREE - 1)))
+
+        table = numba.carray(stack_empty(16), 16)
+        table[0] = 0
+        table[1] = a1
+        table[2] = a2
+        table[3] = a2 ^ a1
+        table[4] = a4
+        table[5] = a4 ^ a1
+        table[6] = a4 ^ a2
+        table[7] = a4 ^ a2 ^ a1
+        for i in range(8):
+            table[8 + i] = table[i] ^ a8
+
+        c = 0
+        for i in range(((DEGREE - 1) // 4) * 4, -4, -4):
+            c = ((c & (MASK >> 4)) << 4) ^ REDUCTION_TABLE[c >> (DEGREE - 4)]  # Compute c(x) * x^4 % p(x)
+            c ^= table[(b >> i) & 0xF]  # Add a(x) * b_i(x)
+
+        return c
+
 
 class multiply_modular(_lookup.multiply_ufunc):
     """
@@ -342,6 +523,50 @@ class multiply_modular(_lookup.multiply_ufunc):
         return c
 
 
+class multiply_montgomery(multiply_modular):
+    """
+    A ufunc dispatcher that provides multiplication modulo a characteristic whose products overflow int64.
+
+    Algorithm:
+        R = 2^64
+        a * b = c
+              = REDC(REDC(a * b) * (R^2 % p))
+              = ((a * b * R^-1) * R^2 * R^-1) % p
+
+        The 128-bit products are computed with a widening multiplication and reduced with Montgomery reduction,
+        REDC(T) = T * R^-1 % p. The elements are stored in their standard representation, so a second reduction
+        removes the factor R^-1. The pure-Python ufunc computes with Python integers and inherits `calculate()`.
+    """
+
+    def _jit_implementation(self, mode: str) -> Callable:
+        if mode == "jit-calculate":
+            self.set_montgomery_globals()
+            return self.montgomery
+        return super()._jit_implementation(mode)
+
+    def set_montgomery_globals(self):
+        global CHARACTERISTIC, CHARACTERISTIC_INV, R2
+        p = self.field.characteristic
+        CHARACTERISTIC = p
+
+        # Compute p^-1 % 2^64 with Newton's method, each iteration doubles the number of correct low bits
+        p_inv = p
+        for _ in range(5):
+            p_inv = p_inv * (2 - p * p_inv) % 2**64
+        CHARACTERISTIC_INV = p_inv - 2**64 if p_inv >= 2**63 else p_inv  # Store as a signed int64
+
+        R2 = 2**128 % p
+
+    @staticmethod
+    def montgomery(a: int, b: int) -> int:  # pragma: no cover
+        hi, lo = multiply_wide(a, b)
+        c = montgomery_reduce(hi, lo, CHARACTERISTIC, CHARACTERISTIC_INV)  # a * b * R^-1 % p
+        hi, lo = multiply_wide(c, R2)
+        c = montgomery_reduce(hi, lo, CHARACTERISTIC, CHARACTERISTIC_INV)  # a * b % p
+
+        return c
+
+
 class multiply_vector(_lookup.multiply_ufunc):
     """
     A ufunc dispatcher that provides multiplication for extensions.
@@ -385,7 +610,110 @@ class multiply_vector(_lookup.multiply_ufunc):
         return c
 
 
-class reciprocal_modular_egcd(_lookup.reciprocal_ufunc):
+class reciprocal_batch_jit(Function):
+    """
+    Computes the multiplicative inverses of a 1-D array simultaneously using Montgomery's trick.
+
+    Algorithm:
+        1. Compute the prefix products P_i = a_0 * ... * a_(i-1)
+        2. Compute (P_n)^-1 with one inversion
+        3. For i = n - 1, ..., 0, compute a_i^-1 = (P_(i+1))^-1 * P_i and (P_i)^-1 = (P_(i+1))^-1 * a_i
+
+    This is 3 multiplications per element and one inversion, rather than one inversion per element. The array is
+    processed in blocks, with one inversion each, so that the prefix products of a block remain in cache.
+    """
+
+    def __call__(self, a: np.ndarray) -> np.ndarray:
+        if np.count_nonzero(a == 0) > 0:
+            raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
+
+        if self.field.ufunc_mode == "python-calculate":
+            return self._python_reciprocal(a)
+
+        return self.jit(a.astype(np.int64))
+
+    def _python_reciprocal(self, a: np.ndarray) -> np.ndarray:
+        """
+        Computes the inverses with the pure-Python ufuncs. The prefix and suffix products are computed with vectorized
+        accumulations, and a_i^-1 = (a_0 * ... * a_(n-1))^-1 * (a_0 * ... * a_(i-1)) * (a_(i+1) * ... * a_(n-1)).
+        """
+        # NOTE: The pure-Python ufuncs set their globals when accessed, so they must be accessed before each use
+        prefix = self.field._multiply.python_calculate.accumulate(a)
+        suffix = self.field._multiply.python_calculate.accumulate(a[::-1])[::-1]
+        product_inv = self.field._reciprocal.python_calculate(prefix[-1])
+
+        prefix = np.concatenate(([1], prefix[:-1])).astype(np.object_)
+        suffix = np.concatenate((suffix[1:], [1])).astype(np.object_)
+        b = self.field._multiply.python_calculate(prefix, suffix)
+        b = self.field._multiply.python_calculate(b, product_inv)
+
+        return b
+
+    def set_globals(self):
+        global BLOCK_SIZE, MULTIPLY, RECIPROCAL
+        BLOCK_SIZE = 1024
+        MULTIPLY = self.field._multiply.jit_kernel
+        RECIPROCAL = self.field._reciprocal.jit_kernel
+
+    _SIGNATURE = numba.types.FunctionType(numba.int64[::1](numba.int64[::1]))
+
+    @staticmethod
+    def implementation(a):  # pragma: no cover
+        N = a.size
+        b = np.empty(N, dtype=np.int64)
+
+        for k in numba.prange((N + BLOCK_SIZE - 1) // BLOCK_SIZE):  # pylint: disable=not-an-iterable
+            start = k * BLOCK_SIZE
+            stop = min(start + BLOCK_SIZE, N)
+
+            # Store the prefix products of the block in the output
+            product = 1
+            for i in range(start, stop):
+                b[i] = product
+                product = MULTIPLY(product, a[i])
+
+            # Back-substitute the inverse of the block's product
+            product_inv = RECIPROCAL(product)
+            for i in range(stop - 1, start - 1, -1):
+                b[i] = MULTIPLY(product_inv, b[i])
+                product_inv = MULTIPLY(product_inv, a[i])
+
+        return b
+
+
+class reciprocal_batch_parallel_jit(reciprocal_batch_jit):
+    """
+    Computes the multiplicative inverses of a 1-D array simultaneously using Montgomery's trick, with the blocks
+    processed in parallel.
+    """
+
+    _PARALLEL = True
+
+
+class BatchReciprocalMixin:
+    """
+    A mixin for the multiplicative inverse ufunc dispatchers that explicitly calculate each inverse. When invoked with
+    `__call__()` on an array, the inverses are computed simultaneously using Montgomery's trick, see
+    `reciprocal_batch_jit`. This is also used by division, which multiplies by the reciprocal of the denominator.
+    """
+
+    _BATCH_THRESHOLD = 2**5  # The minimum array size at which the inverses are computed simultaneously
+
+    def ufunc_for(self, method: str, inputs: tuple) -> Callable:
+        if (
+            method == "__call__"
+            and (self.field.ufunc_mode == "python-calculate" or self._jit_mode in ["jit-calculate", "jit-split-table"])
+            and np.size(inputs[0]) >= self._BATCH_THRESHOLD
+        ):
+            if self.field._ufunc_parallel and np.size(inputs[0]) >= self._PARALLEL_THRESHOLD:
+                function = reciprocal_batch_parallel_jit(self.field)
+            else:
+                function = reciprocal_batch_jit(self.field)
+            return _ufunc.function_ufunc(function, super().ufunc_for(method, inputs))
+        return super().ufunc_for(method, inputs)
+
+
+class reciprocal_modular_egcd(BatchReciprocalMixin, _lookup.reciprocal_ufunc):
     """
     A ufunc dispatcher that provides the multiplicative inverse modulo the characteristic.
     """
@@ -446,7 +774,7 @@ class reciprocal_modular_egcd(_lookup.reciprocal_ufunc):
 #         return POSITIVE_POWER(a, ORDER - 2)
 
 
-class reciprocal_itoh_tsujii(_lookup.reciprocal_ufunc):
+class reciprocal_itoh_tsujii(BatchReciprocalMixin, _lookup.reciprocal_ufunc):
     """
     A ufunc dispatcher that provides the multiplicative inverse using the Itoh-Tsujii inversion algorithm.
 
@@ -594,6 +922,86 @@ class power_square_and_multiply(_lookup.power_ufunc):
         return c
 
 
+class LimbsMixin:
+    """
+    A mixin for the ufunc dispatchers of GF(2^m) fields whose elements are Python integers. The pure-Python ufunc
+    computes each element with Python integers. Instead, when invoked with `__call__()`, the arrays are converted to
+    32-bit limbs and computed with a JIT-compiled function, see `_limbs.py`.
+    """
+
+    def ufunc_for(self, method: str, inputs: tuple) -> Callable:
+        if method == "__call__" and self.field.ufunc_mode == "python-calculate":
+            return _ufunc.function_ufunc(self.limbs, self.python_calculate)
+        return super().ufunc_for(method, inputs)
+
+    def limbs(self, *inputs: np.ndarray) -> np.ndarray:
+        """
+        Computes the 1-D arrays of Python integers using limb arithmetic.
+        """
+        raise NotImplementedError
+
+    def _power_limbs(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Computes a ** b for exponents in [0, order).
+        """
+        n = _limbs.n_limbs(self.field.degree)
+        c = _limbs.power(
+            _limbs.to_limbs(a, n), _limbs.to_limbs(b, n), self.field.degree, _limbs.reduction_table(self.field)
+        )
+        return _limbs.from_limbs(c)
+
+
+class multiply_binary_limbs(LimbsMixin, multiply_binary):
+    """
+    A ufunc dispatcher that provides multiplication modulo 2 using limb arithmetic for large fields.
+    """
+
+    def limbs(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        n = _limbs.n_limbs(self.field.degree)
+        c = _limbs.multiply(
+            _limbs.to_limbs(a, n), _limbs.to_limbs(b, n), self.field.degree, _limbs.reduction_table(self.field)
+        )
+        return _limbs.from_limbs(c)
+
+
+class reciprocal_binary_limbs(LimbsMixin, reciprocal_itoh_tsujii):
+    """
+    A ufunc dispatcher that provides the multiplicative inverse using limb arithmetic for large fields.
+
+    Algorithm:
+        a^-1 = a^(2^m - 2), computed for all elements simultaneously using Montgomery's trick
+    """
+
+    def limbs(self, a: np.ndarray) -> np.ndarray:
+        if np.count_nonzero(a == 0) > 0:
+            raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
+
+        n = _limbs.n_limbs(self.field.degree)
+        b = _limbs.reciprocal(_limbs.to_limbs(a, n), self.field.degree, _limbs.reduction_table(self.field))
+        return _limbs.from_limbs(b)
+
+
+class power_binary_limbs(LimbsMixin, power_square_and_multiply):
+    """
+    A ufunc dispatcher that provides exponentiation using limb arithmetic for large fields.
+
+    Algorithm:
+        a^b = a^(b % (2^m - 1)), for a != 0
+    """
+
+    def limbs(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        b = b.astype(np.object_)
+        if np.count_nonzero((a == 0) & (b < 0)) > 0:
+            raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
+
+        # Reduce the exponents modulo the order of the multiplicative group. Positive multiples of the order reduce to
+        # the order itself, not 0, so that 0^b = 0.
+        e = b % (self.field.order - 1)
+        e[(e == 0) & (b > 0)] = self.field.order - 1
+
+        return self._power_limbs(a, e)
+
+
 class log_brute_force(_lookup.log_ufunc):
     """
     A ufunc dispatcher that provides logarithm calculation using a brute-force search.
@@ -688,7 +1096,7 @@ class log_pollard_rho(_lookup.log_ufunc):
                 if r != 0:
                     d, r_inv = EGCD(r, n)[0:2]
                     assert d == 1
-                    return (r_inv * (a2i - ai)) % n
+                    return MULTIPLY_MODULAR_SAFE(r_inv % n, (a2i - ai) % n, n)
 
                 # Re-try with different x0, a0, and b0
                 a0 += 1
@@ -699,18 +1107,230 @@ class log_pollard_rho(_lookup.log_ufunc):
                 x2i, a2i, b2i = xi, ai, bi
 
 
+class log_baby_step_giant_step_jit(Function):
+    """
+    Computes the discrete logarithms of a 1-D array of elements to the same base using the Pohlig-Hellman algorithm.
+    The logarithm in each subgroup of prime order q is found with the baby-step giant-step algorithm, using the
+    baby-step tables that were precomputed for the base, see `log_pohlig_hellman.baby_step_tables()`.
+
+    Algorithm:
+        1. The baby-step table of the subgroup stores alpha_bar^j -> j for j = 0, ..., s - 1, with
+           alpha_bar = alpha^(n/q)
+        2. Starting with y = beta_bar, look up y and compute y = y * alpha_bar^-s until y = alpha_bar^j is found
+        3. After g giant steps, log(beta_bar) = g * s + j
+
+    Each table is a hash table with a power-of-2 number of buckets. The keys of bucket k are
+    `keys[starts[k]:starts[k + 1]]`, with k offset by the subgroup's first bucket.
+    """
+
+    def __call__(self, beta: np.ndarray, tables: tuple) -> np.ndarray:
+        if np.count_nonzero(beta == 0) > 0:
+            raise ArithmeticError("Cannot compute the discrete logarithm of 0 in a Galois field.")
+
+        if self.field.ufunc_mode == "python-calculate":
+            return self.python(beta, *tables)
+
+        return self.jit(beta.astype(np.int64), *tables)
+
+    def set_globals(self):
+        global ORDER, FACTORS, MULTIPLICITIES, MULTIPLY, POWER
+        ORDER = self.field.order
+        if self.field.ufunc_mode == "python-calculate":
+            MULTIPLY = self.field._multiply.python_calculate
+            POWER = self.field._power.python_calculate
+        else:
+            MULTIPLY = self.field._multiply.jit_kernel
+            POWER = self.field._power.jit_kernel
+        FACTORS, MULTIPLICITIES = factors(self.field.order - 1)
+        set_helper_globals(self.field)
+        FACTORS = np.array(FACTORS, dtype=DTYPE)
+        MULTIPLICITIES = np.array(MULTIPLICITIES, dtype=DTYPE)
+
+    _SIGNATURE = numba.types.FunctionType(
+        numba.int64[:](
+            numba.int64[:],
+            numba.int64[:],
+            numba.int64[:],
+            numba.int64[:],
+            numba.int64[:],
+            numba.int64[:],
+            numba.int64[:],
+            numba.int64[:],
+            numba.int64[:],
+        )
+    )
+
+    @staticmethod
+    def implementation(beta, alpha_invs, giants, steps, masks, offsets, starts, keys, values):  # pragma: no cover
+        """
+        beta is a 1-D array of elements of GF(p^m)
+        alpha is a primitive element of GF(p^m), with alpha_invs[i] = alpha^-(n/qi^ei)
+        The n = q1^e1 * ... * qr^er prime factorization is required
+        Compute x = log_alpha(beta) for each element
+
+        Algorithm 3.63 from https://cacr.uwaterloo.ca/hac/about/chap3.pdf
+        """
+        r = FACTORS.size
+        n = ORDER - 1  # Order of the multiplicative group of GF(p^m)
+
+        logs = np.zeros(beta.size, dtype=DTYPE)
+        x = np.zeros(r, dtype=DTYPE)
+        m = np.zeros(r, dtype=DTYPE)
+        for k in range(beta.size):
+            for i in range(r):
+                q = FACTORS[i]
+                e = MULTIPLICITIES[i]
+                m[i] = q**e
+                x[i] = 0
+                b = POWER(beta[k], n // m[i])  # In the subgroup of order q^e, generated by alpha^(n/q^e)
+                gamma_inv = 1  # The inverse of alpha^(n/q^e)^x[i]
+                q_j = 1  # Starts as q^0
+                for j in range(e):
+                    beta_bar = POWER(MULTIPLY(b, gamma_inv), m[i] // (q_j * q))
+
+                    # Find l = log(beta_bar) in the subgroup of order q with giant steps
+                    l = -1
+                    y = beta_bar
+                    for g in range(0, q, steps[i]):
+                        bucket = offsets[i] + (y & masks[i])
+                        for t in range(starts[bucket], starts[bucket + 1]):
+                            if keys[t] == y:
+                                l = g + values[t]
+                                break
+                        if l >= 0:
+                            break
+                        y = MULTIPLY(y, giants[i])
+                    if l < 0:
+                        raise ArithmeticError(
+                            "The specified logarithm base is not a primitive element of the Galois field."
+                        )
+
+                    x[i] += l * q_j
+                    gamma_inv = MULTIPLY(gamma_inv, POWER(alpha_invs[i], l * q_j))
+                    q_j *= q
+
+            logs[k] = CRT(x, m)
+
+        return logs
+
+
 class log_pohlig_hellman(_lookup.log_ufunc):
     """
     A ufunc dispatcher that provides logarithm calculation using the Pohlig-Hellman algorithm.
+
+    When invoked with `__call__()` on arrays, the logarithms to each base are resolved together using baby-step tables,
+    see `log_baby_step_giant_step_jit`. The tables are computed once per base and cached, up to a memory budget.
     """
 
+    _TABLES_BYTES = 2**24  # The memory budget of the cached baby-step tables
+
+    def __init__(self, field: Type[Array], override=None, always_calculate=False):
+        super().__init__(field, override=override, always_calculate=always_calculate)
+        self._tables = {}  # The baby-step tables of each base, ordered from least to most recently used
+
+    def ufunc_for(self, method: str, inputs: tuple) -> Callable:
+        if method == "__call__" and self._jit_mode != "jit-lookup":
+            return self.calculate_ufunc
+        return super().ufunc_for(method, inputs)
+
+    @property
+    def calculate_ufunc(self) -> Callable:
+        if self.field.ufunc_mode == "python-calculate":
+            return _ufunc.function_ufunc(self._baby_step_giant_step, self.python_calculate)
+        return _ufunc.function_ufunc(self._baby_step_giant_step, self.jit_calculate)
+
+    def _baby_step_giant_step(self, beta: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+        """
+        Computes the logarithms of a 1-D array of elements to a 1-D array of bases.
+        """
+        function = log_baby_step_giant_step_jit(self.field)
+        bases = np.unique(alpha)
+        if bases.size == 1:
+            return function(beta, self.baby_step_tables(int(bases[0])))
+
+        logs = np.empty(beta.size, dtype=np.object_ if self.field.ufunc_mode == "python-calculate" else np.int64)
+        for base in bases:
+            idxs = np.nonzero(alpha == base)[0]
+            logs[idxs] = function(beta[idxs], self.baby_step_tables(int(base)))
+
+        return logs
+
+    def baby_step_tables(self, alpha: int) -> tuple:
+        """
+        Returns the baby-step tables of the base alpha, see `log_baby_step_giant_step_jit`. The cached tables of the
+        least recently used bases are evicted once the tables exceed the memory budget.
+        """
+        if alpha in self._tables:
+            self._tables[alpha] = self._tables.pop(alpha)  # Mark the base as the most recently used
+            return self._tables[alpha]
+
+        field = self.field
+        n = field.order - 1
+        primes, multiplicities = factors(n)
+        dtype = np.object_ if field.ufunc_mode == "python-calculate" else np.int64
+
+        if alpha == 0:
+            raise ArithmeticError("The specified logarithm base is not a primitive element of the Galois field.")
+        alpha = field(alpha)
+
+        # Each baby step stores a key, a value, and about one bucket start. More giant steps are taken instead of
+        # exceeding the memory budget.
+        max_steps = max(self._TABLES_BYTES // (3 * 8 * len(primes)), 1)
+
+        alpha_invs, giants, steps, masks, offsets, starts, keys, values = [], [], [], [], [], [], [], []
+        n_keys = 0
+        n_buckets = 0
+        for q, e in zip(primes, multiplicities):
+            alpha_bar = alpha ** (n // q)
+            if alpha_bar == 1:
+                raise ArithmeticError("The specified logarithm base is not a primitive element of the Galois field.")
+
+            s = min(math.isqrt(q - 1) + 1, max_steps)
+            baby = field.Ones(s)
+            baby[1:] = alpha_bar
+            baby = np.multiply.accumulate(baby).view(np.ndarray).astype(dtype)  # alpha_bar^j for j = 0, ..., s - 1
+
+            size = 1 << (s - 1).bit_length()
+            buckets = (baby & (size - 1)).astype(np.int64)
+            order = np.argsort(buckets, kind="stable")
+            counts = np.bincount(buckets, minlength=size)
+
+            alpha_invs.append(int(alpha ** -(n // q**e)))
+            giants.append(int(alpha_bar ** (-s)))
+            steps.append(s)
+            masks.append(size - 1)
+            offsets.append(n_buckets)
+            starts.append(n_keys + np.concatenate(([0], np.cumsum(counts[:-1]))))
+            keys.append(baby[order])
+            values.append(order)
+            n_keys += s
+            n_buckets += size
+        starts.append([n_keys])
+
+        tables = (
+            np.array(alpha_invs, dtype=dtype),
+            np.array(giants, dtype=dtype),
+            np.array(steps, dtype=dtype),
+            np.array(masks, dtype=dtype),
+            np.array(offsets, dtype=np.int64),
+            np.concatenate(starts).astype(np.int64),
+            np.concatenate(keys).astype(dtype),
+            np.concatenate(values).astype(dtype),
+        )
+
+        self._tables[int(alpha)] = tables
+        while len(self._tables) > 1 and sum(_tables_nbytes(t) for t in self._tables.values()) > self._TABLES_BYTES:
+            self._tables.pop(next(iter(self._tables)))
+
+        return tables
+
     def set_calculate_globals(self):
         global ORDER, MULTIPLY, RECIPROCAL, POWER, BRUTE_FORCE_LOG, FACTORS, MULTIPLICITIES
         ORDER = self.field.order
         MULTIPLY = self.field._multiply.ufunc
         RECIPROCAL = self.field._reciprocal.ufunc
         POWER = self.field._power.ufunc
-        if self.field.ufunc_mode in ["jit-lookup", "jit-calculate"]:
+        if self.field.ufunc_mode in ["jit-lookup", "jit-calculate", "jit-split-table", "jit-table"]:
             # We can never use the lookup table version of log because it has a fixed base
             BRUTE_FORCE_LOG = log_brute_force(self.field).jit_calculate
         else:
@@ -757,6 +1377,205 @@ class log_pohlig_hellman(_lookup.log_ufunc):
         return CRT(x, m)
 
 
+def _tables_nbytes(tables: tuple) -> int:
+    return sum(table.nbytes for table in tables if isinstance(table, np.ndarray))
+
+
+class multiplicative_order_jit(Function):
+    """
+    Computes the multiplicative orders of a 1-D array of nonzero elements from the prime factorization of the order of
+    the multiplicative group, n = q1^e1 * ... * qr^er.
+
+    Algorithm:
+        1. Start with the order k = n, which is a multiple of the element's order
+        2. For each prime q with multiplicity e, divide k by q^e and compute y = x^k
+        3. Multiply k by q until y = 1, computing y = y^q each time
+
+    This is O(e1 + ... + er) exponentiations per element, rather than one exponentiation per divisor of n.
+    """
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        if self.field.order == 2:
+            # The multiplicative group is trivial, so n = 1 has no prime factorization
+            return np.ones(x.size, dtype=np.int64)
+
+        if self.field.ufunc_mode == "python-calculate":
+            return self._python_order(x)
+
+        return self.jit(x.astype(np.int64))
+
+    def _python_order(self, x: np.ndarray) -> np.ndarray:
+        """
+        Computes the orders with the field's array arithmetic, reducing all the elements' orders together.
+        """
+        x = self.field._view(x)
+        order = np.full(x.size, self.field.order - 1, dtype=np.object_)
+        for q, e in zip(*factors(self.field.order - 1)):
+            order //= q**e
+            y = x**order
+            idxs = np.nonzero(y != 1)[0]
+            while idxs.size > 0:
+                y[idxs] = y[idxs] ** q
+                order[idxs] *= q
+                idxs = idxs[y[idxs] != 1]
+
+        return order
+
+    def set_globals(self):
+        global ORDER, FACTORS, MULTIPLICITIES, POWER
+        ORDER = self.field.order
+        POWER = self.field._power.jit_kernel
+        FACTORS, MULTIPLICITIES = factors(self.field.order - 1)
+        FACTORS = np.array(FACTORS, dtype=np.int64)
+        MULTIPLICITIES = np.array(MULTIPLICITIES, dtype=np.int64)
+
+    _SIGNATURE = numba.types.FunctionType(numba.int64[:](numba.int64[:]))
+
+    @staticmethod
+    def implementation(x):  # pragma: no cover
+        orders = np.empty(x.size, dtype=np.int64)
+
+        for k in range(x.size):
+            order = ORDER - 1
+            for i in range(FACTORS.size):
+                q = FACTORS[i]
+                order //= q ** MULTIPLICITIES[i]
+                y = POWER(x[k], order)
+                while y != 1:
+                    y = POWER(y, q)
+                    order *= q
+            orders[k] = order
+
+        return orders
+
+
+class conjugates_jit(Function):
+    """
+    Computes the Galois conjugates x, x^p, ..., x^(p^(m-1)) of a 1-D array of elements, returned as an (N, m) array.
+
+    Algorithm:
+        1. Start with y = x
+        2. Apply the Frobenius map y = y^p, m - 1 times. In characteristic 2, this is a single squaring.
+
+    This is m - 1 small exponentiations per element, rather than m exponentiations to exponents as large as p^(m-1).
+    """
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        if self.field.ufunc_mode == "python-calculate":
+            return self._python_conjugates(x)
+
+        return self.jit(x.astype(np.int64))
+
+    def _python_conjugates(self, x: np.ndarray) -> np.ndarray:
+        """
+        Computes the conjugates with the field's array arithmetic, applying the Frobenius map to all elements together.
+        """
+        p = self.field.characteristic
+        y = self.field._view(x.astype(np.object_))
+        conjugates = np.empty((x.size, self.field.degree), dtype=np.object_)
+        conjugates[:, 0] = y
+        for i in range(1, self.field.degree):
+            y = y * y if p == 2 else y**p
+            conjugates[:, i] = y
+
+        return conjugates
+
+    def set_globals(self):
+        global CHARACTERISTIC, DEGREE, MULTIPLY, POWER
+        CHARACTERISTIC = self.field.characteristic
+        DEGREE = self.field.degree
+        MULTIPLY = self.field._multiply.jit_kernel
+        POWER = self.field._power.jit_kernel
+
+    _SIGNATURE = numba.types.FunctionType(numba.int64[:, :](numba.int64[:]))
+
+    @staticmethod
+    def implementation(x):  # pragma: no cover
+        conjugates = np.empty((x.size, DEGREE), dtype=np.int64)
+
+        for k in range(x.size):
+            y = x[k]
+            conjugates[k, 0] = y
+            for i in range(1, DEGREE):
+                if CHARACTERISTIC == 2:
+                    y = MULTIPLY(y, y)
+                else:
+                    y = POWER(y, CHARACTERISTIC)
+                conjugates[k, i] = y
+
+        return conjugates
+
+
+class field_trace_jit(Function):
+    """
+    Computes the field traces Tr(x) = x + x^p + ... + x^(p^(m-1)) of a 1-D array of elements in GF(p^m).
+
+    The field trace is GF(p)-linear. So, with x = x_0 + x_1*t + ... + x_(m-1)*t^(m-1) in the polynomial basis,
+    Tr(x) = x_0*Tr(1) + x_1*Tr(t) + ... + x_(m-1)*Tr(t^(m-1)). The traces of the m basis elements are computed once
+    per field, and each element's trace is a dot product of its base-p digits with them. No field multiplications are
+    required.
+    """
+
+    _TRACES = {}  # A cache of each field's traces of the basis elements, see `basis_traces()`
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        if self.field.ufunc_mode == "python-calculate":
+            return self._python_trace(x)
+
+        return self.jit(x.astype(np.int64))
+
+    def basis_traces(self) -> np.ndarray:
+        """
+        Returns the traces Tr(t^i) of the polynomial basis elements, for i = 0, ..., m - 1.
+        """
+        if self.key_1 not in self._TRACES:
+            p, m = self.field.characteristic, self.field.degree
+            basis = np.array([p**i for i in range(m)], dtype=self.field.dtypes[-1])
+            conjugates = self.field._view(conjugates_jit(self.field)(basis).astype(basis.dtype))
+            self._TRACES[self.key_1] = np.add.reduce(conjugates, axis=-1).view(np.ndarray).astype(np.int64)
+
+        return self._TRACES[self.key_1]
+
+    def _python_trace(self, x: np.ndarray) -> np.ndarray:
+        """
+        Computes the traces from the base-p digits of all the elements together.
+        """
+        p = self.field.characteristic
+        traces = self.basis_traces()
+        x = x.astype(np.object_)
+        trace = np.zeros(x.size, dtype=np.object_)
+        for i in range(self.field.degree):
+            trace = (trace + (x % p) * int(traces[i])) % p
+            x //= p
+
+        return trace
+
+    def set_globals(self):
+        # NOTE: The basis traces are computed with the field's ufuncs, which may set other globals of this module
+        traces = self.basis_traces()
+
+        global CHARACTERISTIC, DEGREE, TRACES
+        CHARACTERISTIC = self.field.characteristic
+        DEGREE = self.field.degree
+        TRACES = traces
+
+    _SIGNATURE = numba.types.FunctionType(numba.int64[:](numba.int64[:]))
+
+    @staticmethod
+    def implementation(x):  # pragma: no cover
+        traces = np.empty(x.size, dtype=np.int64)
+
+        for k in range(x.size):
+            a = x[k]
+            trace = 0
+            for i in range(DEGREE):
+                a, d = divmod(a, CHARACTERISTIC)
+                trace = (trace + d * TRACES[i]) % CHARACTERISTIC
+            traces[k] = trace
+
+        return traces
+
+
 class sqrt_binary(_lookup.sqrt_ufunc):
     """
     A ufunc dispatcher that provides the square root in binary extension fields.
@@ -769,65 +1588,118 @@ class sqrt_binary(_lookup.sqrt_ufunc):
         return a ** (self.field.characteristic ** (self.field.degree - 1))
 
 
-class sqrt(_lookup.sqrt_ufunc):
+class sqrt_tonelli_shanks_jit(Function):
     """
-    A ufunc dispatcher that provides square root using NumPy array arithmetic.
+    Computes the square roots of a 1-D array of elements in a field with odd characteristic using the Tonelli-Shanks
+    algorithm. The smaller of the two roots is returned for each square, and -1 for each non-square.
+
+    Algorithm:
+        1. Write q - 1 = 2^s * t, with t odd, and let c = z^t for a fixed non-square z
+        2. Start with r = a^((t + 1)/2) and b = a^t, so that r^2 = a * b
+        3. While b != 1, find the least i with b^(2^i) = 1. If i = s, then a is a non-square. Otherwise, let
+           e = c^(2^(s - i - 1)) and update r = r * e, c = e^2, b = b * e^2, and s = i
     """
 
-    def implementation(self, a: Array) -> Array:
-        """
-        Algorithm 3.34 from https://cacr.uwaterloo.ca/hac/about/chap3.pdf.
-        Algorithm 3.36 from https://cacr.uwaterloo.ca/hac/about/chap3.pdf.
-        """
-        if not np.all(a.is_square()):
-            raise ArithmeticError(
-                f"Input array has elements that are non-squares in {self.field.name}.\n{a[~a.is_square()]}"
-            )
+    _PARAMETERS = {}  # A cache of each field's (s, t, c), see `parameters()`
 
-        p = self.field.characteristic
+    def __call__(self, a: np.ndarray) -> np.ndarray:
+        if self.field.ufunc_mode == "python-calculate":
+            return self.python(a.astype(np.object_))
 
-        if p % 4 == 3:
-            roots = a ** ((self.field.order + 1) // 4)
+        return self.jit(a.astype(np.int64))
 
-        elif p % 8 == 5:
-            d = a ** ((self.field.order - 1) // 4)
-            roots = self.field.Zeros(a.shape)
+    def parameters(self) -> tuple:
+        """
+        Returns the 2-adic decomposition q - 1 = 2^s * t and c = z^t, where z is the smallest non-square.
+        """
+        if self.key_1 not in self._PARAMETERS:
+            field = self.field
+            t = field.order - 1
+            s = 0
+            while t % 2 == 0:
+                t //= 2
+                s += 1
 
-            idxs = np.where(d == 1)
-            roots[idxs] = a[idxs] ** ((self.field.order + 3) // 8)
+            z = 2
+            while field(z) ** ((field.order - 1) // 2) == 1:
+                z += 1
 
-            idxs = np.where(d == p - 1)
-            roots[idxs] = 2 * a[idxs] * (4 * a[idxs]) ** ((self.field.order - 5) // 8)
+            self._PARAMETERS[self.key_1] = (s, t, int(field(z) ** t))
 
+        return self._PARAMETERS[self.key_1]
+
+    def set_globals(self):
+        # NOTE: The parameters are computed with the field's ufuncs, which may set other globals of this module
+        s, t, c = self.parameters()
+        if self.field.ufunc_mode == "python-calculate":
+            multiply = self.field._multiply.python_calculate
+            negative = self.field._negative.python_calculate
+            power = self.field._power.python_calculate
         else:
-            # Find a non-square element `b`
-            while True:
-                b = self.field.Random(low=1)
-                if not b.is_square():
-                    break
-
-            # Write p - 1 = 2^s * t
-            n = self.field.order - 1
-            s = 0
-            while n % 2 == 0:
-                n >>= 1
-                s += 1
-            t = n
-            assert self.field.order - 1 == 2**s * t
+            multiply = self.field._multiply.jit_kernel
+            negative = self.field._negative.jit_kernel
+            power = self.field._power.jit_kernel
 
-            roots = self.field.Zeros(a.shape)  # Empty array of roots
+        global S, T, C, MULTIPLY, NEGATIVE, POWER
+        S, T, C = s, t, c
+        MULTIPLY, NEGATIVE, POWER = multiply, negative, power
+        set_helper_globals(self.field)
 
-            # Compute a root `r` for the non-zero elements
-            idxs = np.where(a > 0)  # Indices where a has a reciprocal
-            a_inv = np.reciprocal(a[idxs])
-            c = b**t
-            r = a[idxs] ** ((t + 1) // 2)
-            for i in range(1, s):
-                d = (r**2 * a_inv) ** (2 ** (s - i - 1))
-                r[np.where(d == p - 1)] *= c
-                c = c**2
-            roots[idxs] = r  # Assign non-zero roots to the original array
+    _SIGNATURE = numba.types.FunctionType(numba.int64[:](numba.int64[:]))
 
-        roots = self.field._view(np.minimum(roots, -roots))  # Return only the smaller root
+    @staticmethod
+    def implementation(a):  # pragma: no cover
+        roots = np.zeros(a.size, dtype=DTYPE)
+
+        for k in range(a.size):
+            if a[k] == 0:
+                continue
+
+            w = POWER(a[k], (T - 1) // 2)
+            r = MULTIPLY(w, a[k])  # a^((t + 1)/2)
+            b = MULTIPLY(w, r)  # a^t
+            c = C
+            m = S
+            while b != 1:
+                # Find the least i such that b^(2^i) = 1
+                i = 0
+                d = b
+                while d != 1 and i < m:
+                    d = MULTIPLY(d, d)
+                    i += 1
+                if i == m:
+                    break  # The element is a non-square
+
+                e = c
+                for _ in range(m - i - 1):
+                    e = MULTIPLY(e, e)
+                r = MULTIPLY(r, e)
+                c = MULTIPLY(e, e)
+                b = MULTIPLY(b, c)
+                m = i
+
+            if b != 1:
+                roots[k] = -1
+            else:
+                roots[k] = min(r, NEGATIVE(r))  # Return only the smaller root
 
         return roots
+
+
+class sqrt(_lookup.sqrt_ufunc):
+    """
+    A ufunc dispatcher that provides the square root in fields with odd characteristic, see
+    `sqrt_tonelli_shanks_jit`.
+    """
+
+    def implementation(self, a: Array) -> Array:
+        """
+        Algorithm 3.34 from https://cacr.uwaterloo.ca/hac/about/chap3.pdf.
+        """
+        roots = sqrt_tonelli_shanks_jit(self.field)(a.view(np.ndarray).ravel()).reshape(a.shape)
+        if np.any(roots < 0):
+            raise ArithmeticError(
+                f"Input array has elements that are non-squares in {self.field.name}.\n{a[roots < 0]}"
+            )
+
+        return self.field._view(roots.astype(a.dtype))
@@ -11,6 +11,9 @@ import numpy as np
 from numba import int64
 
 from .._helper import verify_isinstance
+from .._options import CACHEOPTIONS
+from . import _parametric
+from ._cache import cache_key, cacheable, ignore_uncacheable_warnings
 from ._meta import ArrayMeta
 
 if TYPE_CHECKING:
@@ -26,6 +29,7 @@ class Function:
     """
 
     _CACHE = {}  # A cache of compiled functions
+    _CACHE_PARAMETRIC = {}  # A cache of compiled field-parametric functions, shared by all fields
 
     def __init__(self, field: Type[Array]):
         self.field = field
@@ -46,12 +50,25 @@ class Function:
     _SIGNATURE: numba.types.FunctionType
     """The function's Numba signature."""
 
+    @property
+    def _signatures(self) -> list:
+        """
+        The Numba signatures to JIT compile. By default, this is only `_SIGNATURE`.
+        """
+        return [self._SIGNATURE.signature]
+
     _PARALLEL = False
     """Indicates if parallel processing should be performed."""
 
     implementation: Callable
     """The function's implementation in pure Python."""
 
+    parametric_implementation: Callable | None = None
+    """
+    The function's field-parametric implementation, if it has one. It accepts the same arguments as `implementation()`
+    followed by the `FIELD` tuple of field parameters and lookup tables, see `_parametric.field_tables()`.
+    """
+
     ###############################################################################
     # Various ufuncs based on implementation and compilation
     ###############################################################################
@@ -62,7 +79,7 @@ class Function:
 
     @property
     def key_2(self):
-        if self.field.ufunc_mode == "jit-lookup":
+        if self.field.ufunc_mode in ["jit-lookup", "jit-table"]:
             key = (str(self.__class__), self.field.ufunc_mode, int(self.field.primitive_element))
         else:
             key = (str(self.__class__), self.field.ufunc_mode)
@@ -82,16 +99,64 @@ class Function:
         """
         Returns a JIT-compiled function implemented over the given field.
         """
-        assert self.field.ufunc_mode in ["jit-lookup", "jit-calculate"]
+        assert self.field.ufunc_mode in ["jit-lookup", "jit-calculate", "jit-split-table", "jit-table"]
 
         self._CACHE.setdefault(self.key_1, {})
         if self.key_2 not in self._CACHE[self.key_1]:
             self.set_globals()  # Set the globals once before JIT compiling the function
-            func = numba.jit(self._SIGNATURE.signature, parallel=self._PARALLEL, nopython=True)(self.implementation)
+            implementation = self.implementation
+            if CACHEOPTIONS["jit"]:
+                # Give the implementation a name unique to this field so Numba's on-disk cache entries don't collide
+                key = cache_key(*self.key_1, int(self.field.primitive_element), *self.key_2)
+                implementation = cacheable(implementation, key)
+            with ignore_uncacheable_warnings():
+                func = numba.jit(
+                    self._signatures, parallel=self._PARALLEL, nopython=True, cache=CACHEOPTIONS["jit"]
+                )(implementation)
             self._CACHE[self.key_1][self.key_2] = func
 
         return self._CACHE[self.key_1][self.key_2]
 
+    @property
+    def parametric(self) -> bool:
+        """
+        Indicates whether the shared field-parametric JIT-compiled function should be invoked for this field.
+        """
+        return (
+            CACHEOPTIONS["parametric"]
+            and self.parametric_implementation is not None
+            and self.field.ufunc_mode in ["jit-lookup", "jit-table"]
+        )
+
+    @property
+    def jit_parametric(self) -> Callable:
+        """
+        Returns the field-parametric JIT-compiled function, which is compiled once and shared by all fields, bound to
+        the given field's parameters and lookup tables.
+        """
+        assert self.field.ufunc_mode in ["jit-lookup", "jit-table"]
+
+        key = str(self.__class__)
+        if key not in self._CACHE_PARAMETRIC:
+            with ignore_uncacheable_warnings():
+                self._CACHE_PARAMETRIC[key] = numba.jit(
+                    parallel=self._PARALLEL, nopython=True, cache=CACHEOPTIONS["jit"]
+                )(self.parametric_implementation)
+        func = self._CACHE_PARAMETRIC[key]
+        FIELD = _parametric.field_tables(self.field)
+
+        return lambda *args: func(*args, FIELD)
+
+    @property
+    def jit_call(self) -> Callable:
+        """
+        Returns the JIT-compiled function to invoke from Python. This is the shared field-parametric function, if
+        enabled and supported, otherwise the function compiled for the given field.
+        """
+        if self.parametric:
+            return self.jit_parametric
+        return self.jit
+
     @property
     def python(self) -> Callable:
         """
@@ -119,7 +184,7 @@ class convolve_jit(Function):
         dtype = a.dtype
 
         if self.field.ufunc_mode != "python-calculate":
-            c = self.jit(a.astype(np.int64), b.astype(np.int64))
+            c = self.jit_call(a.astype(np.int64), b.astype(np.int64))
             c = c.astype(dtype)
         else:
             c = self.python(a.view(np.ndarray), b.view(np.ndarray))
@@ -130,6 +195,9 @@ class convolve_jit(Function):
     def set_globals(self):
         global IS_PRIME_FIELD, CHARACTERISTIC, ADD, MULTIPLY
         IS_PRIME_FIELD = self.field._is_prime_field
+        if IS_PRIME_FIELD and self.field.ufunc_mode != "python-calculate":
+            # NumPy's integer convolution can't be used if the products of elements overflow int64
+            IS_PRIME_FIELD = (self.field.characteristic - 1) ** 2 <= np.iinfo(np.int64).max
         CHARACTERISTIC = self.field.characteristic
         ADD = self.field._add.ufunc_call_only
         MULTIPLY = self.field._multiply.ufunc_call_only
@@ -164,6 +232,25 @@ class convolve_jit(Function):
 
         return c
 
+    @staticmethod
+    def parametric_implementation(a, b, FIELD):  # pragma: no cover
+        CHARACTERISTIC, ORDER = FIELD[0], FIELD[1]
+
+        if ORDER == CHARACTERISTIC:
+            max_sum = np.iinfo(np.int64).max // (CHARACTERISTIC - 1) ** 2
+            if min(a.size, b.size) <= max_sum:
+                # Compute the result using native NumPy LAPACK/BLAS implementation since it is guaranteed to not
+                # overflow. Then reduce the result mod p.
+                return np.convolve(a, b) % CHARACTERISTIC
+
+        # Fall-back brute force method
+        c = np.zeros(a.size + b.size - 1, dtype=a.dtype)
+        for i in range(a.size):
+            for j in range(b.size - 1, -1, -1):
+                c[i + j] = _parametric.add(c[i + j], _parametric.multiply(a[i], b[j], FIELD), FIELD)
+
+        return c
+
 
 class fft_jit(Function):
     """
@@ -0,0 +1,200 @@
+"""
+A module that contains lazily-evaluated arithmetic expressions over Array objects. An expression records the arithmetic
+operations applied to it, rather than computing them. When evaluated, the expression tree is compiled into a single
+ufunc that computes every operation for each element in turn, so no temporary arrays are allocated for the
+intermediate results.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Type
+
+import numba
+import numpy as np
+
+from ._ufunc import UFunc
+
+if TYPE_CHECKING:
+    from ._array import Array
+
+# The ufunc dispatcher of each operation that may be recorded in an expression
+OPERATIONS = {
+    "add": "_add",
+    "subtract": "_subtract",
+    "multiply": "_multiply",
+    "divide": "_divide",
+    "negative": "_negative",
+    "power": "_power",
+}
+
+
+class Expression:
+    """
+    A lazily-evaluated arithmetic expression over arrays from the same field.
+
+    The leaves of the expression tree are arrays or integers, i.e. scalar multiplicands and exponents. The internal
+    nodes are arithmetic operations on their operands.
+    """
+
+    # Instruct NumPy to defer binary operators with Array objects, e.g. `x * expr`, to this class's reflected operators
+    __array_ufunc__ = None
+
+    _CACHE = {}  # A cache of compiled expression ufuncs
+
+    def __init__(self, field: Type[Array], operation: str | None, operands: tuple):
+        self.field = field
+        self.operation = operation  # The operation of an internal node, or `None` for a leaf
+        self.operands = operands  # The operand expressions of an internal node, or the value of a leaf
+
+    @classmethod
+    def _leaf(cls, field: Type[Array], value: Array | int) -> Expression:
+        return cls(field, None, (value,))
+
+    def _operand(self, other, operation: str) -> Expression:
+        """
+        Converts the other operand of a binary operation into an expression.
+        """
+        if isinstance(other, Expression) and other.field is self.field:
+            return other
+        if type(other) is self.field:
+            return Expression._leaf(self.field, other)
+        if operation == "multiply" and isinstance(other, (int, np.integer)):
+            # Scalar multiplication is repeated addition, which is multiplication by the integer modulo p
+            return Expression._leaf(self.field, int(other) % self.field.characteristic)
+        raise TypeError(
+            f"Operation {operation!r} requires both operands to be {self.field.name} arrays or expressions, "
+            f"not {type(other)}."
+        )
+
+    ###############################################################################
+    # Arithmetic operators
+    ###############################################################################
+
+    def __add__(self, other) -> Expression:
+        return Expression(self.field, "add", (self, self._operand(other, "add")))
+
+    def __radd__(self, other) -> Expression:
+        return Expression(self.field, "add", (self._operand(other, "add"), self))
+
+    def __sub__(self, other) -> Expression:
+        return Expression(self.field, "subtract", (self, self._operand(other, "subtract")))
+
+    def __rsub__(self, other) -> Expression:
+        return Expression(self.field, "subtract", (self._operand(other, "subtract"), self))
+
+    def __mul__(self, other) -> Expression:
+        return Expression(self.field, "multiply", (self, self._operand(other, "multiply")))
+
+    def __rmul__(self, other) -> Expression:
+        return Expression(self.field, "multiply", (self._operand(other, "multiply"), self))
+
+    def __truediv__(self, other) -> Expression:
+        return Expression(self.field, "divide", (self, self._operand(other, "divide")))
+
+    def __rtruediv__(self, other) -> Expression:
+        return Expression(self.field, "divide", (self._operand(other, "divide"), self))
+
+    __floordiv__ = __truediv__
+    __rfloordiv__ = __rtruediv__
+
+    def __neg__(self) -> Expression:
+        return Expression(self.field, "negative", (self,))
+
+    def __pos__(self) -> Expression:
+        return self
+
+    def __pow__(self, other) -> Expression:
+        if not isinstance(other, (int, np.integer)):
+            raise TypeError(f"Operation 'power' requires the exponent to be an integer, not {type(other)}.")
+        return Expression(self.field, "power", (self, Expression._leaf(self.field, int(other))))
+
+    def __repr__(self) -> str:
+        return f"Expression({self.field.name}, {self._source([])})"
+
+    ###############################################################################
+    # Evaluation
+    ###############################################################################
+
+    def evaluate(self) -> Array:
+        """
+        Evaluates the expression with a single fused ufunc and returns the resulting array.
+        """
+        if self.field.ufunc_mode == "python-calculate":
+            # The pure-Python ufuncs cannot be fused, so evaluate each operation in turn
+            return self._evaluate_eagerly()
+
+        leaves = []
+        source = self._source(leaves)
+        inputs = [leaf.view(np.ndarray) if isinstance(leaf, np.ndarray) else leaf for leaf in leaves]
+        arrays = [leaf for leaf in leaves if isinstance(leaf, np.ndarray)]
+        dtype = arrays[0].dtype if arrays else self.field.dtypes[0]
+        shape = np.broadcast_shapes(*[np.shape(x) for x in inputs])
+
+        parallel = self.field._ufunc_parallel and np.prod(shape) >= UFunc._PARALLEL_THRESHOLD
+        ufunc = self._compile(source, len(inputs), "parallel" if parallel else "cpu")
+
+        output = np.empty(shape, dtype=dtype)
+        ufunc(*inputs, out=output, casting="unsafe")
+
+        return self.field._view(output)
+
+    def _evaluate_eagerly(self) -> Array | int:
+        if self.operation is None:
+            return self.operands[0]
+        operands = [operand._evaluate_eagerly() for operand in self.operands]
+        return getattr(np, self.operation)(*operands)
+
+    def _source(self, leaves: list) -> str:
+        """
+        Returns the Python source of the expression, whose arguments `x0, x1, ...` are the leaves of the expression
+        tree. The unique leaves are appended to `leaves` in order of their arguments.
+        """
+        if self.operation is None:
+            value = self.operands[0]
+            for i, leaf in enumerate(leaves):
+                if leaf is value:
+                    return f"x{i}"
+            leaves.append(value)
+            return f"x{len(leaves) - 1}"
+
+        operands = ", ".join(operand._source(leaves) for operand in self.operands)
+        return f"{self.operation.upper()}({operands})"
+
+    def _compile(self, source: str, nargs: int, target: str) -> np.ufunc:
+        """
+        JIT compiles the expression into a ufunc. Each operation invokes the field's scalar arithmetic kernel, using
+        either lookup tables or explicit calculation based on the current state of `ufunc_mode`. As with the
+        arithmetic ufuncs, a loop over the field's smallest unsigned dtype is added, in which the inputs are converted
+        to int64 in registers.
+        """
+        field = self.field
+        key = (
+            field.characteristic,
+            field.degree,
+            int(field.irreducible_poly),
+            int(field.primitive_element),
+            field.ufunc_mode,
+            target,
+            source,
+        )
+
+        if key not in self._CACHE:
+            namespace = {"np": np}
+            for operation, dispatcher in OPERATIONS.items():
+                if operation.upper() in source:
+                    namespace[operation.upper()] = getattr(field, dispatcher).jit_kernel
+
+            args = ", ".join(f"x{i}" for i in range(nargs))
+            casts = ", ".join(f"np.int64(x{i})" for i in range(nargs))
+            code = f"def expression({args}):\n    {args}, = {casts},\n    return {source}\n"
+            exec(code, namespace)  # pylint: disable=exec-used
+
+            signatures = [f"int64({', '.join(['int64'] * nargs)})"]
+            dtype = np.dtype(field.dtypes[0])
+            if dtype in [np.uint8, np.uint16, np.uint32]:
+                # The narrow loop must be listed first so NumPy selects it for arrays of that dtype
+                signatures.insert(0, f"{dtype}({', '.join([dtype.name] * nargs)})")
+
+            ufunc = numba.vectorize(signatures, target=target, nopython=True)(namespace["expression"])
+            self._CACHE[key] = ufunc
+
+        return self._CACHE[key]
@@ -0,0 +1,214 @@
+"""
+A module containing JIT-compiled arithmetic for binary extension fields GF(2^m) whose elements are too large for NumPy
+integer data types. The arrays of Python integers are converted to arrays of fixed-width limbs, the arithmetic is
+computed on the limbs, and the result is converted back to Python integers.
+
+Each element is stored as `n` little-endian 32-bit limbs in an int64 array with shape `(..., n)`. There are at least 4
+bits of headroom above x^(m-1), so a(x) * x^4 may be computed before it is reduced modulo the irreducible polynomial.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Type
+
+import numba
+import numpy as np
+
+if TYPE_CHECKING:
+    from ._array import Array
+
+LIMB_BITS = 32
+LIMB_MASK = 2**LIMB_BITS - 1
+BLOCK_SIZE = 1024  # The number of elements inverted simultaneously with one inversion, see `reciprocal()`
+
+_REDUCTION_TABLES = {}  # A cache of each field's reduction table, see `reduction_table()`
+
+
+def n_limbs(degree: int) -> int:
+    """
+    Returns the number of limbs needed to store the elements of GF(2^m) with 4 bits of headroom.
+    """
+    return (degree + 4 + LIMB_BITS - 1) // LIMB_BITS
+
+
+def to_limbs(x: np.ndarray, n: int) -> np.ndarray:
+    """
+    Converts an array of integers to an int64 array of `n` limbs with shape `(*x.shape, n)`.
+    """
+    x = np.asarray(x, dtype=np.object_)
+    limbs = np.empty((*x.shape, n), dtype=np.int64)
+    for i in range(n):
+        limbs[..., i] = (x >> (LIMB_BITS * i)) & LIMB_MASK
+
+    return limbs
+
+
+def from_limbs(limbs: np.ndarray) -> np.ndarray:
+    """
+    Converts an int64 array of limbs to an array of Python integers with shape `limbs.shape[:-1]`.
+    """
+    x = limbs[..., -1].astype(np.object_)
+    for i in range(limbs.shape[-1] - 2, -1, -1):
+        x = (x << LIMB_BITS) | limbs[..., i].astype(np.object_)
+
+    return x
+
+
+def reduction_table(field: Type[Array]) -> np.ndarray:
+    """
+    Returns the limbs of (i(x) * x^m) % p(x) for each polynomial i(x) with degree less than 4.
+    """
+    key = (field.degree, int(field.irreducible_poly))
+    if key not in _REDUCTION_TABLES:
+        degree, irreducible_poly = key
+        table = []
+        for i in range(16):
+            c = i << degree
+            for j in range(degree + 3, degree - 1, -1):
+                if (c >> j) & 0b1:
+                    c ^= irreducible_poly << (j - degree)
+            table.append(c)
+        _REDUCTION_TABLES[key] = to_limbs(np.array(table, dtype=np.object_), n_limbs(degree))
+
+    return _REDUCTION_TABLES[key]
+
+
+###############################################################################
+# JIT-compiled limb arithmetic
+###############################################################################
+
+
+@numba.jit(["void(int64[::1], int64, int64, int64[:, ::1])"], nopython=True, cache=True)
+def shift_reduce(a: np.ndarray, shift: int, degree: int, reduction: np.ndarray):  # pragma: no cover
+    """
+    Computes a(x) = (a(x) * x^shift) % p(x) in-place, for shift <= 4.
+    """
+    carry = 0
+    for j in range(a.size):
+        value = (a[j] << shift) | carry
+        carry = value >> LIMB_BITS
+        a[j] = value & LIMB_MASK
+
+    # Remove the bits shifted past x^(m-1) and add their remainder modulo p(x). They may span two limbs.
+    i, offset = divmod(degree, LIMB_BITS)
+    top = a[i] >> offset
+    if i + 1 < a.size:
+        top |= a[i + 1] << (LIMB_BITS - offset)
+        a[i + 1] = 0
+    a[i] &= (1 << offset) - 1
+    for j in range(a.size):
+        a[j] ^= reduction[top, j]
+
+
+@numba.jit(["void(int64[::1], int64[::1], int64, int64[:, ::1], int64[:, ::1], int64[::1])"], nopython=True, cache=True)
+def multiply_limbs(
+    a: np.ndarray, b: np.ndarray, degree: int, reduction: np.ndarray, table: np.ndarray, c: np.ndarray
+):  # pragma: no cover
+    """
+    Computes c(x) = (a(x) * b(x)) % p(x) using split tables, see `_calculate.multiply_binary.split_table()`. The
+    16-row `table` is scratch space, and `c` may not alias `a` or `b`.
+    """
+    n = c.size
+
+    # Compute (a(x) * i(x)) % p(x) for each polynomial i(x) with degree less than 4
+    for j in range(n):
+        table[0, j] = 0
+        table[1, j] = a[j]
+    for i in range(1, 4):
+        for j in range(n):
+            table[1 << i, j] = table[1 << (i - 1), j]
+        shift_reduce(table[1 << i], 1, degree, reduction)
+    for i in range(3, 16):
+        if i & (i - 1):
+            for j in range(n):
+                table[i, j] = table[i & (i - 1), j] ^ table[i & -i, j]
+
+    for j in range(n):
+        c[j] = 0
+    for i in range(((degree - 1) // 4) * 4, -4, -4):
+        shift_reduce(c, 4, degree, reduction)  # Compute c(x) * x^4 % p(x)
+
+        # Add a(x) * b_i(x), where b_i(x) are the 4 bits of b(x) starting at x^i. They never span two limbs.
+        row = (b[i // LIMB_BITS] >> (i % LIMB_BITS)) & 0xF
+        for j in range(n):
+            c[j] ^= table[row, j]
+
+
+@numba.jit(["int64[:, ::1](int64[:, ::1], int64[:, ::1], int64, int64[:, ::1])"], nopython=True, cache=True)
+def multiply(a: np.ndarray, b: np.ndarray, degree: int, reduction: np.ndarray) -> np.ndarray:  # pragma: no cover
+    """
+    Computes a * b in GF(2^m) for each pair of elements.
+    """
+    n, n_limbs_ = a.shape
+    c = np.zeros((n, n_limbs_), dtype=np.int64)
+    table = np.empty((16, n_limbs_), dtype=np.int64)
+    for k in range(n):
+        multiply_limbs(a[k], b[k], degree, reduction, table, c[k])
+
+    return c
+
+
+@numba.jit(["int64[:, ::1](int64[:, ::1], int64[:, ::1], int64, int64[:, ::1])"], nopython=True, cache=True)
+def power(a: np.ndarray, b: np.ndarray, degree: int, reduction: np.ndarray) -> np.ndarray:  # pragma: no cover
+    """
+    Computes a ** b in GF(2^m) for each pair of element and non-negative exponent, using the Square and Multiply
+    algorithm. The exponents are stored as limbs and are less than 2^m.
+    """
+    n, n_limbs_ = a.shape
+    c = np.zeros((n, n_limbs_), dtype=np.int64)
+    table = np.empty((16, n_limbs_), dtype=np.int64)
+    scratch = np.empty(n_limbs_, dtype=np.int64)
+    for k in range(n):
+        c[k, 0] = 1
+        for i in range(degree - 1, -1, -1):
+            multiply_limbs(c[k], c[k], degree, reduction, table, scratch)
+            c[k, :] = scratch
+            if (b[k, i // LIMB_BITS] >> (i % LIMB_BITS)) & 0b1:
+                multiply_limbs(c[k], a[k], degree, reduction, table, scratch)
+                c[k, :] = scratch
+
+    return c
+
+
+@numba.jit(["int64[:, ::1](int64[:, ::1], int64, int64[:, ::1])"], nopython=True, cache=True)
+def reciprocal(a: np.ndarray, degree: int, reduction: np.ndarray) -> np.ndarray:  # pragma: no cover
+    """
+    Computes a^-1 in GF(2^m) for each non-zero element simultaneously using Montgomery's trick, see
+    `_calculate.reciprocal_batch_jit`. Each block of elements requires one inversion,
+    a^-1 = a^(2^m - 2) = a^2 * a^4 * ... * a^(2^(m-1)).
+    """
+    n, n_limbs_ = a.shape
+    b = np.empty((n, n_limbs_), dtype=np.int64)
+    table = np.empty((16, n_limbs_), dtype=np.int64)
+    product = np.empty(n_limbs_, dtype=np.int64)
+    square = np.empty(n_limbs_, dtype=np.int64)
+    scratch = np.empty(n_limbs_, dtype=np.int64)
+
+    for start in range(0, n, BLOCK_SIZE):
+        stop = min(start + BLOCK_SIZE, n)
+
+        # Store the prefix products of the block in the output
+        product[:] = 0
+        product[0] = 1
+        for k in range(start, stop):
+            b[k, :] = product
+            multiply_limbs(product, a[k], degree, reduction, table, scratch)
+            product[:] = scratch
+
+        # Invert the block's product
+        square[:] = product
+        product[:] = 0
+        product[0] = 1
+        for _ in range(1, degree):
+            multiply_limbs(square, square, degree, reduction, table, scratch)
+            square[:] = scratch
+            multiply_limbs(product, square, degree, reduction, table, scratch)
+            product[:] = scratch
+
+        # Back-substitute the inverse of the block's product
+        for k in range(stop - 1, start - 1, -1):
+            multiply_limbs(product, b[k], degree, reduction, table, scratch)
+            b[k, :] = scratch
+            multiply_limbs(product, a[k], degree, reduction, table, scratch)
+            product[:] = scratch
+
+    return b
@@ -4,13 +4,14 @@ included in NumPy are also included.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Type
+from typing import TYPE_CHECKING, Callable, Type
 
 import numba
 import numpy as np
 from numba import int64
 
 from .._helper import verify_isinstance
+from . import _parametric
 from ._function import Function, FunctionMixin
 from ._meta import DTYPES
 
@@ -18,6 +19,17 @@ if TYPE_CHECKING:
     from ._array import Array
 
 
+def _lapack_linalg_supported(field: Type[Array]) -> bool:
+    """
+    Determines if the linear algebra of the field may be computed with LAPACK/BLAS, see `_lapack_linalg()`. This is
+    only possible in prime fields. When the products of a JIT-compiled prime field overflow int64, they would be
+    computed on slow object arrays, so the JIT-compiled field arithmetic is used instead.
+    """
+    if not field._is_prime_field:
+        return False
+    return field.ufunc_mode == "python-calculate" or (field.characteristic - 1) ** 2 <= np.iinfo(np.int64).max
+
+
 def _lapack_linalg(field: Type[Array], a: Array, b: Array, function, out=None, n_sum=None) -> Array:
     """
     In prime fields GF(p), it's much more efficient to use LAPACK/BLAS implementations of linear algebra
@@ -44,11 +56,14 @@ def _lapack_linalg(field: Type[Array], a: Array, b: Array, function, out=None, n
     b = b.astype(dtype)
 
     # Compute result using native NumPy LAPACK/BLAS implementation
-    if function in [np.inner, np.vdot]:
-        # These functions don't have and `out` keyword argument
-        c = function(a, b)
-    else:
-        c = function(a, b, out=out)
+    c = function(a, b)
+
+    if out is not None:
+        # Reduce the result mod p directly into the output array
+        out = out[0] if isinstance(out, tuple) else out
+        np.remainder(c, field.characteristic, out=out.view(np.ndarray), casting="unsafe")
+        return out
+
     c = c % field.characteristic  # Reduce the result mod p
 
     if np.isscalar(c):
@@ -77,7 +92,7 @@ class dot_jit(Function):
         verify_isinstance(a, self.field)
         verify_isinstance(b, self.field)
 
-        if self.field._is_prime_field:
+        if _lapack_linalg_supported(self.field):
             return _lapack_linalg(self.field, a, b, np.dot, out=out)
 
         if a.ndim == 0 or b.ndim == 0:
@@ -110,7 +125,7 @@ class vdot_jit(Function):
         verify_isinstance(a, self.field)
         verify_isinstance(b, self.field)
 
-        if self.field._is_prime_field:
+        if _lapack_linalg_supported(self.field):
             return _lapack_linalg(self.field, a, b, np.vdot)
 
         a = a.flatten()
@@ -131,7 +146,7 @@ class inner_jit(Function):
         verify_isinstance(a, self.field)
         verify_isinstance(b, self.field)
 
-        if self.field._is_prime_field:
+        if _lapack_linalg_supported(self.field):
             return _lapack_linalg(self.field, a, b, np.inner)
 
         if a.ndim == 0 or b.ndim == 0:
@@ -156,7 +171,7 @@ class outer_jit(Function):
         verify_isinstance(a, self.field)
         verify_isinstance(b, self.field)
 
-        if self.field._is_prime_field:
+        if _lapack_linalg_supported(self.field):
             return _lapack_linalg(self.field, a, b, np.outer, out=out, n_sum=1)
 
         return np.multiply.outer(a.ravel(), b.ravel(), out=out)
@@ -186,7 +201,7 @@ class matmul_jit(Function):
             )
         dtype = A.dtype
 
-        if self.field._is_prime_field:
+        if _lapack_linalg_supported(self.field):
             return _lapack_linalg(self.field, A, B, np.matmul, out=out)
 
         prepend, append = False, False
@@ -211,11 +226,9 @@ class matmul_jit(Function):
         #     A = np.broadcast_to(A, new_shape)
 
         if self.field.ufunc_mode != "python-calculate":
-            C = self.jit(A.astype(np.int64), B.astype(np.int64))
-            C = C.astype(dtype)
+            C = self.jit_call(A.astype(np.int64), B.astype(np.int64))
         else:
             C = self.python(A.view(np.ndarray), B.view(np.ndarray))
-        C = self.field._view(C)
 
         shape = list(C.shape)
         if prepend:
@@ -224,13 +237,14 @@ class matmul_jit(Function):
             shape = shape[:-1]
         C = C.reshape(shape)
 
-        # TODO: Determine a better way to do this
         if out is not None:
-            assert isinstance(out, tuple) and len(out) == 1  # TODO: Why is `out` getting populated as tuple?
-            out = out[0]
-            out[:] = C[:]
+            # Write the product directly into the output array, without an intermediate array of the field's dtype.
+            # The `out` keyword argument is a tuple when invoked from the `np.matmul` ufunc dispatcher.
+            out = out[0] if isinstance(out, tuple) else out
+            np.copyto(out.view(np.ndarray), C, casting="unsafe")
+            return out
 
-        return C
+        return self.field._view(C.astype(dtype, copy=False))
 
     def set_globals(self):
         # pylint: disable=global-variable-undefined
@@ -256,6 +270,215 @@ class matmul_jit(Function):
 
         return C
 
+    @staticmethod
+    def parametric_implementation(A, B, FIELD):  # pragma: no cover
+        assert A.ndim == 2 and B.ndim == 2
+        assert A.shape[-1] == B.shape[-2]
+
+        M, K = A.shape
+        K, N = B.shape
+        C = np.zeros((M, N), dtype=A.dtype)
+        for i in numba.prange(M):  # pylint: disable=not-an-iterable
+            for j in numba.prange(N):  # pylint: disable=not-an-iterable
+                for k in range(K):
+                    C[i, j] = _parametric.add(C[i, j], _parametric.multiply(A[i, k], B[k, j], FIELD), FIELD)
+
+        return C
+
+
+###############################################################################
+# Fused multiply-accumulate routines
+###############################################################################
+
+
+class axpy_jit(Function):
+    """
+    Computes the fused multiply-accumulate Y[i, :] += c[i] * x in-place for each row of the matrix Y, without
+    intermediate arrays. Rows with c[i] = 0 are not accessed, so x may be one of those rows.
+    """
+
+    def __call__(self, c: Array, x: Array, Y: Array) -> Array:
+        verify_isinstance(c, self.field)
+        verify_isinstance(x, self.field)
+        verify_isinstance(Y, self.field)
+        if not (c.ndim == 1 and x.ndim == 1 and Y.shape == (c.size, x.size)):
+            raise ValueError(
+                f"Operation 'axpy' requires 'c' and 'x' to be 1-D and 'Y' to have shape {(c.size, x.size)}, "
+                f"not {c.shape}, {x.shape}, and {Y.shape}."
+            )
+
+        if self.field.ufunc_mode == "python-calculate":
+            Y += np.multiply.outer(c, x)
+            return Y
+
+        function = axpy_parallel_jit(self.field) if _parallel(self.field, Y.size) else self
+        _accumulate(function.jit, c, x, Y)
+
+        return Y
+
+    def set_globals(self):
+        # pylint: disable=global-variable-undefined
+        global TABLE_SIZE, ADD, MULTIPLY
+        # The size of the per-constant multiplication tables, which are only used in fields with order at most 2^16
+        TABLE_SIZE = self.field.order if self.field.order <= 2**16 else 0
+        # The scalar arithmetic kernels are invoked in the loops, rather than the ufuncs
+        ADD = self.field._add.jit_kernel
+        MULTIPLY = self.field._multiply.jit_kernel
+
+    _SIGNATURE = numba.types.FunctionType(numba.types.void(int64[::1], int64[::1], int64[:, ::1]))
+
+    @property
+    def _signatures(self) -> list:
+        return [_accumulate_signature(self.field, 1, 2)]
+
+    @staticmethod
+    def implementation(c, x, Y):  # pragma: no cover
+        M, N = Y.shape
+        for i in range(M):
+            if c[i] == 0:
+                continue
+            if 0 < TABLE_SIZE <= N:
+                # Tabulate the products of c[i] with every field element, so each product is a single table lookup
+                table = np.empty(TABLE_SIZE, dtype=Y.dtype)
+                for k in numba.prange(TABLE_SIZE):  # pylint: disable=not-an-iterable
+                    table[k] = MULTIPLY(c[i], k)
+                for j in numba.prange(N):  # pylint: disable=not-an-iterable
+                    Y[i, j] = ADD(np.int64(Y[i, j]), np.int64(table[x[j]]))
+            else:
+                for j in numba.prange(N):  # pylint: disable=not-an-iterable
+                    Y[i, j] = ADD(np.int64(Y[i, j]), MULTIPLY(c[i], np.int64(x[j])))
+
+
+class axpy_parallel_jit(axpy_jit):
+    """
+    Computes the fused multiply-accumulate Y[i, :] += c[i] * x in-place using multiple threads.
+    """
+
+    _PARALLEL = True
+
+
+class multi_axpy_jit(Function):
+    """
+    Computes the fused multi-source multiply-accumulate y += c[0] * X[0, :] + ... + c[k - 1] * X[k - 1, :] in-place,
+    without intermediate arrays.
+    """
+
+    def __call__(self, c: Array, X: Array, y: Array) -> Array:
+        verify_isinstance(c, self.field)
+        verify_isinstance(X, self.field)
+        verify_isinstance(y, self.field)
+        if not (c.ndim == 1 and y.ndim == 1 and X.shape == (c.size, y.size)):
+            raise ValueError(
+                f"Operation 'multi_axpy' requires 'c' and 'y' to be 1-D and 'X' to have shape {(c.size, y.size)}, "
+                f"not {c.shape}, {X.shape}, and {y.shape}."
+            )
+
+        if self.field.ufunc_mode == "python-calculate":
+            y += c @ X
+            return y
+
+        function = multi_axpy_parallel_jit(self.field) if _parallel(self.field, X.size) else self
+        _accumulate(function.jit, c, X, y)
+
+        return y
+
+    def set_globals(self):
+        # pylint: disable=global-variable-undefined
+        global TABLE_SIZE, BLOCK_SIZE, ADD, MULTIPLY
+        # The size of the per-constant multiplication tables, which are only used in fields with order at most 2^16
+        TABLE_SIZE = self.field.order if self.field.order <= 2**16 else 0
+        BLOCK_SIZE = 4096  # The number of entries of y that are accumulated from each row of X at a time
+        # The scalar arithmetic kernels are invoked in the loops, rather than the ufuncs
+        ADD = self.field._add.jit_kernel
+        MULTIPLY = self.field._multiply.jit_kernel
+
+    _SIGNATURE = numba.types.FunctionType(numba.types.void(int64[::1], int64[:, ::1], int64[::1]))
+
+    @property
+    def _signatures(self) -> list:
+        return [_accumulate_signature(self.field, 2, 1)]
+
+    @staticmethod
+    def implementation(c, X, y):  # pragma: no cover
+        K, N = X.shape
+
+        # Tabulate the products of each c[i] with every field element, so each product is a single table lookup
+        use_tables = 0 < TABLE_SIZE <= N
+        tables = np.empty((K if use_tables else 0, TABLE_SIZE), dtype=y.dtype)
+        for i in range(tables.shape[0]):
+            for k in range(TABLE_SIZE):
+                tables[i, k] = MULTIPLY(c[i], k)
+
+        # Accumulate each block of y from all rows of X while the block is in cache
+        for b in numba.prange((N + BLOCK_SIZE - 1) // BLOCK_SIZE):  # pylint: disable=not-an-iterable
+            start = b * BLOCK_SIZE
+            stop = min(start + BLOCK_SIZE, N)
+            for i in range(K):
+                if c[i] == 0:
+                    continue
+                if use_tables:
+                    for j in range(start, stop):
+                        y[j] = ADD(np.int64(y[j]), np.int64(tables[i, X[i, j]]))
+                else:
+                    for j in range(start, stop):
+                        y[j] = ADD(np.int64(y[j]), MULTIPLY(c[i], np.int64(X[i, j])))
+
+
+class multi_axpy_parallel_jit(multi_axpy_jit):
+    """
+    Computes the fused multi-source multiply-accumulate y += c[0] * X[0, :] + ... + c[k - 1] * X[k - 1, :] in-place
+    using multiple threads.
+    """
+
+    _PARALLEL = True
+
+
+def _parallel(field: Type[Array], size: int) -> bool:
+    """
+    Determines if the multi-threaded fused multiply-accumulate should be invoked, using the same criteria as the
+    multi-threaded ufuncs.
+    """
+    return field._ufunc_parallel and size >= field._multiply._PARALLEL_THRESHOLD
+
+
+def _accumulate_dtype(field: Type[Array]) -> np.dtype:
+    """
+    Returns the dtype of the JIT-compiled fused multiply-accumulate loops. This is the field's smallest dtype, if it is
+    unsigned, so that narrow arrays are updated in-place without conversion to int64. Only one dtype is compiled,
+    since every field element fits in the smallest dtype.
+    """
+    dtype = np.dtype(field.dtypes[0])
+    if dtype in [np.uint8, np.uint16, np.uint32]:
+        return dtype
+    return np.dtype(np.int64)
+
+
+def _accumulate_signature(field: Type[Array], x_ndim: int, y_ndim: int) -> numba.types.FunctionType:
+    """
+    Returns the signature of a fused multiply-accumulate over `_accumulate_dtype()`. The coefficients are always int64.
+    """
+    t = numba.from_dtype(_accumulate_dtype(field))
+    x_type = numba.types.Array(t, x_ndim, "C")
+    y_type = numba.types.Array(t, y_ndim, "C")
+    return numba.types.void(int64[::1], x_type, y_type)
+
+
+def _accumulate(function: Callable, c: Array, x: Array, y: Array):
+    """
+    Invokes the JIT-compiled fused multiply-accumulate, updating `y` in-place. If `y` is not C-contiguous or does not
+    have the compiled dtype, the accumulation is computed in a copy and written back.
+    """
+    field = type(y)
+    dtype = _accumulate_dtype(field)
+    c = c.view(np.ndarray).astype(np.int64)
+    x = np.ascontiguousarray(x.view(np.ndarray), dtype=dtype)
+    if y.dtype == dtype and y.flags.c_contiguous and y.flags.writeable:
+        function(c, x, y.view(np.ndarray))
+    else:
+        y_copy = y.view(np.ndarray).astype(dtype)
+        function(c, x, y_copy)
+        y[...] = field._view(y_copy)
+
 
 ###############################################################################
 # Matrix decomposition routines
@@ -267,14 +490,32 @@ class row_reduce_jit(Function):
     Converts the matrix into its row-reduced echelon form using Gaussian elimination.
     """
 
+    _JIT_THRESHOLD = 2**16  # The minimum matrix size at which the JIT-compiled elimination is invoked
+
     def __call__(self, A: Array, ncols: int | None = None) -> tuple[Array, int]:
         verify_isinstance(A, self.field)
         if not A.ndim == 2:
             raise ValueError(f"Only 2-D matrices can be converted to reduced row echelon form, not {A.ndim}-D.")
 
         ncols = A.shape[1] if ncols is None else ncols
+
+        if self.field.ufunc_mode == "python-calculate" or A.size < self._JIT_THRESHOLD:
+            # Small matrices are row reduced with the field's ufuncs, avoiding the compilation of the elimination
+            return self._python_row_reduce(A, ncols)
+
+        dtype = _accumulate_dtype(self.field)
+        A_rre, p = self.jit(np.ascontiguousarray(A.view(np.ndarray), dtype=dtype), ncols)
+
+        return self.field._view(A_rre.astype(A.dtype, copy=False)), p
+
+    def _python_row_reduce(self, A: Array, ncols: int) -> tuple[Array, int]:
+        """
+        Row reduces the matrix with vectorized row operations, for small matrices or fields whose arithmetic is not
+        JIT compiled.
+        """
         A_rre = A.copy()
         p = 0  # The pivot
+        reciprocal = self.field.Element._reciprocal
 
         for j in range(ncols):
             # Find a pivot in column `j` at or below row `p`
@@ -286,8 +527,8 @@ class row_reduce_jit(Function):
             # Swap row `p` and `i`. The pivot is now located at row `p`.
             A_rre[[p, i], :] = A_rre[[i, p], :]
 
-            # Force pivot value to be 1
-            A_rre[p, :] /= A_rre[p, j]
+            # Force pivot value to be 1. The pivot is inverted with scalar arithmetic, avoiding a 0-D array ufunc.
+            A_rre[p, :] *= self.field(reciprocal(int(A_rre[p, j])))
 
             # Force zeros above and below the pivot
             idxs = np.nonzero(A_rre[:, j])[0].tolist()
@@ -300,12 +541,66 @@ class row_reduce_jit(Function):
 
         return A_rre, p
 
+    def set_globals(self):
+        # pylint: disable=global-variable-undefined
+        global NEGATIVE, MULTIPLY, RECIPROCAL, AXPY
+        NEGATIVE = self.field._negative.jit_kernel
+        MULTIPLY = self.field._multiply.jit_kernel
+        RECIPROCAL = self.field._reciprocal.jit_kernel
+        AXPY = axpy_jit(self.field).jit
+
+    _SIGNATURE = numba.types.FunctionType(numba.types.Tuple((int64[:, ::1], int64))(int64[:, ::1], int64))
+
+    @property
+    def _signatures(self) -> list:
+        t = numba.types.Array(numba.from_dtype(_accumulate_dtype(self.field)), 2, "C")
+        return [numba.types.Tuple((t, int64))(t, int64)]
+
+    @staticmethod
+    def implementation(A, ncols):  # pragma: no cover
+        A = A.copy()
+        M, N = A.shape
+        c = np.zeros(M, dtype=np.int64)
+        p = 0  # The pivot
+
+        for j in range(ncols):
+            # Find a pivot in column `j` at or below row `p`
+            i = p
+            while i < M and A[i, j] == 0:
+                i += 1
+            if i == M:
+                continue
+
+            # Swap row `p` and `i`. The pivot is now located at row `p`.
+            if i != p:
+                for k in range(N):
+                    A[p, k], A[i, k] = A[i, k], A[p, k]
+
+            # Force pivot value to be 1
+            pivot_inv = RECIPROCAL(np.int64(A[p, j]))
+            for k in range(N):
+                A[p, k] = MULTIPLY(np.int64(A[p, k]), pivot_inv)
+
+            # Force zeros above and below the pivot with the fused row operations A[r, :] += -A[r, j] * A[p, :]
+            for r in range(M):
+                c[r] = NEGATIVE(np.int64(A[r, j]))
+            c[p] = 0
+            AXPY(c, A[p], A)
+
+            p += 1
+            if p == M:
+                break
+
+        return A, p
+
 
 class lu_decompose_jit(Function):
     """
     Decomposes the matrix into its LU decomposition.
     """
 
+    _JIT_THRESHOLD = 2**16  # The minimum matrix size at which the JIT-compiled row operations are invoked
+
     def __call__(self, A: Array) -> tuple[Array, Array]:
         verify_isinstance(A, self.field)
         if not A.ndim == 2:
@@ -314,6 +609,7 @@ class lu_decompose_jit(Function):
         m = A.shape[0]
         Ai = A.copy()
         L = self.field.Identity(m)
+        compiled = self.field.ufunc_mode != "python-calculate" and A.size >= self._JIT_THRESHOLD
 
         for i in range(0, m - 1):
             if Ai[i, i] == 0:
@@ -325,7 +621,10 @@ class lu_decompose_jit(Function):
                     raise ValueError("The LU decomposition of 'A' does not exist. Use the PLU decomposition instead.")
 
             l = Ai[i + 1 :, i] / Ai[i, i]
-            Ai[i + 1 :, :] -= np.multiply.outer(l, Ai[i, :])
+            if compiled:
+                axpy_jit(self.field)(-l, Ai[i, :], Ai[i + 1 :, :])
+            else:
+                Ai[i + 1 :, :] -= np.multiply.outer(l, Ai[i, :])
             L[i + 1 :, i] = l
 
         U = Ai
@@ -338,11 +637,31 @@ class plu_decompose_jit(Function):
     Decomposes the matrix into its PLU decomposition.
     """
 
+    _JIT_THRESHOLD = 2**16  # The minimum matrix size at which the JIT-compiled elimination is invoked
+
     def __call__(self, A: Array) -> tuple[Array, Array, Array, int]:
         verify_isinstance(A, self.field)
         if not A.ndim == 2:
             raise ValueError(f"Argument 'A' must be a 2-D matrix, not have shape {A.shape}.")
 
+        if self.field.ufunc_mode == "python-calculate" or A.size < self._JIT_THRESHOLD:
+            # Small matrices are decomposed with the field's ufuncs, avoiding the compilation of the elimination
+            return self._python_plu_decompose(A)
+
+        dtype = _accumulate_dtype(self.field)
+        permutation, L, U, N_permutations = self.jit(np.ascontiguousarray(A.view(np.ndarray), dtype=dtype))
+        P = self.field.Identity(A.shape[0])[permutation]  # Row permutation matrix
+        L = self.field._view(L.astype(A.dtype, copy=False))
+        U = self.field._view(U.astype(A.dtype, copy=False))
+
+        # NOTE: Return column permutation matrix
+        return P.T, L, U, N_permutations
+
+    def _python_plu_decompose(self, A: Array) -> tuple[Array, Array, Array, int]:
+        """
+        Decomposes the matrix with vectorized row operations, for small matrices or fields whose arithmetic is not JIT
+        compiled.
+        """
         m, n = A.shape
         Ai = A.copy()
         L = self.field.Zeros((m, m))
@@ -374,6 +693,66 @@ class plu_decompose_jit(Function):
         # NOTE: Return column permutation matrix
         return P.T, L, U, N_permutations
 
+    def set_globals(self):
+        # pylint: disable=global-variable-undefined
+        global NEGATIVE, MULTIPLY, RECIPROCAL, AXPY
+        NEGATIVE = self.field._negative.jit_kernel
+        MULTIPLY = self.field._multiply.jit_kernel
+        RECIPROCAL = self.field._reciprocal.jit_kernel
+        AXPY = axpy_jit(self.field).jit
+
+    _SIGNATURE = numba.types.FunctionType(
+        numba.types.Tuple((int64[::1], int64[:, ::1], int64[:, ::1], int64))(int64[:, ::1])
+    )
+
+    @property
+    def _signatures(self) -> list:
+        t = numba.types.Array(numba.from_dtype(_accumulate_dtype(self.field)), 2, "C")
+        return [numba.types.Tuple((int64[::1], t, t, int64))(t)]
+
+    @staticmethod
+    def implementation(A):  # pragma: no cover
+        M, N = A.shape
+        U = A.copy()
+        L = np.zeros((M, M), dtype=A.dtype)
+        permutation = np.arange(M)  # The rows of the identity matrix that form the row permutation matrix
+        N_permutations = 0  # Number of permutations
+        c = np.zeros(M, dtype=np.int64)
+
+        for i in range(0, min(M, N)):
+            if U[i, i] == 0:
+                # Find the first non-zero entry in column `i` below row `i`
+                j = i + 1
+                while j < M and U[j, i] == 0:
+                    j += 1
+                if j == M:
+                    L[i, i] = 1
+                    continue
+
+                # Swap rows `i` and `j`
+                for k in range(N):
+                    U[i, k], U[j, k] = U[j, k], U[i, k]
+                for k in range(M):
+                    L[i, k], L[j, k] = L[j, k], L[i, k]
+                permutation[i], permutation[j] = permutation[j], permutation[i]
+                N_permutations += 1
+
+            # Zero out rows below row `i` with the fused row operations U[r, :] += -l[r] * U[i, :]
+            pivot_inv = RECIPROCAL(np.int64(U[i, i]))
+            for r in range(M):
+                if r > i:
+                    l = MULTIPLY(np.int64(U[r, i]), pivot_inv)
+                    L[r, i] = l
+                    c[r] = NEGATIVE(l)
+                else:
+                    c[r] = 0
+            AXPY(c, U[i], U)
+            L[i, i] = 1  # Set 1 on the diagonal
+
+        L[M - 1, M - 1] = 1  # Set the final diagonal to 1
+
+        return permutation, L, U, N_permutations
+
 
 ###############################################################################
 # Matrix inversions, solutions, rank, etc
@@ -424,6 +803,143 @@ class det_jit(Function):
         return det
 
 
+class characteristic_poly_jit(Function):
+    """
+    Computes the coefficients of the characteristic polynomial det(xI - A) of a square matrix, in degree-descending
+    order.
+
+    Algorithm:
+        1. Reduce A to an upper Hessenberg matrix H with similarity transforms, using Gaussian elimination with row
+           and column swaps. H has the same characteristic polynomial as A.
+        2. Compute the characteristic polynomials p_k(x) of the leading k x k submatrices of H with the recurrence
+           p_k(x) = (x - h_kk) p_k-1(x) - sum_i h_k-i,k (h_k,k-1 ... h_k-i+1,k-i) p_k-i-1(x)
+
+    Both steps are O(n^3), rather than the O(n!) of a cofactor expansion of det(xI - A).
+    """
+
+    def __call__(self, A: Array) -> Array:
+        verify_isinstance(A, self.field)
+        if not (A.ndim == 2 and A.shape[0] == A.shape[1]):
+            raise ValueError(
+                f"The 2-D array must be square to compute its characteristic polynomial, not have shape {A.shape}."
+            )
+
+        if self.field.ufunc_mode == "python-calculate":
+            return self._python_characteristic_poly(A)
+
+        coeffs = self.jit(np.ascontiguousarray(A.view(np.ndarray), dtype=np.int64))
+
+        return self.field._view(coeffs.astype(A.dtype, copy=False))
+
+    def _python_characteristic_poly(self, A: Array) -> Array:
+        """
+        Computes the characteristic polynomial with vectorized row, column, and polynomial operations, for fields whose
+        arithmetic is not JIT compiled.
+        """
+        n = A.shape[0]
+        H = A.copy()
+
+        for j in range(0, n - 2):
+            # Find a pivot in column `j` at or below row `m`
+            m = j + 1
+            idxs = np.nonzero(H[m:, j])[0]
+            if idxs.size == 0:
+                continue
+            i = m + idxs[0]
+
+            # Swap rows and columns `m` and `i`. The pivot is now located at row `m`.
+            H[[m, i], :] = H[[i, m], :]
+            H[:, [m, i]] = H[:, [i, m]]
+
+            # Force zeros below the pivot with row operations, and apply the inverse column operations
+            u = H[m + 1 :, j] / H[m, j]
+            H[m + 1 :, :] -= np.multiply.outer(u, H[m, :])
+            H[:, m] += H[:, m + 1 :] @ u
+
+        # The coefficients of p_k(x) are in row k, in degree-ascending order
+        P = self.field.Zeros((n + 1, n + 1), dtype=A.dtype)
+        P[0, 0] = 1
+        for k in range(1, n + 1):
+            P[k, 1:] = P[k - 1, :-1]
+            P[k, :] -= H[k - 1, k - 1] * P[k - 1, :]
+            if k > 1:
+                i = np.arange(1, k)
+                t = np.multiply.accumulate(H[k - i, k - i - 1])
+                c = H[k - i - 1, k - 1] * t
+                P[k, :] -= c @ P[k - 2 :: -1, :]
+
+        return P[n, ::-1]
+
+    def set_globals(self):
+        # pylint: disable=global-variable-undefined
+        global ADD, SUBTRACT, MULTIPLY, RECIPROCAL
+        ADD = self.field._add.jit_kernel
+        SUBTRACT = self.field._subtract.jit_kernel
+        MULTIPLY = self.field._multiply.jit_kernel
+        RECIPROCAL = self.field._reciprocal.jit_kernel
+
+    _SIGNATURE = numba.types.FunctionType(int64[::1](int64[:, ::1]))
+
+    @staticmethod
+    def implementation(A):  # pragma: no cover
+        n = A.shape[0]
+        H = A.copy()
+        u = np.zeros(n, dtype=np.int64)
+
+        for j in range(0, n - 2):
+            # Find a pivot in column `j` at or below row `m`
+            m = j + 1
+            i = m
+            while i < n and H[i, j] == 0:
+                i += 1
+            if i == n:
+                continue
+
+            # Swap rows and columns `m` and `i`. The pivot is now located at row `m`.
+            if i != m:
+                for k in range(n):
+                    H[m, k], H[i, k] = H[i, k], H[m, k]
+                for k in range(n):
+                    H[k, m], H[k, i] = H[k, i], H[k, m]
+
+            # Force zeros below the pivot with the row operations H[r, :] -= u[r] * H[m, :]. Only columns `j` and
+            # above are non-zero in rows `m` and below.
+            pivot_inv = RECIPROCAL(H[m, j])
+            for r in range(m + 1, n):
+                u[r] = MULTIPLY(H[r, j], pivot_inv)
+                if u[r] != 0:
+                    for k in range(j, n):
+                        H[r, k] = SUBTRACT(H[r, k], MULTIPLY(u[r], H[m, k]))
+
+            # Apply the inverse column operations H[:, m] += u[r] * H[:, r]
+            for r in range(m + 1, n):
+                if u[r] != 0:
+                    for k in range(n):
+                        H[k, m] = ADD(H[k, m], MULTIPLY(u[r], H[k, r]))
+
+        # The coefficients of p_k(x) are in row k, in degree-ascending order
+        P = np.zeros((n + 1, n + 1), dtype=np.int64)
+        P[0, 0] = 1
+        for k in range(1, n + 1):
+            h = H[k - 1, k - 1]
+            for d in range(k):
+                P[k, d + 1] = P[k - 1, d]
+            for d in range(k):
+                P[k, d] = SUBTRACT(P[k, d], MULTIPLY(h, P[k - 1, d]))
+
+            t = 1  # The product of the subdiagonal entries h_k,k-1 ... h_k-i+1,k-i
+            for i in range(1, k):
+                t = MULTIPLY(t, H[k - i, k - i - 1])
+                if t == 0:
+                    break
+                c = MULTIPLY(H[k - i - 1, k - 1], t)
+                if c != 0:
+                    for d in range(k - i):
+                        P[k, d] = SUBTRACT(P[k, d], MULTIPLY(c, P[k - i - 1, d]))
+
+        return P[n, ::-1].copy()
+
+
 ###############################################################################
 # Matrix inversions, solutions, rank, etc
 ###############################################################################
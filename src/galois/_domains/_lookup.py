@@ -5,11 +5,14 @@ the complex finite field arithmetic to a few table lookups and an integer additi
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
+from typing import TYPE_CHECKING, Callable, Type
 
 import numpy as np
 
+from .._options import CACHEOPTIONS
 from . import _ufunc
+from ._cache import cache_key, load_tables, save_tables
 
 if TYPE_CHECKING:
     from ._array import Array
@@ -170,6 +173,20 @@ class multiply_ufunc(_ufunc.multiply_ufunc):
         n = LOG[b]
         return EXP[m + n]
 
+    def set_table_globals(self):
+        # pylint: disable=global-variable-undefined
+        global MUL_TABLE
+        MUL_TABLE = self.field._MUL_TABLE
+
+    @staticmethod
+    def table(a: int, b: int) -> int:  # pragma: no cover
+        """
+        a * b = MUL_TABLE[a, b]
+        """
+        # The tables have the field's smallest unsigned dtype. Convert the product to int64, since this function may be
+        # invoked from other JIT-compiled functions where mixed signed and unsigned arithmetic promotes to float64.
+        return np.int64(MUL_TABLE[a, b])
+
 
 class reciprocal_ufunc(_ufunc.reciprocal_ufunc):
     """
@@ -237,6 +254,21 @@ class divide_ufunc(_ufunc.divide_ufunc):
         n = LOG[b]
         return EXP[(ORDER - 1) + m - n]  # We add `ORDER - 1` to guarantee the index is non-negative
 
+    def set_table_globals(self):
+        # pylint: disable=global-variable-undefined
+        global DIV_TABLE
+        DIV_TABLE = self.field._DIV_TABLE
+
+    @staticmethod
+    def table(a: int, b: int) -> int:  # pragma: no cover
+        """
+        a / b = DIV_TABLE[a, b]
+        """
+        if b == 0:
+            raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
+
+        return np.int64(DIV_TABLE[a, b])
+
 
 class power_ufunc(_ufunc.power_ufunc):
     """
@@ -281,6 +313,10 @@ class log_ufunc(_ufunc.log_ufunc):
     Logarithm ufunc dispatcher with lookup table arithmetic added.
     """
 
+    def __init__(self, field: Type[Array], override=None, always_calculate=False):
+        super().__init__(field, override=override, always_calculate=always_calculate)
+        self._base_log_invs = {}  # The inverse of each base's logarithm modulo order - 1, see `base_log_inv()`
+
     def set_lookup_globals(self):
         # pylint: disable=global-variable-undefined
         global LOG
@@ -301,6 +337,46 @@ class log_ufunc(_ufunc.log_ufunc):
 
         return LOG[a]
 
+    def ufunc_for(self, method: str, inputs: tuple) -> Callable:
+        if (
+            method == "__call__"
+            and self.field.ufunc_mode != "python-calculate"
+            and self._jit_mode == "jit-lookup"
+            and not np.all(inputs[1] == self.field.primitive_element)
+        ):
+            return _ufunc.function_ufunc(self._lookup_base_change, self.jit_calculate)
+        return super().ufunc_for(method, inputs)
+
+    def _lookup_base_change(self, beta: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+        """
+        Computes the logarithms of a 1-D array of elements to a 1-D array of bases using the LOG lookup table.
+
+        log_alpha(beta) = log_g(beta) * log_g(alpha)^-1 mod (order - 1), where g is the primitive element
+        """
+        logs = self.jit_lookup(beta, int(self.field.primitive_element))
+        bases, idxs = np.unique(alpha, return_inverse=True)
+        log_invs = np.array([self.base_log_inv(int(base)) for base in bases], dtype=np.int64)[idxs]
+
+        n = self.field.order - 1
+        if (n - 1) ** 2 > np.iinfo(np.int64).max:
+            # The products of logarithms overflow int64
+            logs = logs.astype(np.object_)
+
+        return (logs * log_invs % n).astype(np.int64)
+
+    def base_log_inv(self, alpha: int) -> int:
+        """
+        Returns the inverse of log_g(alpha) modulo order - 1, where g is the primitive element. It is cached for each
+        base alpha.
+        """
+        if alpha not in self._base_log_invs:
+            n = self.field.order - 1
+            if alpha == 0 or math.gcd(int(self.field._LOG[alpha]), n) != 1:
+                raise ArithmeticError("The specified logarithm base is not a primitive element of the Galois field.")
+            self._base_log_invs[alpha] = pow(int(self.field._LOG[alpha]), -1, n)
+
+        return self._base_log_invs[alpha]
+
 
 class sqrt_ufunc(_ufunc.sqrt_ufunc):
     """
@@ -329,51 +405,95 @@ class UFuncMixin(_ufunc.UFuncMixin):
         """
         Construct EXP, LOG, and ZECH_LOG lookup tables to be used in the "lookup" arithmetic functions
         """
-        # TODO: Make this faster by using JIT-compiled ufuncs and vector arithmetic, when possible
-        primitive_element = int(cls._primitive_element)
-        add = cls._add.python_calculate
-        multiply = cls._multiply.python_calculate
-
-        cls._EXP = np.zeros(2 * cls.order, dtype=np.int64)
-        cls._LOG = np.zeros(cls.order, dtype=np.int64)
-        cls._ZECH_LOG = np.zeros(cls.order, dtype=np.int64)
         if cls.characteristic == 2:
             cls._ZECH_E = 0
         else:
             cls._ZECH_E = (cls.order - 1) // 2
 
-        element = 1
-        cls._EXP[0] = element
-        cls._LOG[0] = 0  # Technically -Inf
-        for i in range(1, cls.order):
-            # Increment by multiplying by the primitive element, which is a multiplicative generator of the field
-            element = multiply(element, primitive_element)
-            cls._EXP[i] = element
+        key = cache_key(cls.characteristic, cls.degree, int(cls._irreducible_poly_int), int(cls._primitive_element))
+        if CACHEOPTIONS["tables"]:
+            tables = load_tables(key, 4 * cls.order)
+            if tables is not None:
+                cls._EXP, cls._LOG, cls._ZECH_LOG = np.split(tables, [2 * cls.order, 3 * cls.order])
+                return
+
+        # Use the smallest integer data type that can index the doubled EXP table. Smaller tables are more cache
+        # friendly. Also, Numba only freezes global arrays less than 1 MB into the JIT-compiled ufuncs, and only those
+        # ufuncs may be cached on disk.
+        dtype = [dtype for dtype in [np.int16, np.int32, np.int64] if np.iinfo(dtype).max >= 2 * cls.order][0]
+
+        # Store the tables contiguously so they may be saved to and loaded from a single file
+        tables = np.zeros(4 * cls.order, dtype=dtype)
+        EXP, LOG, ZECH_LOG = np.split(tables, [2 * cls.order, 3 * cls.order])
+
+        # For small fields, the pure-Python ufuncs are faster than compiling the JIT ufuncs
+        if cls.order <= 2**14:
+            add = cls._add.python_calculate
+            multiply = cls._multiply.python_calculate
+        else:
+            add = cls._add.jit_calculate
+            multiply = cls._multiply.jit_calculate
 
-            # Assign to the log lookup table but skip indices greater than or equal to `order - 1`
-            # because `EXP[0] == EXP[order - 1]`
-            if i < cls.order - 1:
-                cls._LOG[cls._EXP[i]] = i
+        # Compute EXP[i] = α^i by doubling the number of known powers each iteration, EXP[n:2n] = α^n * EXP[0:n]
+        primitive_element = int(cls._primitive_element)
+        EXP[0] = 1
+        n = 1
+        while n < cls.order:
+            alpha_n = multiply(int(EXP[n - 1]), primitive_element)
+            N = min(n, cls.order - n)
+            EXP[n : n + N] = multiply(EXP[0:N].astype(np.int64), alpha_n)
+            n += N
+
+        # Assign to the log lookup table but skip indices greater than or equal to `order - 1`
+        # because `EXP[0] == EXP[order - 1]`
+        LOG[EXP[0 : cls.order - 1]] = np.arange(cls.order - 1)
+        LOG[0] = 0  # Technically -Inf
 
         # Compute Zech log lookup table
-        for i in range(0, cls.order):
-            one_plus_element = add(1, cls._EXP[i])
-            cls._ZECH_LOG[i] = cls._LOG[one_plus_element]
+        ZECH_LOG[:] = LOG[add(1, EXP[0 : cls.order].astype(np.int64)).astype(np.int64)]
 
-        if not cls._EXP[cls.order - 1] == 1:
+        if not EXP[cls.order - 1] == 1:
             raise RuntimeError(
                 f"The anti-log lookup table for {cls.name} is not cyclic with size {cls.order - 1}, which means "
                 f"the primitive element {cls._primitive_element} does not have multiplicative order {cls.order - 1} "
                 f"and therefore isn't a multiplicative generator for {cls.name}."
             )
-        if not len(set(cls._EXP[0 : cls.order - 1])) == cls.order - 1:
+        if not np.unique(EXP[0 : cls.order - 1]).size == cls.order - 1:
             raise RuntimeError(
                 f"The anti-log lookup table for {cls.name} is not unique, "
                 f"which means the primitive element {cls._primitive_element} has order less than {cls.order - 1} "
                 f"and is not a multiplicative generator of {cls.name}."
             )
-        if not len(set(cls._LOG[1 : cls.order])) == cls.order - 1:
+        if not np.unique(LOG[1 : cls.order]).size == cls.order - 1:
             raise RuntimeError(f"The log lookup table for {cls.name} is not unique.")
 
         # Double the EXP table to prevent computing a `% (order - 1)` on every multiplication lookup
-        cls._EXP[cls.order : 2 * cls.order] = cls._EXP[1 : 1 + cls.order]
+        EXP[cls.order : 2 * cls.order] = EXP[1 : 1 + cls.order]
+
+        if CACHEOPTIONS["tables"]:
+            save_tables(key, tables)
+            if CACHEOPTIONS["mmap"]:
+                # Replace the private copy of the tables with the memory-mapped file shared by all processes
+                tables = load_tables(key, 4 * cls.order)
+                if tables is not None:
+                    EXP, LOG, ZECH_LOG = np.split(tables, [2 * cls.order, 3 * cls.order])
+
+        cls._EXP, cls._LOG, cls._ZECH_LOG = EXP, LOG, ZECH_LOG
+
+    @classmethod
+    def _build_arithmetic_tables(cls):
+        """
+        Construct the full MUL_TABLE and DIV_TABLE arithmetic tables to be used in the "table" arithmetic functions.
+        They are computed from the EXP and LOG lookup tables.
+        """
+        if cls._EXP.size == 0:
+            cls._build_lookup_tables()
+
+        # Index the tables with the field elements, so that MUL_TABLE[a, b] = a * b and DIV_TABLE[a, b] = a / b
+        log = cls._LOG[1 : cls.order].astype(np.int64)
+        MUL_TABLE = np.zeros((cls.order, cls.order), dtype=cls.dtypes[0])
+        DIV_TABLE = np.zeros((cls.order, cls.order), dtype=cls.dtypes[0])
+        MUL_TABLE[1:, 1:] = cls._EXP[log[:, np.newaxis] + log[np.newaxis, :]]
+        DIV_TABLE[1:, 1:] = cls._EXP[(cls.order - 1) + log[:, np.newaxis] - log[np.newaxis, :]]
+
+        cls._MUL_TABLE, cls._DIV_TABLE = MUL_TABLE, DIV_TABLE
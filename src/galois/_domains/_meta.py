@@ -17,6 +17,11 @@ if TYPE_CHECKING:
 
 DTYPES = [np.uint8, np.uint16, np.uint32, np.int8, np.int16, np.int32, np.int64]
 
+# The "jit-table" mode stores full multiplication and division tables with `order^2` elements each. It is the default
+# mode when the tables fit in TABLE_MODE_BYTES, e.g. 128 KB for GF(2^8), and it is supported up to TABLE_MODE_MAX_ORDER.
+TABLE_MODE_BYTES = 2**17
+TABLE_MODE_MAX_ORDER = 2**12
+
 
 class ArrayMeta(abc.ABCMeta):
     """
@@ -40,6 +45,10 @@ class ArrayMeta(abc.ABCMeta):
         if cls._dtypes == [np.object_]:
             cls._default_ufunc_mode = "python-calculate"
             cls._ufunc_modes = ["python-calculate"]
+        elif cls._order <= TABLE_MODE_MAX_ORDER:
+            table_bytes = 2 * cls._order**2 * np.dtype(cls._dtypes[0]).itemsize
+            cls._default_ufunc_mode = "jit-table" if table_bytes <= TABLE_MODE_BYTES else "jit-lookup"
+            cls._ufunc_modes = ["jit-lookup", "jit-calculate", "jit-table"]
         elif cls._order <= 2**20:
             cls._default_ufunc_mode = "jit-lookup"
             cls._ufunc_modes = ["jit-lookup", "jit-calculate"]
@@ -47,6 +56,8 @@ class ArrayMeta(abc.ABCMeta):
             cls._default_ufunc_mode = "jit-calculate"
             cls._ufunc_modes = ["jit-lookup", "jit-calculate"]
         cls._ufunc_mode = None  # This is set in the first call to compile
+        cls._ufunc_parallel = False  # Indicates to use multi-threaded ufuncs on large arrays, set in compile
+        cls._fast_ufuncs = {}  # The ufuncs used by the fast path in `__array_ufunc__()`, reset in each call to compile
 
         cls._name = "Undefined"  # Needs overridden
         cls._is_prime_field = False  # Defaults to False for Galois rings
@@ -56,6 +67,8 @@ class ArrayMeta(abc.ABCMeta):
         cls._LOG = np.array([], dtype=cls._dtypes[-1])
         cls._ZECH_LOG = np.array([], dtype=cls._dtypes[-1])
         cls._ZECH_E = 0
+        cls._MUL_TABLE = np.array([], dtype=cls._dtypes[0])  # The full tables of the "jit-table" mode
+        cls._DIV_TABLE = np.array([], dtype=cls._dtypes[0])
 
         # Class variables needed when displaying elements with fixed width
         cls._element_repr = kwargs.get("repr", "int")  # TODO: Do this here?
@@ -183,7 +196,7 @@ class ArrayMeta(abc.ABCMeta):
         return cls._element_repr
 
     @property
-    def ufunc_mode(cls) -> Literal["jit-lookup", "jit-calculate", "python-calculate"]:
+    def ufunc_mode(cls) -> Literal["jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"]:
         """
         The current compilation mode of the Galois field or Galois ring.
         """
@@ -197,7 +210,9 @@ class ArrayMeta(abc.ABCMeta):
         return cls._ufunc_modes
 
     @property
-    def default_ufunc_mode(cls) -> Literal["jit-lookup", "jit-calculate", "python-calculate"]:
+    def default_ufunc_mode(
+        cls,
+    ) -> Literal["jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"]:
         """
         The default compilation mode of the Galois field or Galois ring.
         """
@@ -0,0 +1,98 @@
+"""
+A module containing field-parametric lookup table arithmetic. Unlike the ufuncs in `_lookup.py`, which freeze a field's
+lookup tables into the JIT-compiled machine code as globals, these functions receive the field's parameters and lookup
+tables as an argument. A JIT function written with them compiles once and serves every field in "jit-lookup" or
+"jit-table" mode.
+
+The `FIELD` argument is the tuple `(CHARACTERISTIC, ORDER, EXP, LOG, ZECH_LOG, ZECH_E)`, see `field_tables()`.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Type
+
+import numba
+
+if TYPE_CHECKING:
+    from ._array import Array
+
+
+def field_tables(field: Type[Array]) -> tuple:
+    """
+    Returns the field parameters and lookup tables passed as the `FIELD` argument of field-parametric functions.
+    """
+    return (field.characteristic, field.order, field._EXP, field._LOG, field._ZECH_LOG, field._ZECH_E)
+
+
+@numba.jit(nopython=True, cache=True)
+def add(a, b, FIELD):  # pragma: no cover
+    """
+    Computes a + b using the Zech log lookup table. See `_lookup.add_ufunc.lookup()`.
+    """
+    _, _, EXP, LOG, ZECH_LOG, ZECH_E = FIELD
+
+    if a == 0:
+        return b
+    if b == 0:
+        return a
+
+    m = LOG[a]
+    n = LOG[b]
+    if m > n:
+        m, n = n, m
+
+    if n - m == ZECH_E:
+        return 0
+
+    return EXP[m + ZECH_LOG[n - m]]
+
+
+@numba.jit(nopython=True, cache=True)
+def subtract(a, b, FIELD):  # pragma: no cover
+    """
+    Computes a - b using the Zech log lookup table. See `_lookup.subtract_ufunc.lookup()`.
+    """
+    _, ORDER, EXP, LOG, ZECH_LOG, ZECH_E = FIELD
+
+    if b == 0:
+        return a
+    if a == 0:
+        return EXP[LOG[b] + ZECH_E]
+
+    m = LOG[a]
+    n = LOG[b] + ZECH_E
+    if m > n:
+        m, n = n, m
+
+    z = n - m
+    if z == ZECH_E:
+        return 0
+    if z >= ORDER - 1:
+        z -= ORDER - 1
+
+    return EXP[m + ZECH_LOG[z]]
+
+
+@numba.jit(nopython=True, cache=True)
+def multiply(a, b, FIELD):  # pragma: no cover
+    """
+    Computes a * b using the log and anti-log lookup tables. See `_lookup.multiply_ufunc.lookup()`.
+    """
+    _, _, EXP, LOG, _, _ = FIELD
+
+    if a == 0 or b == 0:
+        return 0
+
+    return EXP[LOG[a] + LOG[b]]
+
+
+@numba.jit(nopython=True, cache=True)
+def reciprocal(a, FIELD):  # pragma: no cover
+    """
+    Computes 1 / a using the log and anti-log lookup tables. See `_lookup.reciprocal_ufunc.lookup()`.
+    """
+    _, ORDER, EXP, LOG, _, _ = FIELD
+
+    if a == 0:
+        raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
+
+    return EXP[(ORDER - 1) - LOG[a]]
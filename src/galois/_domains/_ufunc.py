@@ -8,12 +8,15 @@ unique explicit calculation algorithms.
 """
 from __future__ import annotations
 
+import types
 from typing import TYPE_CHECKING, Callable, Type
 
 import numba
 import numpy as np
 from typing_extensions import Literal
 
+from .._options import CACHEOPTIONS
+from ._cache import cache_key, cacheable, ignore_uncacheable_warnings
 from ._linalg import matmul_jit
 from ._meta import ArrayMeta
 
@@ -21,6 +24,41 @@ if TYPE_CHECKING:
     from ._array import Array
 
 
+def _unary_wrapper(a):  # pragma: no cover
+    return KERNEL(np.int64(a))  # pylint: disable=undefined-variable
+
+
+def _binary_wrapper(a, b):  # pragma: no cover
+    return KERNEL(np.int64(a), np.int64(b))  # pylint: disable=undefined-variable
+
+
+def function_ufunc(func: Callable, python_ufunc: Callable) -> Callable:
+    """
+    Wraps a function of 1-D arrays with the `__call__()` semantics of a ufunc, including broadcasting and the `out`
+    keyword argument. The `casting` keyword argument is ignored, since the inputs are already verified. Other keyword
+    arguments, like `where`, fall back to the pure-Python ufunc.
+    """
+
+    def wrapper(*inputs, **kwargs):
+        if not set(kwargs) <= {"out", "casting"}:
+            return python_ufunc(*inputs, **kwargs)
+
+        inputs = np.broadcast_arrays(*inputs)
+        output = func(*[np.ravel(x) for x in inputs]).reshape(inputs[0].shape)
+
+        if "out" in kwargs:
+            out = kwargs["out"][0]
+            out[...] = output
+            return out
+
+        if output.ndim == 0:
+            return output[()]  # Like ufuncs, return a scalar for scalar inputs
+
+        return output
+
+    return wrapper
+
+
 class UFunc:
     """
     A ufunc dispatcher for Array objects. The dispatcher will invoke a JIT-compiled or pure-Python ufunc depending
@@ -31,6 +69,12 @@ class UFunc:
 
     _CACHE_CALCULATE = {}  # A cache of compiled ufuncs using explicit calculation
     _CACHE_LOOKUP = {}  # A cache of compiled ufuncs using lookup tables
+    _CACHE_SPLIT_TABLE = {}  # A cache of compiled ufuncs using split multiplication tables
+    _CACHE_TABLE = {}  # A cache of compiled ufuncs using full multiplication and division tables
+    _CACHE_PARALLEL = {}  # A cache of compiled multi-threaded ufuncs
+    _CACHE_KERNEL = {}  # A cache of compiled scalar implementations
+
+    _PARALLEL_THRESHOLD = 2**16  # The minimum array size at which the multi-threaded ufunc is invoked
 
     def __init__(self, field: Type[Array], override=None, always_calculate=False):
         self.field = field
@@ -55,12 +99,36 @@ class UFunc:
         """
         return
 
+    def set_split_table_globals(self):
+        """
+        Sets the global variables used in `split_table()` before JIT compiling it.
+        """
+        return
+
+    def set_table_globals(self):
+        """
+        Sets the global variables used in `table()` before JIT compiling it.
+        """
+        return
+
     calculate: Callable
     """The explicit calculation implementation."""
 
     lookup: Callable
     """The lookup table implementation."""
 
+    split_table: Callable
+    """
+    The split multiplication table implementation. Dispatchers without one use `calculate()` in the `"jit-split-table"`
+    mode, which invokes the split table implementations of the ufuncs it depends on.
+    """
+
+    table: Callable
+    """
+    The full multiplication or division table implementation. Dispatchers without one use `lookup()` in the
+    `"jit-table"` mode.
+    """
+
     ###############################################################################
     # Various ufuncs based on implementation and compilation
     ###############################################################################
@@ -72,8 +140,12 @@ class UFunc:
         """
         if self.field.ufunc_mode == "python-calculate":
             return self.python_calculate
-        if self.field.ufunc_mode == "jit-lookup" and not self.always_calculate:
+        if self.field.ufunc_mode == "jit-table" and hasattr(self, "table"):
+            return self.jit_table
+        if self.field.ufunc_mode in ["jit-lookup", "jit-table"] and not self.always_calculate:
             return self.jit_lookup
+        if self.field.ufunc_mode == "jit-split-table":
+            return self.jit_split_table
         return self.jit_calculate
 
     @property
@@ -89,10 +161,38 @@ class UFunc:
             # Specify `dtype=np.object_` for overridden ufuncs so Python int objects are returned, not np.intc (which
             # will eventually overflow and produce incorrect results).
             return self.python_calculate_call_only
-        if self.field.ufunc_mode == "jit-lookup" and not self.always_calculate:
+        if self.field.ufunc_mode == "jit-table" and hasattr(self, "table"):
+            return self.jit_table
+        if self.field.ufunc_mode in ["jit-lookup", "jit-table"] and not self.always_calculate:
             return self.jit_lookup
+        if self.field.ufunc_mode == "jit-split-table":
+            return self.jit_split_table
         return self.jit_calculate
 
+    def ufunc_for(self, method: str, inputs: tuple) -> Callable:
+        """
+        The ufunc to invoke with the given method and inputs. This is `ufunc`, unless the field was compiled with
+        `parallel=True` and an input is large enough to amortize the cost of dispatching work to the thread pool.
+        """
+        if (
+            self.field._ufunc_parallel
+            and method == "__call__"
+            and max(np.size(input) for input in inputs) >= self._PARALLEL_THRESHOLD
+        ):
+            return self.jit_parallel
+        return self.ufunc
+
+    @property
+    def fast_ufunc(self) -> Callable | None:
+        """
+        The ufunc invoked by the fast path of `UFuncMixin.__array_ufunc__()` for two operands from the same field,
+        or `None` if this dispatcher's `__call__()` must be used instead.
+        """
+        if self.field.ufunc_mode == "python-calculate":
+            # The pure-Python ufuncs must set their globals before each invocation
+            return None
+        return self.ufunc
+
     @property
     def jit_calculate(self) -> numba.types.FunctionType:
         """
@@ -106,13 +206,8 @@ class UFunc:
         self._CACHE_CALCULATE.setdefault(key_1, {})
 
         if key_2 not in self._CACHE_CALCULATE[key_1]:
-            self.set_calculate_globals()  # Set the globals once before JIT compiling the function
-
-            if self.type == "unary":
-                ufunc = numba.vectorize(["int64(int64)"], nopython=True)(self.calculate)
-            else:
-                ufunc = numba.vectorize(["int64(int64, int64)"], nopython=True)(self.calculate)
-            self._CACHE_CALCULATE[key_1][key_2] = ufunc
+            func = self._jit_implementation("jit-calculate")  # Set the globals once before JIT compiling the function
+            self._CACHE_CALCULATE[key_1][key_2] = self._vectorize(func, "jit-calculate")
 
         return self._CACHE_CALCULATE[key_1][key_2]
 
@@ -134,14 +229,175 @@ class UFunc:
             assert self.field._LOG.size > 0
             assert self.field._ZECH_LOG.size > 0
             self.set_lookup_globals()  # Set the globals once before JIT compiling the function
-
-            if self.type == "unary":
-                self._CACHE_LOOKUP[key_1][key_2] = numba.vectorize(["int64(int64)"], nopython=True)(self.lookup)
-            else:
-                self._CACHE_LOOKUP[key_1][key_2] = numba.vectorize(["int64(int64, int64)"], nopython=True)(self.lookup)
+            self._CACHE_LOOKUP[key_1][key_2] = self._vectorize(self.lookup, "jit-lookup")
 
         return self._CACHE_LOOKUP[key_1][key_2]
 
+    @property
+    def jit_split_table(self) -> numba.types.FunctionType:
+        """
+        A JIT-compiled ufunc implemented using split multiplication tables.
+        """
+        if self.override:
+            return self.override
+
+        key_1 = (self.field.characteristic, self.field.degree, int(self.field.irreducible_poly))
+        key_2 = str(self.__class__)
+        self._CACHE_SPLIT_TABLE.setdefault(key_1, {})
+
+        if key_2 not in self._CACHE_SPLIT_TABLE[key_1]:
+            func = self._jit_implementation("jit-split-table")
+            self._CACHE_SPLIT_TABLE[key_1][key_2] = self._vectorize(func, "jit-split-table")
+
+        return self._CACHE_SPLIT_TABLE[key_1][key_2]
+
+    @property
+    def jit_table(self) -> numba.types.FunctionType:
+        """
+        A JIT-compiled ufunc implemented using full multiplication or division tables.
+        """
+        if self.override:
+            return self.override
+
+        key_1 = (self.field.characteristic, self.field.degree, int(self.field.irreducible_poly))
+        key_2 = (str(self.__class__), int(self.field.primitive_element))
+        self._CACHE_TABLE.setdefault(key_1, {})
+
+        if key_2 not in self._CACHE_TABLE[key_1]:
+            # Ensure the full tables were created
+            assert self.field._MUL_TABLE.size > 0
+            assert self.field._DIV_TABLE.size > 0
+            func = self._jit_implementation("jit-table")
+            self._CACHE_TABLE[key_1][key_2] = self._vectorize(func, "jit-table")
+
+        return self._CACHE_TABLE[key_1][key_2]
+
+    @property
+    def jit_parallel(self) -> numba.types.FunctionType:
+        """
+        A multi-threaded JIT-compiled ufunc implemented using lookup tables or explicit calculation, based on the
+        current state of `ufunc_mode`. It only supports the `__call__()` method.
+        """
+        if self.override:
+            return self.override
+
+        mode = self._jit_mode
+        key_1 = (self.field.characteristic, self.field.degree, int(self.field.irreducible_poly))
+        key_2 = (str(self.__class__), int(self.field.primitive_element), mode)
+        self._CACHE_PARALLEL.setdefault(key_1, {})
+
+        if key_2 not in self._CACHE_PARALLEL[key_1]:
+            func = self._jit_implementation(mode)
+            self._CACHE_PARALLEL[key_1][key_2] = self._vectorize(func, mode, target="parallel")
+
+        return self._CACHE_PARALLEL[key_1][key_2]
+
+    @property
+    def jit_kernel(self) -> Callable:
+        """
+        The JIT-compiled scalar implementation over int64, using lookup tables or explicit calculation based on the
+        current state of `ufunc_mode`. Unlike the ufuncs, it may be invoked from other JIT-compiled functions.
+        """
+        if self.override:
+            return self.override
+
+        mode = self._jit_mode
+        key_1 = (self.field.characteristic, self.field.degree, int(self.field.irreducible_poly))
+        key_2 = (str(self.__class__), int(self.field.primitive_element), mode)
+        self._CACHE_KERNEL.setdefault(key_1, {})
+
+        if key_2 not in self._CACHE_KERNEL[key_1]:
+            # The kernel is compiled immediately, so it is not affected by other fields setting the module's globals
+            # later. LLVM inlines the compiled kernel into its callers, which is much faster to compile than inlining
+            # its source with Numba.
+            func = self._jit_implementation(mode)
+            with ignore_uncacheable_warnings():
+                kernel = numba.jit(self._signatures("int64"), nopython=True, cache=CACHEOPTIONS["jit"])
+                self._CACHE_KERNEL[key_1][key_2] = kernel(self._cacheable(func, mode))
+
+        return self._CACHE_KERNEL[key_1][key_2]
+
+    @property
+    def _jit_mode(self) -> Literal["jit-lookup", "jit-calculate", "jit-split-table", "jit-table"]:
+        if self.field.ufunc_mode == "jit-table" and hasattr(self, "table"):
+            return "jit-table"
+        if self.field.ufunc_mode in ["jit-lookup", "jit-table"] and not self.always_calculate:
+            return "jit-lookup"
+        if self.field.ufunc_mode == "jit-split-table":
+            return "jit-split-table"
+        return "jit-calculate"
+
+    def _jit_implementation(
+        self, mode: Literal["jit-lookup", "jit-calculate", "jit-split-table", "jit-table"]
+    ) -> Callable:
+        """
+        Sets the global variables and returns the implementation to JIT compile for the given mode.
+        """
+        if mode == "jit-table":
+            self.set_table_globals()
+            return self.table
+        if mode == "jit-lookup":
+            self.set_lookup_globals()
+            return self.lookup
+        if mode == "jit-split-table" and hasattr(self, "split_table"):
+            self.set_split_table_globals()
+            return self.split_table
+        self.set_calculate_globals()
+        return self.calculate
+
+    def _signatures(self, dtype: np.dtype) -> list[str]:
+        """
+        Returns the Numba signatures of the JIT-compiled ufunc's loops over the given dtype.
+        """
+        if self.type == "unary":
+            return [f"{dtype}({dtype})"]
+        return [f"{dtype}({dtype}, {dtype})"]
+
+    def _vectorize(self, func: Callable, mode: str, target: Literal["cpu", "parallel"] = "cpu") -> np.ufunc:
+        """
+        JIT compiles the scalar implementation into a ufunc. The implementation is compiled once for int64. If the
+        field's smallest dtype is an unsigned integer, a loop over that dtype is added. Arrays with the field's
+        default dtype are then operated on directly, rather than being converted to int64 and back.
+
+        The `"parallel"` target splits each invocation's elements across Numba's thread pool.
+        """
+        signatures = self._signatures("int64")
+        dtype = np.dtype(self.field.dtypes[0])
+        if dtype in [np.uint8, np.uint16, np.uint32]:
+            # The narrow loop must be listed first so NumPy selects it for arrays of that dtype
+            signatures = self._signatures(dtype.name) + signatures
+
+        with ignore_uncacheable_warnings():
+            kernel = numba.jit(nopython=True, cache=CACHEOPTIONS["jit"])(self._cacheable(func, mode))
+            # Each loop converts its inputs to int64 in registers and invokes the same int64 implementation. This
+            # guarantees identical arithmetic in every loop, without Numba's mixed signed/unsigned type promotion.
+            wrapper = _unary_wrapper if self.type == "unary" else _binary_wrapper
+            # The copy keeps the module's globals, so Numba can locate its module when loading it from the disk cache
+            wrapper = types.FunctionType(wrapper.__code__, {**wrapper.__globals__, "KERNEL": kernel}, wrapper.__name__)
+            ufunc = numba.vectorize(signatures, target=target, nopython=True, cache=CACHEOPTIONS["jit"])(
+                self._cacheable(wrapper, mode if target == "cpu" else f"{mode}-{target}")
+            )
+
+        return ufunc
+
+    def _cacheable(self, func: Callable, mode: str) -> Callable:
+        """
+        Returns the implementation to JIT compile. If on-disk caching is enabled, the implementation is copied with a
+        name unique to this field, ufunc, and compilation mode.
+        """
+        if not CACHEOPTIONS["jit"]:
+            return func
+
+        key = cache_key(
+            self.field.characteristic,
+            self.field.degree,
+            int(self.field.irreducible_poly),
+            int(self.field.primitive_element),
+            str(self.__class__),
+            mode,
+        )
+        return cacheable(func, key)
+
     @property
     def python_calculate(self) -> Callable:
         """
@@ -320,10 +576,10 @@ class UFunc:
         return v_inputs, kwargs
 
     def _view_output_as_field(self, output, field, dtype):
-        if isinstance(type(output), field):
+        if isinstance(output, field):
             return output
         if isinstance(output, np.ndarray):
-            return field._view(output.astype(dtype))
+            return field._view(output.astype(dtype, copy=False))
         if output is None:
             return None
         return field(output, dtype=dtype)
@@ -345,7 +601,7 @@ class add_ufunc(UFunc):
     def __call__(self, ufunc, method, inputs, kwargs, meta):
         self._verify_operands_in_same_field(ufunc, inputs, meta)
         inputs, kwargs = self._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(self.ufunc, method)(*inputs, **kwargs)
+        output = getattr(self.ufunc_for(method, inputs), method)(*inputs, **kwargs)
         output = self._view_output_as_field(output, self.field, meta["dtype"])
         return output
 
@@ -360,7 +616,7 @@ class negative_ufunc(UFunc):
     def __call__(self, ufunc, method, inputs, kwargs, meta):
         self._verify_unary_method_not_reduction(ufunc, method)
         inputs, kwargs = self._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(self.ufunc, method)(*inputs, **kwargs)
+        output = getattr(self.ufunc_for(method, inputs), method)(*inputs, **kwargs)
         output = self._view_output_as_field(output, self.field, meta["dtype"])
         return output
 
@@ -375,7 +631,7 @@ class subtract_ufunc(UFunc):
     def __call__(self, ufunc, method, inputs, kwargs, meta):
         self._verify_operands_in_same_field(ufunc, inputs, meta)
         inputs, kwargs = self._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(self.ufunc, method)(*inputs, **kwargs)
+        output = getattr(self.ufunc_for(method, inputs), method)(*inputs, **kwargs)
         output = self._view_output_as_field(output, self.field, meta["dtype"])
         return output
 
@@ -395,7 +651,7 @@ class multiply_ufunc(UFunc):
             i = meta["non_field_operands"][0]  # Scalar multiplicand
             inputs[i] = np.mod(inputs[i], self.field.characteristic)
         inputs, kwargs = self._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(self.ufunc, method)(*inputs, **kwargs)
+        output = getattr(self.ufunc_for(method, inputs), method)(*inputs, **kwargs)
         output = self._view_output_as_field(output, self.field, meta["dtype"])
         return output
 
@@ -410,7 +666,7 @@ class reciprocal_ufunc(UFunc):
     def __call__(self, ufunc, method, inputs, kwargs, meta):
         self._verify_unary_method_not_reduction(ufunc, method)
         inputs, kwargs = self._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(self.ufunc, method)(*inputs, **kwargs)
+        output = getattr(self.ufunc_for(method, inputs), method)(*inputs, **kwargs)
         output = self._view_output_as_field(output, self.field, meta["dtype"])
         return output
 
@@ -422,16 +678,27 @@ class divide_ufunc(UFunc):
 
     type = "binary"
 
+    @property
+    def fast_ufunc(self) -> Callable | None:
+        if self.field.ufunc_mode not in ["jit-lookup", "jit-table"]:
+            # Multiplying by the reciprocal is more efficient than explicitly calculating each quotient
+            return None
+        return super().fast_ufunc
+
     def __call__(self, ufunc, method, inputs, kwargs, meta):
         self._verify_operands_in_same_field(ufunc, inputs, meta)
         inputs, kwargs = self._view_inputs_as_ndarray(inputs, kwargs)
-        if method == "__call__":
+        if method == "__call__" and "out" not in kwargs:
             # When dividing two arrays, instead multiply by the reciprocal. This is vastly
             # more efficient when the denominator is a scalar or smaller (broadcasted) array.
-            inputs[1] = getattr(self.field._reciprocal.ufunc, "__call__")(inputs[1])
-            output = getattr(self.field._multiply.ufunc, method)(*inputs, **kwargs)
+            inputs[1] = getattr(self.field._reciprocal.ufunc_for("__call__", inputs[1:]), "__call__")(inputs[1])
+            output = getattr(self.field._multiply.ufunc_for(method, inputs), method)(*inputs, **kwargs)
+        elif method == "__call__" and not np.may_share_memory(kwargs["out"][0], inputs[0]):
+            # Store the reciprocal of the denominator in the output array, then multiply by it in-place
+            output = getattr(self.field._reciprocal.ufunc_for("__call__", inputs[1:]), "__call__")(inputs[1], **kwargs)
+            output = getattr(self.field._multiply.ufunc_for(method, inputs), method)(inputs[0], output, **kwargs)
         else:
-            output = getattr(self.ufunc, method)(*inputs, **kwargs)
+            output = getattr(self.ufunc_for(method, inputs), method)(*inputs, **kwargs)
         output = self._view_output_as_field(output, self.field, meta["dtype"])
         return output
 
@@ -446,8 +713,13 @@ class divmod_ufunc(UFunc):
     type = "binary"
 
     def __call__(self, ufunc, method, inputs, kwargs, meta):
-        q = getattr(np.divide, method)(*inputs, **kwargs)
-        r = self.field.Zeros(q.shape, dtype=meta["dtype"])
+        out = kwargs.pop("out", (None, None))
+        q = getattr(np.divide, method)(*inputs, out=out[0], **kwargs)
+        if out[1] is None:
+            r = self.field.Zeros(q.shape, dtype=meta["dtype"])
+        else:
+            r = out[1]
+            r[...] = 0
         output = q, r
         return output
 
@@ -463,6 +735,11 @@ class remainder_ufunc(UFunc):
     type = "binary"
 
     def __call__(self, ufunc, method, inputs, kwargs, meta):
+        if "out" in kwargs:
+            output = kwargs["out"][0]
+            output[...] = 0
+            return output
+
         # Perform dummy addition operation to get shape of output zeros
         x = getattr(np.add, method)(*inputs, **kwargs)
         output = self.field.Zeros(x.shape, dtype=meta["dtype"])
@@ -476,11 +753,15 @@ class power_ufunc(UFunc):
 
     type = "binary"
 
+    def _signatures(self, dtype: np.dtype) -> list[str]:
+        # The exponent is always an integer
+        return [f"{dtype}({dtype}, int64)"]
+
     def __call__(self, ufunc, method, inputs, kwargs, meta):
         self._verify_binary_method_not_reduction(ufunc, method)
         self._verify_operands_first_field_second_int(ufunc, inputs, meta)
         inputs, kwargs = self._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(self.ufunc, method)(*inputs, **kwargs)
+        output = getattr(self.ufunc_for(method, inputs), method)(*inputs, **kwargs)
         output = self._view_output_as_field(output, self.field, meta["dtype"])
         return output
 
@@ -498,7 +779,7 @@ class square_ufunc(UFunc):
         self._verify_unary_method_not_reduction(ufunc, method)
         inputs = list(inputs) + [2]
         inputs, kwargs = self._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(self.field._power.ufunc, method)(*inputs, **kwargs)
+        output = getattr(self.field._power.ufunc_for(method, inputs), method)(*inputs, **kwargs)
         output = self._view_output_as_field(output, self.field, meta["dtype"])
         return output
 
@@ -510,13 +791,26 @@ class log_ufunc(UFunc):
 
     type = "binary"
 
+    def _signatures(self, dtype: np.dtype) -> list[str]:
+        # The logarithm is an integer and the base is always the primitive element
+        return [f"int64({dtype}, int64)"]
+
     def __call__(self, ufunc, method, inputs, kwargs, meta):  # pylint: disable=unused-argument
         self._verify_method_only_call(ufunc, method)
         inputs = list(inputs) + [int(self.field.primitive_element)]
         inputs, kwargs = self._view_inputs_as_ndarray(inputs, kwargs)
-        output = getattr(self.ufunc, method)(*inputs, **kwargs)
+        output = getattr(self.ufunc_for(method, inputs), method)(*inputs, **kwargs)
         return output
 
+    @property
+    def calculate_ufunc(self) -> Callable:
+        """
+        A ufunc implemented using explicit calculation, for any base.
+        """
+        if self.field.ufunc_mode == "python-calculate":
+            return self.python_calculate
+        return self.jit_calculate
+
 
 class sqrt_ufunc(UFunc):
     """
@@ -527,7 +821,11 @@ class sqrt_ufunc(UFunc):
 
     def __call__(self, ufunc, method, inputs, kwargs, meta):  # pylint: disable=unused-argument
         self._verify_method_only_call(ufunc, method)
-        return self.implementation(*inputs)
+        output = self.implementation(*inputs)
+        if "out" in kwargs:
+            kwargs["out"][0][...] = output
+            output = kwargs["out"][0]
+        return output
 
     def implementation(self, a: Array) -> Array:
         """
@@ -606,6 +904,8 @@ class UFuncMixin(np.ndarray, metaclass=ArrayMeta):
         np.positive,
     ]
 
+    _FAST_UFUNCS = [np.add, np.subtract, np.multiply, np.floor_divide, np.true_divide]
+
     _OVERRIDDEN_UFUNCS = {
         np.add: "_add",
         np.negative: "_negative",
@@ -655,6 +955,20 @@ class UFuncMixin(np.ndarray, metaclass=ArrayMeta):
         Override the standard NumPy ufunc calls with the new finite field ufuncs.
         """
         field = type(self)
+        out = kwargs.get("out", None)  # The output arrays, if the ufunc is invoked in-place
+
+        if (
+            method == "__call__"
+            and len(inputs) == 2
+            and type(inputs[0]) is field
+            and type(inputs[1]) is field
+            and ufunc in field._FAST_UFUNCS
+            and (not kwargs or (out is not None and len(kwargs) == 1 and len(out) == 1 and type(out[0]) is field))
+        ):
+            # A fast path for the common case of two operands from the same field, including augmented assignment
+            output = field._fast_ufunc_call(ufunc, inputs[0], inputs[1], None if out is None else out[0])
+            if output is not None:
+                return output
 
         meta = {}
         meta["types"] = [type(inputs[i]) for i in range(len(inputs))]
@@ -679,7 +993,12 @@ class UFuncMixin(np.ndarray, metaclass=ArrayMeta):
             if method in ["reduce"]:
                 kwargs["dtype"] = field.dtypes[-1]
 
-            return getattr(field, field._OVERRIDDEN_UFUNCS[ufunc])(ufunc, method, inputs, kwargs, meta)
+            output = getattr(field, field._OVERRIDDEN_UFUNCS[ufunc])(ufunc, method, inputs, kwargs, meta)
+            if out is not None:
+                # The dispatchers write into (views of) the output arrays. Return the output arrays themselves so
+                # augmented assignment, e.g. `x += y`, does not rebind `x` to a new array.
+                return out[0] if len(out) == 1 else out
+            return output
 
         if ufunc in field._UNSUPPORTED_UFUNCS:
             raise NotImplementedError(
@@ -700,11 +1019,47 @@ class UFuncMixin(np.ndarray, metaclass=ArrayMeta):
         inputs, kwargs = UFunc(field)._view_inputs_as_ndarray(inputs, kwargs)
         output = super().__array_ufunc__(ufunc, method, *inputs, **kwargs)  # pylint: disable=no-member
 
+        if out is not None:
+            return out[0] if len(out) == 1 else out
+
         if ufunc in field._UFUNCS_REQUIRING_VIEW and output is not None:
             output = field._view(output) if not np.isscalar(output) else field(output, dtype=self.dtype)
 
         return output
 
+    @classmethod
+    def _fast_ufunc_call(cls, ufunc, a: Array, b: Array, out: Array | None = None) -> Array | None:
+        """
+        Invokes the ufunc on two arrays from this field with minimal overhead, optionally writing the result into the
+        output array. Returns `None` if the ufunc dispatcher does not support the fast path.
+        """
+        if cls._ufunc_parallel and max(a.size, b.size) >= UFunc._PARALLEL_THRESHOLD:
+            # Large arrays are dispatched to the multi-threaded ufuncs
+            return None
+
+        try:
+            fast_ufunc = cls._fast_ufuncs[ufunc]
+        except KeyError:
+            fast_ufunc = getattr(cls, cls._OVERRIDDEN_UFUNCS[ufunc]).fast_ufunc
+            # Invoke the NumPy ufunc underlying a Numba dynamic ufunc directly, avoiding its Python-level dispatch
+            fast_ufunc = getattr(fast_ufunc, "ufunc", fast_ufunc)
+            cls._fast_ufuncs[ufunc] = fast_ufunc
+        if fast_ufunc is None:
+            return None
+
+        if out is not None:
+            fast_ufunc(a.view(np.ndarray), b.view(np.ndarray), out=out.view(np.ndarray), casting="unsafe")
+            return out
+
+        dtype = a.dtype
+        output = fast_ufunc(a.view(np.ndarray), b.view(np.ndarray), casting="unsafe")
+        if isinstance(output, np.ndarray):
+            output = output.astype(dtype, copy=False)
+        else:
+            output = np.array(output, dtype=dtype)
+
+        return cls._view(output)
+
     def __pow__(self, other):
         # We call power here instead of `super().__pow__(other)` because when doing so `x ** GF(2)` will invoke
         # `np.square(x)` and not throw a TypeError. This way `np.power(x, GF(2))` is called which correctly checks
@@ -2,6 +2,7 @@
 A subpackage containing arrays over Galois fields.
 """
 from ._array import *
+from ._element import *
 from ._factory import *
 from ._gf2 import *
 from ._primitive_element import *
@@ -8,12 +8,14 @@ from typing import Generator
 import numpy as np
 from typing_extensions import Literal, Self
 
-from .._domains import Array, _linalg
+from .._domains import Array, _calculate, _linalg
+from .._domains._lazy import Expression
 from .._helper import export, extend_docstring, verify_isinstance, verify_literal
 from .._polys import Poly
 from .._polys._conversions import integer_to_poly, poly_to_str, str_to_integer
-from .._prime import divisors
 from ..typing import ArrayLike, DTypeLike, ElementLike, IterableLike, ShapeLike
+from . import _region
+from ._element import FieldElement
 from ._meta import FieldArrayMeta
 
 DOCSTRING_MAP = {
@@ -134,7 +136,7 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
                 # Ensure that in "large" fields with dtype=object that FieldArray objects aren't assigned to the array.
                 # The arithmetic functions are designed to operate on Python ints.
                 x = int(x)
-        elif isinstance(x, str):
+        elif isinstance(x, (str, FieldElement)):
             x = cls._convert_to_element(x)
             cls._verify_scalar_value(x)
         elif isinstance(x, (list, tuple)):
@@ -185,7 +187,7 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
             element = int(element)
         elif isinstance(element, str):
             element = str_to_integer(element, cls.prime_subfield)
-        elif isinstance(element, FieldArray):
+        elif isinstance(element, (FieldArray, FieldElement)):
             element = int(element)
         else:
             raise TypeError(f"Valid element-like values are integers and string, not {type(element)}.")
@@ -422,8 +424,20 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
                 f"The last dimension of `array` must be the field extension dimension {cls.degree}, not {x.shape[-1]}."
             )
 
-        degrees = np.arange(degree - 1, -1, -1, dtype=dtype)
-        y = np.sum(x * order**degrees, axis=-1, dtype=dtype)
+        if dtype == np.object_:
+            degrees = np.arange(degree - 1, -1, -1, dtype=dtype)
+            y = np.sum(x * order**degrees, axis=-1, dtype=dtype)
+        elif order == 2:
+            # The vectors are the bits of the integer representation, so they are packed into big-endian bytes
+            nbytes = np.dtype(dtype).itemsize
+            bits = x.reshape(-1, degree)
+            if degree < 8 * nbytes:
+                zeros = np.zeros((bits.shape[0], 8 * nbytes - degree), dtype=bits.dtype)
+                bits = np.concatenate((zeros, bits), axis=-1)
+            y = np.packbits(bits.reshape(-1)).view(f">u{nbytes}").astype(dtype, copy=False).reshape(x.shape[:-1])
+        else:
+            y = _calculate.vectors_to_ints(x.reshape(-1, degree).astype(np.int64), order, degree)
+            y = y.astype(dtype).reshape(x.shape[:-1])
 
         if np.isscalar(y):
             y = cls(y, dtype=dtype)
@@ -471,29 +485,108 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
 
         x = np.array(self)  # The original array as an integer array
         shape = list(self.shape) + [degree]  # The new shape
-        y = subfield.Zeros(shape, dtype=dtype)
 
         if self.dtype == np.object_:
             # Need a separate "if" statement because divmod() does not work with dtype=object input and
             # integer dtype outputs
+            y = subfield.Zeros(shape, dtype=dtype)
             for i in range(degree - 1, -1, -1):
                 q, r = x // order, x % order
                 y[..., i] = r
                 x = q
+        elif order == 2:
+            # The vectors are the bits of the integer representation, so they are unpacked from its big-endian bytes
+            dtype = subfield._get_dtype(dtype)
+            nbytes = x.dtype.itemsize
+            x = np.ascontiguousarray(x.reshape(-1), dtype=f">u{nbytes}").view(np.uint8)
+            bits = np.unpackbits(x).reshape(-1, 8 * nbytes)[:, 8 * nbytes - degree :]
+            y = subfield._view(bits.astype(dtype, copy=False).reshape(shape))
         else:
-            for i in range(degree - 1, -1, -1):
-                q, r = divmod(x, order)
-                y[..., i] = r
-                x = q
+            dtype = subfield._get_dtype(dtype)
+            y = _calculate.ints_to_vectors(x.reshape(-1).astype(np.int64), order, degree)
+            y = subfield._view(y.astype(dtype).reshape(shape))
 
         return y
 
+    def to_elements(self) -> FieldElement | list:
+        r"""
+        Converts the array to lightweight scalar elements.
+
+        Returns:
+            A :obj:`~galois.FieldElement` for a 0-D array, otherwise a nested list of :obj:`~galois.FieldElement`
+            objects with the same shape as the array.
+
+        Notes:
+            Scalar arithmetic on :obj:`~galois.FieldElement` objects avoids the overhead of NumPy ufuncs, so it is
+            much faster than indexing an array in a Python loop. The elements are converted back to an array
+            by passing them to the :obj:`~galois.FieldArray` subclass.
+
+        Examples:
+            .. ipython:: python
+
+                GF = galois.GF(3**5)
+                x = GF([10, 20, 30]).to_elements(); x
+                x[0] * x[1] + x[2]
+                GF(x)
+
+        Group:
+            Conversions
+
+        Order:
+            21
+        """
+        new = type(self).Element._new
+
+        def convert(x):
+            return [convert(xi) for xi in x] if isinstance(x, list) else new(x)
+
+        return convert(self.view(np.ndarray).tolist())
+
+    def lazy(self) -> Expression:
+        r"""
+        Returns a lazily-evaluated expression of the array for fused arithmetic.
+
+        Returns:
+            An expression that records, rather than computes, the arithmetic operations applied to it. The
+            expression is computed by calling its `evaluate()` method.
+
+        Notes:
+            Evaluating an arithmetic expression, such as `a * b + c * d - e`, normally invokes one ufunc per operator
+            and allocates a full-size temporary array for each intermediate result. The expression tree returned by
+            this method supports the `+`, `-`, `*`, `/`, and `**` operators with arrays and expressions from the same
+            field. Its `evaluate()` method JIT compiles the entire tree into a single ufunc, which computes each output
+            element without intermediate arrays. The compiled ufunc is cached and reused for expressions with the
+            same structure.
+
+            Fields with :obj:`ufunc_mode` `"python-calculate"` evaluate each operation in turn.
+
+        Examples:
+            .. ipython:: python
+
+                GF = galois.GF(3**5)
+                a, b, c, d, e = GF.Random((5, 4), seed=1)
+                z = a.lazy() * b + c * d - e; z
+                z.evaluate()
+                np.array_equal(z.evaluate(), a * b + c * d - e)
+
+        Group:
+            Arithmetic compilation
+
+        Order:
+            33
+        """
+        return Expression._leaf(type(self), self)
+
     ###############################################################################
     # Class methods
     ###############################################################################
 
     @classmethod
-    def compile(cls, mode: Literal["auto", "jit-lookup", "jit-calculate", "python-calculate"]):
+    def compile(
+        cls,
+        mode: Literal["auto", "jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"],
+        parallel: bool = False,
+    ):
         """
         Recompile the just-in-time compiled ufuncs for a new calculation mode.
 
@@ -502,18 +595,34 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
         Arguments:
             mode: The ufunc calculation mode.
 
-                - `"auto"`: Selects `"jit-lookup"` for fields with order less than :math:`2^{20}`, `"jit-calculate"`
-                  for larger fields, and `"python-calculate"` for fields whose elements cannot be represented with
-                  :obj:`numpy.int64`.
+                - `"auto"`: Selects `"jit-table"` for fields whose multiplication and division tables use at most
+                  128 KB, `"jit-lookup"` for other fields with order less than :math:`2^{20}`, `"jit-split-table"`
+                  for larger binary extension fields, `"jit-calculate"` for other larger fields, and
+                  `"python-calculate"` for fields whose elements cannot be represented with :obj:`numpy.int64`.
                 - `"jit-lookup"`: JIT compiles arithmetic ufuncs to use Zech log, log, and anti-log lookup tables for
                   efficient computation. In the few cases where explicit calculation is faster than table lookup,
                   explicit calculation is used.
                 - `"jit-calculate"`: JIT compiles arithmetic ufuncs to use explicit calculation. The `"jit-calculate"`
                   mode is designed for large fields that cannot or should not store lookup tables in RAM. Generally,
                   the `"jit-calculate"` mode is slower than `"jit-lookup"`.
+                - `"jit-split-table"`: JIT compiles arithmetic ufuncs to use explicit calculation, except that
+                  multiplication uses small split tables. For each product, the multiples of one operand by every
+                  4-bit polynomial are tabulated, and the other operand is processed 4 bits at a time with a
+                  table-driven reduction modulo the irreducible polynomial. This is only supported for binary extension
+                  fields with order greater than :math:`2^{20}`, for which it is several times faster than
+                  `"jit-calculate"`.
+                - `"jit-table"`: JIT compiles arithmetic ufuncs to use full multiplication and division tables with
+                  :math:`p^{2m}` entries each, so multiplication and division are a single table lookup. The other
+                  arithmetic is the same as `"jit-lookup"`. This is only supported for fields with order at most
+                  :math:`2^{12}`.
                 - `"python-calculate"`: Uses pure-Python ufuncs with explicit calculation. This is reserved for fields
                   whose elements cannot be represented with :obj:`numpy.int64` and instead use :obj:`numpy.object_`
                   with Python :obj:`int` (which has arbitrary precision).
+            parallel: Indicates whether to use multi-threaded JIT-compiled ufuncs for element-wise arithmetic on large
+                arrays. When enabled, arithmetic on arrays with at least :math:`2^{16}` elements is split across
+                Numba's thread pool, whose size may be set with :func:`numba.set_num_threads`. Smaller arrays and
+                reductions still use the single-threaded ufuncs. This is only supported for the JIT-compiled modes.
+                The default is `False`.
 
         Group:
             Arithmetic compilation
@@ -521,7 +630,7 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
         Order:
             33
         """
-        return super().compile(mode)
+        return super().compile(mode, parallel=parallel)
 
     @classmethod
     def repr(cls, element_repr: Literal["int", "poly", "power"] = "int") -> Generator[None, None, None]:
@@ -956,6 +1065,218 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
 
         return roots
 
+    @classmethod
+    def multiply_region(
+        cls,
+        c: ElementLike,
+        x: ElementLike | ArrayLike | bytes | bytearray | memoryview,
+        out: Self | bytearray | memoryview | None = None,
+    ) -> Self | bytearray | memoryview:
+        r"""
+        Multiplies a region of field elements by a single constant.
+
+        Arguments:
+            c: The constant :math:`c`, a scalar field element.
+            x: The region of field elements :math:`x`. For fields with order at most 256, such as
+                :math:`\mathrm{GF}(2^8)`, this may also be a `bytes`-like object with one element per byte. It is
+                read without a conversion copy.
+            out: An optional output for the products, with the same shape as :math:`x`. For fields with order at most
+                256, this may also be a writable `bytes`-like object, like a `bytearray` or `memoryview`, with one
+                element per byte. The default is `None`, which allocates a new array.
+
+        Returns:
+            The products :math:`c \cdot x`. If `out` is provided, it is returned.
+
+        Notes:
+            This is equivalent to `c * x`. However, the products of :math:`c` with every field element are computed
+            once and each element of :math:`x` is multiplied with a single table lookup. For binary extension fields
+            with order greater than :math:`2^{16}`, multiplication by :math:`c` is linear over :math:`\mathrm{GF}(2)`,
+            so :math:`c \cdot x` is computed from tables of the products of :math:`c` with each byte of :math:`x`.
+            This is efficient for the large regions of erasure coding and Reed-Solomon encoding.
+
+        Examples:
+            Multiply an array by a constant in :math:`\mathrm{GF}(2^8)`.
+
+            .. ipython:: python
+
+                GF = galois.GF(2**8)
+                x = GF.Random(6, seed=1); x
+                GF.multiply_region(3, x)
+                GF(3) * x
+
+            Multiply a buffer of bytes by a constant in-place.
+
+            .. ipython:: python
+
+                buffer = bytearray(b"galois")
+                GF.multiply_region(3, buffer, out=buffer)
+                bytes(buffer)
+
+        Group:
+            Arithmetic
+        """
+        c = cls(c)
+        if not c.ndim == 0:
+            raise ValueError(f"Argument 'c' must be a scalar, not an array with shape {c.shape}.")
+
+        if isinstance(x, (bytes, bytearray, memoryview)):
+            x = cls._frombuffer(x, "x")
+        elif isinstance(x, cls):
+            x = x.view(np.ndarray)
+        elif isinstance(x, FieldArray):
+            raise TypeError(f"Argument 'x' must be an array over {cls.name}, not {type(x).name}.")
+        else:
+            x = cls(x).view(np.ndarray)
+
+        return_value = out
+        if out is None:
+            out = np.empty_like(x)
+            return_value = cls._view(out)
+        elif isinstance(out, (bytearray, memoryview)):
+            out = cls._frombuffer(out, "out")
+            if not out.size == x.size:
+                raise ValueError(f"Argument 'out' must have the same size as 'x', {out.size} != {x.size}.")
+            out = out.reshape(x.shape)
+        elif isinstance(out, cls):
+            out = out.view(np.ndarray)
+            if not out.shape == x.shape:
+                raise ValueError(f"Argument 'out' must have the same shape as 'x', {out.shape} != {x.shape}.")
+        else:
+            raise TypeError(f"Argument 'out' must be an array over {cls.name} or a writable buffer, not {type(out)}.")
+        if not out.flags.writeable:
+            raise ValueError("Argument 'out' must be writable.")
+
+        tables = _region.constant_tables(cls, int(c))
+        if tables is None or x.size < tables.size:
+            # The tables are not supported or building them would cost more than the multiplications
+            out[...] = np.multiply(c, cls._view(x))
+        else:
+            kernel = _region.multiply_table if tables.ndim == 1 else _region.multiply_split_tables
+            if out.flags.c_contiguous:
+                kernel(tables, np.ravel(x), out.reshape(-1))
+            else:
+                y = np.empty(x.size, dtype=out.dtype)
+                kernel(tables, np.ravel(x), y)
+                out[...] = y.reshape(x.shape)
+
+        return return_value
+
+    @classmethod
+    def axpy(cls, c: ElementLike, x: ElementLike | ArrayLike, y: Self) -> Self:
+        r"""
+        Computes the fused multiply-accumulate :math:`y \mathrel{+}= c \cdot x` in-place.
+
+        Arguments:
+            c: The constant :math:`c`, a scalar field element.
+            x: The array of field elements :math:`x`, with the same shape as :math:`y`.
+            y: The array of field elements :math:`y`, which is updated in-place.
+
+        Returns:
+            The updated array :math:`y`.
+
+        Notes:
+            This is equivalent to `y += c * x`. However, the products are accumulated into :math:`y` in a single
+            JIT-compiled loop without intermediate arrays. For fields with order at most :math:`2^{16}`, the products
+            of :math:`c` with every field element are tabulated once, so each element of :math:`x` is multiplied with
+            a single table lookup.
+
+        Examples:
+            .. ipython:: python
+
+                GF = galois.GF(3**5)
+                x = GF.Random(6, seed=1); x
+                y = GF.Random(6, seed=2); y
+                y + 4 * x
+                GF.axpy(4, x, y); y
+
+        Group:
+            Arithmetic
+        """
+        c = cls(c)
+        if not c.ndim == 0:
+            raise ValueError(f"Argument 'c' must be a scalar, not an array with shape {c.shape}.")
+        y = cls._verify_accumulator(y)
+        x = cls(x)
+        if not x.shape == y.shape:
+            raise ValueError(f"Argument 'x' must have the same shape as 'y', {x.shape} != {y.shape}.")
+
+        Y = y.reshape(1, -1)  # A view, unless 'y' is not contiguous
+        _linalg.axpy_jit(cls)(c.reshape(1), x.reshape(-1), Y)
+        if not np.shares_memory(Y, y):
+            y[...] = Y.reshape(y.shape)
+
+        return y
+
+    @classmethod
+    def multi_axpy(cls, c: ArrayLike, X: ArrayLike, y: Self) -> Self:
+        r"""
+        Computes the fused multi-source multiply-accumulate :math:`y \mathrel{+}= \sum_{i=0}^{k-1} c_i X_i` in-place.
+
+        Arguments:
+            c: The 1-D array of :math:`k` constants :math:`c_i`.
+            X: The array of :math:`k` sources :math:`X_i`, with shape `(k, *y.shape)`.
+            y: The array of field elements :math:`y`, which is updated in-place.
+
+        Returns:
+            The updated array :math:`y`.
+
+        Notes:
+            This is equivalent to `y += np.tensordot(c, X, axes=1)`. However, the products are accumulated into
+            :math:`y` in a single JIT-compiled loop without intermediate arrays. Each block of :math:`y` is updated
+            by every source while it is in cache. This is the encoding step of erasure codes, where each parity
+            region is a linear combination of the data regions.
+
+        Examples:
+            .. ipython:: python
+
+                GF = galois.GF(2**8)
+                X = GF.Random((3, 6), seed=1); X
+                y = GF.Zeros(6)
+                GF.multi_axpy([1, 2, 3], X, y); y
+                GF([1, 2, 3]) @ X
+
+        Group:
+            Arithmetic
+        """
+        c = cls(c)
+        if not c.ndim == 1:
+            raise ValueError(f"Argument 'c' must be a 1-D array, not have shape {c.shape}.")
+        y = cls._verify_accumulator(y)
+        X = cls(X)
+        if not X.shape == (c.size, *y.shape):
+            raise ValueError(f"Argument 'X' must have shape {(c.size, *y.shape)}, not {X.shape}.")
+
+        y_flat = y.reshape(-1)  # A view, unless 'y' is not contiguous
+        _linalg.multi_axpy_jit(cls)(c, X.reshape(c.size, -1), y_flat)
+        if not np.shares_memory(y_flat, y):
+            y[...] = y_flat.reshape(y.shape)
+
+        return y
+
+    @classmethod
+    def _verify_accumulator(cls, y: Self) -> Self:
+        """
+        Verifies that the array may be updated in-place by a multiply-accumulate.
+        """
+        verify_isinstance(y, cls)
+        if not y.flags.writeable:
+            raise ValueError("Argument 'y' must be writable.")
+        return y
+
+    @classmethod
+    def _frombuffer(cls, buffer: bytes | bytearray | memoryview, name: str) -> np.ndarray:
+        """
+        Views a bytes-like object as a 1-D array of field elements, one per byte, without copying it.
+        """
+        if cls.order > 2**8:
+            raise TypeError(
+                f"Argument {name!r} may only be a bytes-like object for fields with order at most 256, not {cls.name}."
+            )
+        array = np.frombuffer(buffer, dtype=np.uint8)
+        if cls.order < 2**8 and array.size > 0 and not array.max() < cls.order:
+            raise ValueError(f"Argument {name!r} has bytes that are not elements of {cls.name}.")
+        return array
+
     ###############################################################################
     # Instance methods
     ###############################################################################
@@ -1038,7 +1359,7 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
         x = self
         field = type(self)
 
-        if field.ufunc_mode == "jit-lookup":
+        if field.ufunc_mode in ["jit-lookup", "jit-table"]:
             # This algorithm is faster if np.log() has a lookup table
             # β = α^k
             # ord(α) = p^m - 1
@@ -1046,10 +1367,10 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
             k = np.log(x)  # x as an exponent of α
             order = (field.order - 1) // np.gcd(field.order - 1, k)
         else:
-            d = np.array(divisors(field.order - 1))  # Divisors d such that d | p^m - 1
-            y = np.power.outer(x, d)  # x^d -- the first divisor d for which x^d == 1 is the order of x
-            idxs = np.argmin(y, axis=-1)  # First index of divisors, which is the order of x
-            order = d[idxs]  # The order of each element of x
+            # Reduce the order of the multiplicative group one prime factor at a time
+            order = _calculate.multiplicative_order_jit(field)(x.view(np.ndarray).ravel()).reshape(x.shape)
+            if order.ndim == 0:
+                order = order[()]
 
         if np.isscalar(order):
             order = int(order)
@@ -1495,13 +1816,10 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
         if field.is_prime_field:
             trace = x.copy()
         else:
+            # The trace is GF(p)-linear, so it is computed from the base-p digits of each element
             subfield = field.prime_subfield
-            p = field.characteristic
-            m = field.degree
-            dtype = field.dtypes[-1]  # pylint: disable=unsubscriptable-object
-            conjugates = np.power.outer(x, p ** np.arange(0, m, dtype=dtype))
-            trace = np.add.reduce(conjugates, axis=-1)
-            trace = subfield._view(trace)
+            trace = _calculate.field_trace_jit(field)(x.view(np.ndarray).ravel()).reshape(x.shape)
+            trace = subfield._view(trace.astype(x.dtype))
 
         return trace
 
@@ -1665,11 +1983,12 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
             base: A primitive element or elements :math:`\beta` of the finite field that is the base of the logarithm.
                 The default is `None` which uses :obj:`~FieldArray.primitive_element`.
 
-                .. slow-performance::
+                .. info::
 
-                    If the :obj:`FieldArray` is configured to use lookup tables (`ufunc_mode == "jit-lookup"`) and
-                    this method is invoked with a base different from :obj:`~FieldArray.primitive_element`, then
-                    explicit calculation will be used (which is slower than using lookup tables).
+                    If the :obj:`FieldArray` is configured to use lookup tables (`"jit-lookup"` or `"jit-table"`),
+                    logarithms to a base different from :obj:`~FieldArray.primitive_element` are also derived from
+                    the logarithm lookup table. A base that is not a primitive element raises an
+                    :obj:`ArithmeticError`.
 
         Returns:
             An integer array :math:`i` of powers of :math:`\beta` such that :math:`\beta^i = x`. The return array
@@ -1721,12 +2040,8 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
         kwargs = {}
         inputs = [x, base]
         inputs, kwargs = field._log._view_inputs_as_ndarray(inputs, kwargs)
-        if field.ufunc_mode == "jit-lookup" and not np.array_equal(base, field.primitive_element):
-            # Must explicitly use calculation and not lookup tables if the base of the logarithm isn't the base
-            # used in the lookup tables.
-            ufunc = field._log.jit_calculate
-        else:
-            ufunc = field._log.ufunc
+        # The lookup tables have a fixed base, so logarithms to other bases are derived from them
+        ufunc = field._log.ufunc_for("__call__", inputs)
         output = getattr(ufunc, "__call__")(*inputs, **kwargs)
 
         # TODO: Could add a method keyword argument to the function to allow different modes.
@@ -1882,25 +2197,13 @@ class FieldArray(Array, metaclass=FieldArrayMeta):
         return s
 
 
-def _poly_det(A: np.ndarray) -> Poly:
+def _conjugates(a: FieldArray) -> FieldArray:
     """
-    Computes the determinant of a matrix of `Poly` objects.
+    Computes the Galois conjugates a, a^p, ..., a^(p^(m-1)) of the Galois field element `a` with the Frobenius map.
     """
-    field = A.flatten()[0].field
-
-    if A.shape == (2, 2):
-        return A[0, 0] * A[1, 1] - A[0, 1] * A[1, 0]
-
-    n = A.shape[0]  # Size of the n x n matrix
-    det = Poly.Zero(field)
-    for i in range(n):
-        idxs = np.delete(np.arange(0, n), i)
-        if i % 2 == 0:
-            det += A[0, i] * _poly_det(A[1:, idxs])
-        else:
-            det -= A[0, i] * _poly_det(A[1:, idxs])
-
-    return det
+    field = type(a)
+    conjugates = _calculate.conjugates_jit(field)(a.view(np.ndarray).ravel())[0]
+    return field._view(conjugates.astype(a.dtype))
 
 
 def _characteristic_poly_element(a: FieldArray) -> Poly:
@@ -1913,7 +2216,7 @@ def _characteristic_poly_element(a: FieldArray) -> Poly:
     if field.is_prime_field:
         poly = x - a
     else:
-        powers = a ** (field.characteristic ** np.arange(0, field.degree, dtype=field.dtypes[-1]))
+        powers = _conjugates(a)
         poly = Poly.Roots(powers, field=field)
         poly = Poly(poly.coeffs, field=field.prime_subfield)
 
@@ -1924,23 +2227,10 @@ def _characteristic_poly_matrix(A: FieldArray) -> Poly:
     """
     Computes the characteristic polynomial of the Galois field matrix `A`.
     """
-    if not A.shape[0] == A.shape[1]:
-        raise ValueError(
-            f"The 2-D array must be square to compute its characteristic polynomial, not have shape {A.shape}."
-        )
     field = type(A)
+    coeffs = _linalg.characteristic_poly_jit(field)(A)
 
-    # Compute P = xI - A
-    P = np.zeros(A.shape, dtype=object)
-    for i in range(A.shape[0]):
-        for j in range(A.shape[0]):
-            if i == j:
-                P[i, j] = Poly([1, -A[i, j]], field=field)
-            else:
-                P[i, j] = Poly([-A[i, j]], field=field)
-
-    # Compute det(P)
-    return _poly_det(P)
+    return Poly(coeffs, field=field)
 
 
 def _minimal_poly_element(a: FieldArray) -> Poly:
@@ -1953,7 +2243,7 @@ def _minimal_poly_element(a: FieldArray) -> Poly:
     if field.is_prime_field:
         poly = x - a
     else:
-        conjugates = np.unique(a ** (field.characteristic ** np.arange(0, field.degree, dtype=field.dtypes[-1])))
+        conjugates = np.unique(_conjugates(a))
         poly = Poly.Roots(conjugates, field=field)
         poly = Poly(poly.coeffs, field=field.prime_subfield)
 
@@ -0,0 +1,394 @@
+"""
+A module that defines FieldElement, a lightweight scalar element of a finite field.
+"""
+from __future__ import annotations
+
+import operator
+from typing import TYPE_CHECKING, Callable, Type
+
+import numpy as np
+
+from .._helper import export
+from ..typing import ElementLike
+
+if TYPE_CHECKING:
+    from ._array import FieldArray
+
+TABLE_MAX_ORDER = 2**16  # The largest extension field whose elements use lookup tables
+
+
+@export
+class FieldElement:
+    r"""
+    A scalar element of a finite field :math:`\mathrm{GF}(p^m)`.
+
+    Notes:
+        A :obj:`~galois.FieldElement` is a lightweight alternative to a 0-D :obj:`~galois.FieldArray`. It stores
+        a single integer and computes its arithmetic in pure Python, using integer formulas or the field's lookup
+        tables, without invoking NumPy ufuncs. This makes scalar arithmetic much cheaper, which is useful in
+        Python-level loops.
+
+        Elements of a field are created with the class :obj:`~galois.FieldArray.Element` of the
+        :obj:`~galois.FieldArray` subclass, or converted from an array with :func:`~galois.FieldArray.to_elements`.
+        They are converted back by passing them to the :obj:`~galois.FieldArray` subclass.
+
+        Elements support the operators `+`, `-`, `*`, `/`, and `**` with elements and arrays from the same field.
+        As with arrays, multiplication by an integer is scalar multiplication, i.e. repeated addition.
+
+    Examples:
+        Create elements of :math:`\mathrm{GF}(3^5)` and perform arithmetic with them.
+
+        .. ipython:: python
+
+            GF = galois.GF(3**5)
+            a = GF.Element(123); a
+            b = GF.Element("x^2 + 1"); b
+            a * b + a / b
+            a ** 10
+
+        Convert elements to and from arrays.
+
+        .. ipython:: python
+
+            x = GF([1, 2, 3]).to_elements(); x
+            GF(x)
+
+    Group:
+        galois-fields
+    """
+
+    __slots__ = ("_value",)
+
+    # The field and its arithmetic, which are set on each field's subclass. See `element_class()`.
+    _field: Type[FieldArray]
+    _characteristic: int
+    _add: Callable[[int, int], int]
+    _negative: Callable[[int], int]
+    _subtract: Callable[[int, int], int]
+    _multiply: Callable[[int, int], int]
+    _reciprocal: Callable[[int], int]
+    _power: Callable[[int, int], int]
+
+    def __init__(self, value: ElementLike):
+        if type(self) is FieldElement:
+            raise TypeError("A FieldElement must be created with the `Element` class of a FieldArray subclass.")
+        self._value = int(self._field._verify_array_like_types_and_values(value))
+
+    @classmethod
+    def _new(cls, value: int) -> FieldElement:
+        # Create an element from a verified integer, bypassing `__init__()`
+        element = object.__new__(cls)
+        element._value = value
+        return element
+
+    @property
+    def field(self) -> Type[FieldArray]:
+        """
+        The :obj:`~galois.FieldArray` subclass of the element's finite field.
+        """
+        return self._field
+
+    ###############################################################################
+    # Arithmetic
+    ###############################################################################
+
+    def _coerce(self, other, op: Callable, reflected: bool = False):
+        """
+        Performs arithmetic with an operand that is not an element of the same field.
+        """
+        cls = type(self)
+        if isinstance(other, cls._field):
+            # Array arithmetic with the element as a 0-D array
+            array = cls._field(self._value)
+            return op(other, array) if reflected else op(array, other)
+        if op is operator.mul and isinstance(other, (int, np.integer)):
+            # Scalar multiplication is repeated addition, which is multiplication by the integer modulo p
+            return cls._new(cls._multiply(self._value, int(other) % cls._characteristic))
+        return NotImplemented
+
+    def __add__(self, other):
+        cls = type(self)
+        if type(other) is not cls:
+            return self._coerce(other, operator.add)
+        return cls._new(cls._add(self._value, other._value))
+
+    def __radd__(self, other):
+        return self._coerce(other, operator.add, reflected=True)
+
+    def __sub__(self, other):
+        cls = type(self)
+        if type(other) is not cls:
+            return self._coerce(other, operator.sub)
+        return cls._new(cls._subtract(self._value, other._value))
+
+    def __rsub__(self, other):
+        return self._coerce(other, operator.sub, reflected=True)
+
+    def __mul__(self, other):
+        cls = type(self)
+        if type(other) is not cls:
+            return self._coerce(other, operator.mul)
+        return cls._new(cls._multiply(self._value, other._value))
+
+    def __rmul__(self, other):
+        return self._coerce(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other):
+        cls = type(self)
+        if type(other) is not cls:
+            return self._coerce(other, operator.truediv)
+        return cls._new(cls._multiply(self._value, cls._reciprocal(other._value)))
+
+    def __rtruediv__(self, other):
+        return self._coerce(other, operator.truediv, reflected=True)
+
+    __floordiv__ = __truediv__
+    __rfloordiv__ = __rtruediv__
+
+    def __neg__(self):
+        cls = type(self)
+        return cls._new(cls._negative(self._value))
+
+    def __pos__(self):
+        return self
+
+    def __pow__(self, other):
+        cls = type(self)
+        if not isinstance(other, (int, np.integer)):
+            raise TypeError(f"Operation 'power' requires the exponent to be an integer, not {type(other)}.")
+        return cls._new(cls._power(self._value, int(other)))
+
+    ###############################################################################
+    # Comparison and conversion
+    ###############################################################################
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self._value == other._value
+        if isinstance(other, (int, np.integer)):
+            return self._value == other
+        if isinstance(other, self._field):
+            return other == self._value
+        return NotImplemented
+
+    def __ne__(self, other):
+        if type(other) is type(self):
+            return self._value != other._value
+        if isinstance(other, (int, np.integer)):
+            return self._value != other
+        if isinstance(other, self._field):
+            return other != self._value
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._value)
+
+    def __bool__(self) -> bool:
+        return self._value != 0
+
+    def __int__(self) -> int:
+        return self._value
+
+    __index__ = __int__
+
+    def __repr__(self) -> str:
+        return repr(self._field(self._value))
+
+    def __str__(self) -> str:
+        return str(self._field(self._value))
+
+    # Instruct NumPy to defer binary operators with arrays, e.g. `x * element`, to this class's reflected operators
+    __array_ufunc__ = None
+
+
+###############################################################################
+# Arithmetic of each type of finite field
+###############################################################################
+
+
+def _prime_arithmetic(field: Type[FieldArray]) -> dict:
+    """
+    Arithmetic in GF(p) using integer formulas.
+    """
+    p = field.characteristic
+
+    def add(a: int, b: int) -> int:
+        c = a + b
+        return c - p if c >= p else c
+
+    def negative(a: int) -> int:
+        return p - a if a else 0
+
+    def subtract(a: int, b: int) -> int:
+        c = a - b
+        return c + p if c < 0 else c
+
+    def multiply(a: int, b: int) -> int:
+        return a * b % p
+
+    def power(a: int, b: int) -> int:
+        if a == 0:
+            if b < 0:
+                raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
+            return 1 if b == 0 else 0
+        return pow(a, b % (p - 1), p)
+
+    def reciprocal(a: int) -> int:
+        return power(a, -1)
+
+    return locals()
+
+
+def _table_arithmetic(field: Type[FieldArray]) -> dict:
+    """
+    Arithmetic in GF(p^m) using the field's Zech log, log, and anti-log lookup tables, stored as Python lists.
+    See `_lookup.py`.
+    """
+    if field._EXP.size == 0:
+        field._build_lookup_tables()
+    EXP = field._EXP.tolist()
+    LOG = field._LOG.tolist()
+    ZECH_LOG = field._ZECH_LOG.tolist()
+    ZECH_E = field._ZECH_E
+    ORDER = field.order
+
+    if field.characteristic == 2:
+
+        def add(a: int, b: int) -> int:
+            return a ^ b
+
+        def negative(a: int) -> int:
+            return a
+
+        subtract = add
+
+    else:
+
+        def add(a: int, b: int) -> int:
+            if a == 0:
+                return b
+            if b == 0:
+                return a
+            m, n = LOG[a], LOG[b]
+            if m > n:
+                m, n = n, m
+            if n - m == ZECH_E:
+                return 0
+            return EXP[m + ZECH_LOG[n - m]]
+
+        def negative(a: int) -> int:
+            return EXP[LOG[a] + ZECH_E] if a else 0
+
+        def subtract(a: int, b: int) -> int:
+            return add(a, negative(b))
+
+    def multiply(a: int, b: int) -> int:
+        if a == 0 or b == 0:
+            return 0
+        return EXP[LOG[a] + LOG[b]]
+
+    def power(a: int, b: int) -> int:
+        if a == 0:
+            if b < 0:
+                raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
+            return 1 if b == 0 else 0
+        return EXP[LOG[a] * b % (ORDER - 1)]
+
+    def reciprocal(a: int) -> int:
+        return power(a, -1)
+
+    return locals()
+
+
+def _binary_arithmetic(field: Type[FieldArray]) -> dict:
+    """
+    Arithmetic in GF(2^m) using carry-less multiplication modulo the irreducible polynomial.
+    """
+    ORDER = field.order
+    IRREDUCIBLE_POLY = int(field.irreducible_poly)
+
+    def add(a: int, b: int) -> int:
+        return a ^ b
+
+    def negative(a: int) -> int:
+        return a
+
+    subtract = add
+
+    def multiply(a: int, b: int) -> int:
+        c = 0
+        while b > 0:
+            if b & 0b1:
+                c ^= a
+            b >>= 1
+            a <<= 1
+            if a & ORDER:
+                a ^= IRREDUCIBLE_POLY
+        return c
+
+    return {**locals(), **_square_and_multiply(multiply, ORDER)}
+
+
+def _array_arithmetic(field: Type[FieldArray]) -> dict:
+    """
+    Arithmetic in GF(p^m) using 0-D arrays. This is reserved for large extension fields of odd characteristic.
+    """
+
+    def add(a: int, b: int) -> int:
+        return int(field(a) + field(b))
+
+    def negative(a: int) -> int:
+        return int(-field(a))
+
+    def subtract(a: int, b: int) -> int:
+        return int(field(a) - field(b))
+
+    def multiply(a: int, b: int) -> int:
+        return int(field(a) * field(b))
+
+    return {**locals(), **_square_and_multiply(multiply, field.order)}
+
+
+def _square_and_multiply(multiply: Callable[[int, int], int], order: int) -> dict:
+    def power(a: int, b: int) -> int:
+        if a == 0:
+            if b < 0:
+                raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
+            return 1 if b == 0 else 0
+        b %= order - 1  # The multiplicative order of every unit divides p^m - 1
+        c = 1
+        while b > 0:
+            if b & 0b1:
+                c = multiply(c, a)
+            a = multiply(a, a)
+            b >>= 1
+        return c
+
+    def reciprocal(a: int) -> int:
+        return power(a, -1)
+
+    return {"power": power, "reciprocal": reciprocal}
+
+
+def element_class(field: Type[FieldArray]) -> Type[FieldElement]:
+    """
+    Creates the FieldElement subclass for the finite field.
+    """
+    if field.is_prime_field:
+        arithmetic = _prime_arithmetic(field)
+    elif field.order <= TABLE_MAX_ORDER:
+        arithmetic = _table_arithmetic(field)
+    elif field.characteristic == 2:
+        arithmetic = _binary_arithmetic(field)
+    else:
+        arithmetic = _array_arithmetic(field)
+
+    namespace = {
+        "__slots__": (),
+        "_field": field,
+        "_characteristic": field.characteristic,
+    }
+    for name in ["add", "negative", "subtract", "multiply", "reciprocal", "power"]:
+        namespace[f"_{name}"] = staticmethod(arithmetic[name])
+
+    return type(f"{field.name}Element", (FieldElement,), namespace)
@@ -29,7 +29,9 @@ def GF(
     irreducible_poly: PolyLike | None = None,
     primitive_element: int | PolyLike | None = None,
     verify: bool = True,
-    compile: Literal["auto", "jit-lookup", "jit-calculate", "python-calculate"] | None = None,
+    compile: Literal[
+        "auto", "jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"
+    ] | None = None,
     repr: Literal["int", "poly", "power"] | None = None,
 ) -> Type[FieldArray]:
     ...
@@ -43,7 +45,9 @@ def GF(
     irreducible_poly: PolyLike | None = None,
     primitive_element: int | PolyLike | None = None,
     verify: bool = True,
-    compile: Literal["auto", "jit-lookup", "jit-calculate", "python-calculate"] | None = None,
+    compile: Literal[
+        "auto", "jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"
+    ] | None = None,
     repr: Literal["int", "poly", "power"] | None = None,
 ) -> Type[FieldArray]:
     ...
@@ -94,15 +98,22 @@ def GF(
             - `None` (default): For a newly-created :obj:`~galois.FieldArray` subclass, `None` corresponds to
               `"auto"`. If the :obj:`~galois.FieldArray` subclass already exists, `None` does not modify its current
               compilation mode.
-            - `"auto"`: Selects `"jit-lookup"` for fields with order less than :math:`2^{20}`, `"jit-calculate"` for
-              larger fields, and `"python-calculate"` for fields whose elements cannot be represented with
-              :obj:`numpy.int64`.
+            - `"auto"`: Selects `"jit-table"` for fields whose multiplication and division tables use at most 128 KB,
+              `"jit-lookup"` for other fields with order less than :math:`2^{20}`, `"jit-split-table"` for larger
+              binary extension fields, `"jit-calculate"` for other larger fields, and `"python-calculate"` for fields
+              whose elements cannot be represented with :obj:`numpy.int64`.
             - `"jit-lookup"`: JIT compiles arithmetic ufuncs to use Zech log, log, and anti-log lookup tables for
               efficient computation. In the few cases where explicit calculation is faster than table lookup, explicit
               calculation is used.
             - `"jit-calculate"`: JIT compiles arithmetic ufuncs to use explicit calculation. The `"jit-calculate"`
               mode is designed for large fields that cannot or should not store lookup tables in RAM. Generally, the
               `"jit-calculate"` mode is slower than `"jit-lookup"`.
+            - `"jit-split-table"`: JIT compiles arithmetic ufuncs to use explicit calculation, except that
+              multiplication uses small split tables. This is only supported for binary extension fields with order
+              greater than :math:`2^{20}`, for which it is several times faster than `"jit-calculate"`.
+            - `"jit-table"`: JIT compiles arithmetic ufuncs to use full multiplication and division tables, so
+              multiplication and division are a single table lookup. The other arithmetic is the same as
+              `"jit-lookup"`. This is only supported for fields with order at most :math:`2^{12}`.
             - `"python-calculate"`: Uses pure-Python ufuncs with explicit calculation. This is reserved for fields
               whose elements cannot be represented with :obj:`numpy.int64` and instead use :obj:`numpy.object_` with
               Python :obj:`int` (which has arbitrary precision).
@@ -265,10 +276,10 @@ def GF(
     verify_isinstance(compile, str, optional=True)
     verify_isinstance(repr, str, optional=True)
 
-    if not compile in [None, "auto", "jit-lookup", "jit-calculate", "python-calculate"]:
+    if not compile in [None, "auto", "jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"]:
         raise ValueError(
-            f"Argument 'compile' must be in ['auto', 'jit-lookup', 'jit-calculate', 'python-calculate'], "
-            f"not {compile!r}."
+            "Argument 'compile' must be in ['auto', 'jit-lookup', 'jit-calculate', 'jit-split-table', 'jit-table', "
+            f"'python-calculate'], not {compile!r}."
         )
     if not repr in [None, "int", "poly", "power"]:
         raise ValueError(f"Argument 'repr' must be in ['int', 'poly', 'power'], not {repr!r}.")
@@ -307,7 +318,9 @@ def Field(
     irreducible_poly: PolyLike | None = None,
     primitive_element: int | PolyLike | None = None,
     verify: bool = True,
-    compile: Literal["auto", "jit-lookup", "jit-calculate", "python-calculate"] | None = None,
+    compile: Literal[
+        "auto", "jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"
+    ] | None = None,
     repr: Literal["int", "poly", "power"] | None = None,
 ) -> Type[FieldArray]:
     ...
@@ -321,7 +334,9 @@ def Field(
     irreducible_poly: PolyLike | None = None,
     primitive_element: int | PolyLike | None = None,
     verify: bool = True,
-    compile: Literal["auto", "jit-lookup", "jit-calculate", "python-calculate"] | None = None,
+    compile: Literal[
+        "auto", "jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"
+    ] | None = None,
     repr: Literal["int", "poly", "power"] | None = None,
 ) -> Type[FieldArray]:
     ...
@@ -356,7 +371,9 @@ def _GF_prime(
     p: int,
     alpha: int | None = None,
     verify: bool = True,
-    compile: Literal["auto", "jit-lookup", "jit-calculate", "python-calculate"] | None = None,
+    compile: Literal[
+        "auto", "jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"
+    ] | None = None,
     repr: Literal["int", "poly", "power"] | None = None,
 ) -> Type[FieldArray]:
     """
@@ -426,7 +443,9 @@ def _GF_extension(
     irreducible_poly_: PolyLike | None = None,
     alpha: PolyLike | None = None,
     verify: bool = True,
-    compile: Literal["auto", "jit-lookup", "jit-calculate", "python-calculate"] | None = None,
+    compile: Literal[
+        "auto", "jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"
+    ] | None = None,
     repr: Literal["int", "poly", "power"] | None = None,
 ) -> Type[FieldArray]:
     """
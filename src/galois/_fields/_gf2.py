@@ -1,8 +1,9 @@
 """
-A module that defines the GF(2) array class.
+A module that defines the GF(2) array class and its bit-packed counterpart.
 """
 from __future__ import annotations
 
+import numba
 import numpy as np
 
 from .._domains._lookup import (
@@ -18,8 +19,13 @@ from .._domains._lookup import (
 )
 from .._domains._ufunc import UFuncMixin
 from .._helper import export
+from ..typing import ArrayLike, ShapeLike
 from ._array import FieldArray
 
+WORD_BITS = 64  # The number of elements in each word of a GF2Packed array
+
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)  # The number of set bits of each byte
+
 
 class reciprocal(reciprocal_ufunc):
     """
@@ -99,6 +105,12 @@ class UFuncMixin_2_1(UFuncMixin):
         cls._log = log(cls)
         cls._sqrt = sqrt(cls)
 
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if any(type(input) is GF2Packed for input in inputs):
+            # Defer to the packed array's arithmetic, e.g. for `GF2 + GF2Packed`
+            return NotImplemented
+        return super().__array_ufunc__(ufunc, method, *inputs, **kwargs)
+
 
 # NOTE: There is a "verbatim" block in the docstring because we were not able to monkey-patch GF2 like the
 # other classes in docs/conf.py. So, technically, at doc-build-time issubclass(galois.GF2, galois.FieldArray) == False
@@ -150,7 +162,576 @@ class GF2(
         galois-fields
     """
 
+    def pack(self) -> GF2Packed:
+        """
+        Packs the array into :obj:`numpy.uint64` words, 64 elements per word along the last axis.
+
+        Returns:
+            A :obj:`~galois.GF2Packed` array with the same shape.
+
+        Examples:
+            .. ipython:: python
+
+                x = galois.GF2.Random(100, seed=1)
+                y = x.pack(); y.words
+                x.nbytes, y.nbytes
+                np.array_equal(y.unpack(), x)
+        """
+        return GF2Packed(self)
+
 
 GF2._default_ufunc_mode = "jit-calculate"
 GF2._ufunc_modes = ["jit-calculate"]
 GF2.compile("auto")
+
+
+@export
+class GF2Packed:
+    r"""
+    A bit-packed array over :math:`\mathrm{GF}(2)`.
+
+    Notes:
+        A :obj:`~galois.GF2` array stores each element in its own byte. A :obj:`~galois.GF2Packed` array instead
+        stores 64 elements in each :obj:`numpy.uint64` word along its last axis, using 8 times less memory. Addition
+        and multiplication are computed on whole words with XOR and AND.
+
+        The arrays support the NumPy ufuncs :obj:`numpy.add`, :obj:`numpy.subtract`, :obj:`numpy.multiply`,
+        :obj:`numpy.divide`, :obj:`numpy.negative`, :obj:`numpy.positive`, :obj:`numpy.bitwise_xor`,
+        :obj:`numpy.bitwise_and`, and :obj:`numpy.bitwise_or`, and the operators that invoke them. The operands may be
+        packed arrays, whose shapes broadcast in all but their last axis, :obj:`~galois.GF2` arrays, or the scalars 0
+        and 1. Sums, products, and ORs along an axis are computed with :func:`numpy.sum`, :func:`numpy.prod`, or the
+        ufuncs' `reduce()` methods, which support the `axis`, `keepdims`, and `out` keyword arguments. Along the last
+        axis, they count the set bits of each word. Matrix multiplication is supported with the `@` operator.
+
+        Comparisons with `==` and `!=` are element-wise and return boolean arrays, like :obj:`~galois.GF2` arrays.
+        Use :func:`~galois.GF2Packed.array_equal` to compare whole arrays without unpacking them.
+
+        Packed arrays are created from :obj:`~galois.GF2` arrays with :func:`~galois.GF2.pack` or the
+        :obj:`~galois.GF2Packed` constructor, and are converted back with :func:`~galois.GF2Packed.unpack`.
+
+    Examples:
+        Pack :obj:`~galois.GF2` arrays and perform arithmetic with them.
+
+        .. ipython:: python
+
+            x = galois.GF2([1, 0, 1, 1, 0, 1]).pack(); x
+            y = galois.GF2Packed([0, 1, 1, 0, 0, 1]); y
+            x + y
+            x * y
+            np.sum(x)
+
+        Compute the syndrome of a codeword with a packed parity-check matrix.
+
+        .. ipython:: python
+
+            H = galois.GF2Packed([[1, 0, 1, 1, 1, 0, 0], [1, 1, 0, 1, 0, 1, 0], [1, 1, 1, 0, 0, 0, 1]])
+            c = galois.GF2Packed([1, 0, 1, 0, 0, 1, 0])
+            H @ c
+
+    Group:
+        galois-fields
+    """
+
+    __slots__ = ("_words", "_shape")
+
+    def __init__(self, x: ArrayLike):
+        if isinstance(x, GF2Packed):
+            self._words, self._shape = x._words.copy(), x._shape
+            return
+        x = x if isinstance(x, GF2) else GF2(x)
+        if x.ndim == 0:
+            raise ValueError("GF2Packed arrays must have at least 1 dimension.")
+        self._words, self._shape = _pack(x.view(np.ndarray)), x.shape
+
+    @classmethod
+    def _new(cls, words: np.ndarray, n: int) -> GF2Packed:
+        # Create an array of `n` elements per row from its words, bypassing `__init__()`. The unused bits must be 0.
+        array = object.__new__(cls)
+        array._words, array._shape = words, (*words.shape[:-1], n)
+        return array
+
+    @classmethod
+    def Zeros(cls, shape: ShapeLike) -> GF2Packed:
+        """
+        Creates a packed array with all zeros.
+
+        Arguments:
+            shape: The shape of the array.
+
+        Returns:
+            A packed array of zeros.
+        """
+        shape = (shape,) if isinstance(shape, (int, np.integer)) else tuple(shape)
+        return cls._new(np.zeros((*shape[:-1], _n_words(shape[-1])), dtype=np.uint64), shape[-1])
+
+    @classmethod
+    def Ones(cls, shape: ShapeLike) -> GF2Packed:
+        """
+        Creates a packed array with all ones.
+
+        Arguments:
+            shape: The shape of the array.
+
+        Returns:
+            A packed array of ones.
+        """
+        shape = (shape,) if isinstance(shape, (int, np.integer)) else tuple(shape)
+        words = np.broadcast_to(_pack(np.ones(shape[-1], dtype=np.uint8)), (*shape[:-1], _n_words(shape[-1])))
+        return cls._new(words.copy(), shape[-1])
+
+    ###############################################################################
+    # Properties and conversions
+    ###############################################################################
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """
+        The shape of the unpacked array.
+        """
+        return self._shape
+
+    @property
+    def ndim(self) -> int:
+        """
+        The number of dimensions of the array.
+        """
+        return len(self._shape)
+
+    @property
+    def size(self) -> int:
+        """
+        The number of elements of the array.
+        """
+        return int(np.prod(self._shape))
+
+    @property
+    def words(self) -> np.ndarray:
+        """
+        The :obj:`numpy.uint64` words of the array, with shape `(*shape[:-1], ceil(shape[-1] / 64))`.
+
+        The element at index `j` of the last axis is bit `j % 64` of word `j // 64`. The unused bits of the last
+        word are 0.
+        """
+        return self._words
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes of the words of the array.
+        """
+        return self._words.nbytes
+
+    def __len__(self) -> int:
+        return self._shape[0]
+
+    def unpack(self) -> GF2:
+        """
+        Converts the packed array to a :obj:`~galois.GF2` array.
+
+        Returns:
+            A :obj:`~galois.GF2` array with the same shape.
+        """
+        return GF2._view(_unpack(self._words, self._shape[-1]))
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        array = _unpack(self._words, self._shape[-1])
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def copy(self) -> GF2Packed:
+        """
+        Returns a copy of the packed array.
+        """
+        return GF2Packed._new(self._words.copy(), self._shape[-1])
+
+    def __getitem__(self, key) -> GF2Packed | GF2:
+        key = key if isinstance(key, tuple) else (key,)
+        if Ellipsis not in key and len(key) < self.ndim:
+            # Only the leading axes are indexed, so the words are indexed without unpacking them
+            words = self._words[key]
+            if words.ndim > 0:
+                return GF2Packed._new(words, self._shape[-1])
+
+        output = self.unpack()[key]
+        return output if output.ndim == 0 else GF2Packed(output)
+
+    def __setitem__(self, key, value):
+        n = self._shape[-1]
+        key = key if isinstance(key, tuple) else (key,)
+        if len(key) > self.ndim or not all(isinstance(k, (int, np.integer, slice)) for k in key):
+            # Advanced indexing is computed on the unpacked array
+            array = self.unpack()
+            array[key] = np.asarray(value) if isinstance(value, GF2Packed) else value
+            self._words = _pack(array.view(np.ndarray))
+            return
+
+        leading, last = key[: self.ndim - 1], key[self.ndim - 1 :]
+        if len(last) == 0:
+            # Only the leading axes are indexed, so whole rows of words are written without unpacking them
+            self._words[leading] = self._value_words(value)
+            return
+
+        value = np.asarray(value) if isinstance(value, GF2Packed) else GF2(value).view(np.ndarray)
+        if isinstance(last[0], (int, np.integer)) and value.ndim == 0:
+            # A single bit of each indexed row is set or cleared in its word
+            if not -n <= last[0] < n:
+                raise IndexError(f"Index {last[0]} is out of bounds for axis {self.ndim - 1} with size {n}.")
+            word, bit = divmod(int(last[0]) % n, WORD_BITS)
+            mask = np.uint64(1) << np.uint64(bit)
+            if value == 1:
+                self._words[leading + (word,)] |= mask
+            else:
+                self._words[leading + (word,)] &= ~mask
+            return
+
+        # Only the indexed rows are unpacked and repacked
+        rows = self._words[leading]
+        array = _unpack(rows, n)
+        array[..., last[0]] = value
+        rows[...] = _pack(array)
+
+    def _value_words(self, value) -> np.ndarray:
+        """
+        Converts the value assigned to whole rows of the array to words.
+        """
+        if not isinstance(value, GF2Packed):
+            value = value if isinstance(value, GF2) else GF2(value)
+            if value.ndim == 0:
+                return GF2Packed.Ones(self._shape[-1])._words if value == 1 else np.uint64(0)
+            value = GF2Packed(value)
+        if value._shape[-1] != self._shape[-1]:
+            raise ValueError(f"GF2Packed arrays must have equal last dimensions, not {self._shape} and {value._shape}.")
+        return value._words
+
+    def __eq__(self, other) -> np.ndarray:
+        if isinstance(other, (int, np.integer)) and other in [0, 1]:
+            other = GF2(other)
+        try:
+            other = self._operand(other)
+        except TypeError:
+            return NotImplemented
+        # The elements are equal where their XOR is 0
+        return _unpack(~np.bitwise_xor(self._words, other._words), self._shape[-1]).astype(bool)
+
+    def __ne__(self, other) -> np.ndarray:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else ~equal
+
+    __hash__ = None
+
+    def array_equal(self, other: GF2Packed | GF2) -> bool:
+        """
+        Determines if the array has the same shape and elements as another array, without unpacking them.
+
+        Arguments:
+            other: A :obj:`~galois.GF2Packed` or :obj:`~galois.GF2` array.
+
+        Returns:
+            `True` if the arrays are equal.
+        """
+        other = other if isinstance(other, GF2Packed) else GF2Packed(other)
+        return self._shape == other._shape and np.array_equal(self._words, other._words)
+
+    def __repr__(self) -> str:
+        return "GF2Packed(" + np.array2string(np.asarray(self), separator=", ", prefix="GF2Packed(") + ")"
+
+    def __str__(self) -> str:
+        return "GF2Packed(" + np.array2string(np.asarray(self), prefix="GF2Packed(") + ")"
+
+    ###############################################################################
+    # Arithmetic
+    ###############################################################################
+
+    def count_nonzero(self, axis: int | None = None) -> int | np.ndarray:
+        """
+        Counts the non-zero elements of the array.
+
+        Arguments:
+            axis: The axis along which to count. The default is `None`, which counts all elements.
+
+        Returns:
+            The number of non-zero elements.
+        """
+        if axis is None:
+            return int(POPCOUNT[self._words.view(np.uint8)].sum())
+        if axis % self.ndim == self.ndim - 1:
+            return POPCOUNT[self._words.view(np.uint8)].sum(axis=-1)
+        return np.count_nonzero(np.asarray(self), axis=axis)
+
+    def _operand(self, other, ufunc=None) -> GF2Packed:
+        """
+        Converts the other operand of an arithmetic operation to a packed array with the same last dimension.
+        """
+        if not isinstance(other, GF2Packed):
+            if isinstance(other, (int, np.integer)) and ufunc in [np.multiply, np.bitwise_and]:
+                # Scalar multiplication is repeated addition, so only the parity of the integer matters
+                other = GF2(other % 2)
+            elif not isinstance(other, GF2):
+                raise TypeError(
+                    f"GF2Packed arrays may only be operated on with GF2Packed and GF2 arrays, not {type(other)}."
+                )
+            if other.ndim == 0:
+                other = GF2Packed.Ones(self._shape[-1]) if other == 1 else GF2Packed.Zeros(self._shape[-1])
+            else:
+                other = GF2Packed(other)
+        if other._shape[-1] != self._shape[-1]:
+            raise ValueError(f"GF2Packed arrays must have equal last dimensions, not {self._shape} and {other._shape}.")
+        return other
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        out = kwargs.pop("out", None)
+        if out is not None and not (len(out) == 1 and isinstance(out[0], (GF2Packed, np.ndarray))):
+            raise TypeError(f"GF2Packed ufuncs only support a single GF2Packed or np.ndarray output, not {out}.")
+
+        if method == "reduce" and len(inputs) == 1:
+            output = self._reduce(ufunc, **kwargs)
+        elif method == "__call__":
+            if kwargs:
+                raise TypeError(f"GF2Packed ufuncs do not support the keyword arguments {list(kwargs)}.")
+            output = self._call(ufunc, inputs)
+        else:
+            output = NotImplemented
+
+        if output is NotImplemented or out is None:
+            return output
+        return _write_output(output, out[0])
+
+    def _call(self, ufunc, inputs):
+        if len(inputs) == 1 and ufunc in [np.negative, np.positive]:
+            return self.copy()
+
+        if len(inputs) == 2 and ufunc is np.matmul and all(isinstance(input, (GF2Packed, GF2)) for input in inputs):
+            return _matmul(*[input if isinstance(input, GF2Packed) else GF2Packed(input) for input in inputs])
+
+        if len(inputs) == 2 and ufunc in _BINARY_UFUNCS:
+            a, b = [self._operand(input, ufunc) for input in inputs]
+            if ufunc in [np.divide, np.floor_divide] and b.count_nonzero() < b.size:
+                raise ZeroDivisionError("Cannot compute the multiplicative inverse of 0 in a Galois field.")
+            return GF2Packed._new(_BINARY_UFUNCS[ufunc](a._words, b._words), self._shape[-1])
+
+        return NotImplemented
+
+    def _reduce(self, ufunc, axis=0, dtype=None, keepdims=False, **kwargs):
+        if ufunc not in _REDUCTIONS:
+            raise TypeError(f"GF2Packed arrays do not support the reduction {ufunc.__name__}.reduce().")
+        if kwargs:
+            raise TypeError(f"GF2Packed reductions do not support the keyword arguments {list(kwargs)}.")
+        if dtype is not None:
+            raise TypeError(f"GF2Packed reductions do not support the 'dtype' keyword argument, not {dtype!r}.")
+        if isinstance(axis, tuple):
+            if len(axis) == 1:
+                axis = axis[0]
+            elif sorted(a % self.ndim for a in axis) == list(range(self.ndim)):
+                axis = None
+            else:
+                raise ValueError(f"GF2Packed reductions only support a single axis or all axes, not {axis}.")
+
+        output = _REDUCTIONS[ufunc](self, axis)
+        if not keepdims:
+            return output
+
+        # Insert the reduced axes with size 1
+        axes = tuple(range(self.ndim)) if axis is None else (axis % self.ndim,)
+        if isinstance(output, GF2Packed) and self.ndim - 1 not in axes:
+            return GF2Packed._new(np.expand_dims(output._words, axes), self._shape[-1])
+        return GF2Packed(np.expand_dims(np.asarray(output), axes))
+
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    __sub__ = __xor__ = __add__
+    __rsub__ = __rxor__ = __radd__
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    __and__ = __mul__
+    __rand__ = __rmul__
+
+    def __truediv__(self, other):
+        return np.divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.divide(other, self)
+
+    __floordiv__ = __truediv__
+    __rfloordiv__ = __rtruediv__
+
+    def __neg__(self):
+        return self.copy()
+
+    __pos__ = __neg__
+
+    def __iadd__(self, other):
+        self._words ^= self._operand(other)._words
+        return self
+
+    __isub__ = __ixor__ = __iadd__
+
+    def __imul__(self, other):
+        self._words &= self._operand(other, np.multiply)._words
+        return self
+
+    __iand__ = __imul__
+
+    def __matmul__(self, other):
+        return np.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return np.matmul(other, self)
+
+
+###############################################################################
+# Bit-packing routines
+###############################################################################
+
+
+def _n_words(n: int) -> int:
+    return (n + WORD_BITS - 1) // WORD_BITS
+
+
+def _pack(x: np.ndarray) -> np.ndarray:
+    """
+    Packs an array of 0s and 1s into uint64 words along its last axis.
+    """
+    packed = np.packbits(x.astype(np.uint8, copy=False), axis=-1, bitorder="little")
+    padded = np.zeros((*x.shape[:-1], _n_words(x.shape[-1]) * WORD_BITS // 8), dtype=np.uint8)
+    padded[..., : packed.shape[-1]] = packed
+    return padded.view("<u8").astype(np.uint64, copy=False)
+
+
+def _unpack(words: np.ndarray, n: int) -> np.ndarray:
+    """
+    Unpacks uint64 words into an array of 0s and 1s with `n` elements along its last axis.
+    """
+    data = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+    return np.unpackbits(data, axis=-1, count=n, bitorder="little")
+
+
+def _parity(words: np.ndarray) -> np.ndarray:
+    """
+    Computes the parity of the set bits of each word.
+    """
+    words = words.copy()
+    for shift in [32, 16, 8, 4, 2, 1]:
+        words ^= words >> np.uint64(shift)
+    return (words & np.uint64(1)).astype(np.uint8)
+
+
+def _reduce_add(x: GF2Packed, axis: int | None) -> GF2Packed | GF2:
+    if axis is None:
+        return GF2(x.count_nonzero() % 2)
+    if axis % x.ndim == x.ndim - 1:
+        # The sum of each row is the parity of its set bits
+        output = GF2._view(_parity(np.bitwise_xor.reduce(x._words, axis=-1)))
+        return output if output.ndim == 0 else GF2Packed(output)
+    return GF2Packed._new(np.bitwise_xor.reduce(x._words, axis=axis), x._shape[-1])
+
+
+def _reduce_multiply(x: GF2Packed, axis: int | None) -> GF2Packed | GF2:
+    if axis is None:
+        return GF2(int(x.count_nonzero() == x.size))
+    if axis % x.ndim == x.ndim - 1:
+        # The product of each row is 1 only if all of its bits are set
+        output = GF2._view((x.count_nonzero(axis=-1) == x._shape[-1]).astype(np.uint8))
+        return output if output.ndim == 0 else GF2Packed(output)
+    return GF2Packed._new(np.bitwise_and.reduce(x._words, axis=axis), x._shape[-1])
+
+
+def _reduce_or(x: GF2Packed, axis: int | None) -> GF2Packed | GF2:
+    if axis is None:
+        return GF2(int(x.count_nonzero() > 0))
+    if axis % x.ndim == x.ndim - 1:
+        # The OR of each row is 1 if any of its bits are set
+        output = GF2._view((np.bitwise_or.reduce(x._words, axis=-1) != 0).astype(np.uint8))
+        return output if output.ndim == 0 else GF2Packed(output)
+    return GF2Packed._new(np.bitwise_or.reduce(x._words, axis=axis), x._shape[-1])
+
+
+def _write_output(output: GF2Packed | GF2, out: GF2Packed | np.ndarray) -> GF2Packed | np.ndarray:
+    """
+    Writes the output of a ufunc into the `out` array.
+    """
+    if out.shape != output.shape:
+        raise ValueError(f"The 'out' array must have shape {output.shape}, not {out.shape}.")
+    if isinstance(out, GF2Packed):
+        out._words[...] = output._words if isinstance(output, GF2Packed) else _pack(np.asarray(output))
+    else:
+        np.copyto(out, np.asarray(output), casting="unsafe")
+    return out
+
+
+def _matmul(a: GF2Packed, b: GF2Packed) -> GF2Packed:
+    """
+    Computes the matrix multiplication of a 2-D array with a 1-D or 2-D array.
+    """
+    if not (a.ndim == 2 and b.ndim in [1, 2]):
+        raise ValueError(
+            "GF2Packed matrix multiplication requires a 2-D array and a 1-D or 2-D array, "
+            f"not {a.ndim}-D and {b.ndim}-D."
+        )
+    if a.shape[1] != b.shape[0]:
+        raise ValueError(f"Operands have incompatible shapes for matrix multiplication, {a.shape} and {b.shape}.")
+
+    if b.ndim == 1:
+        # Each output element is the parity of the AND of a row and the vector
+        bits = _matmul_jit(_int64(a._words), _int64(b._words[np.newaxis, :]))[:, 0]
+    else:
+        # Pack the columns of the second matrix, so each output element is the parity of the AND of two rows
+        bits = _matmul_jit(_int64(a._words), _int64(_pack(np.asarray(b).T)))
+
+    return GF2Packed._new(_pack(bits), bits.shape[-1])
+
+
+def _int64(words: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(words).view(np.int64)
+
+
+@numba.jit(["uint8[:, :](int64[:, ::1], int64[:, ::1])"], nopython=True, cache=True)
+def _matmul_jit(a: np.ndarray, b: np.ndarray) -> np.ndarray:  # pragma: no cover
+    """
+    Computes the parity of the AND of each row of `a` with each row of `b`.
+    """
+    c = np.zeros((a.shape[0], b.shape[0]), dtype=np.uint8)
+    for i in range(a.shape[0]):
+        for j in range(b.shape[0]):
+            word = 0
+            for k in range(a.shape[1]):
+                word ^= a[i, k] & b[j, k]
+
+            # Fold the word onto its lowest bit. The sign extension of the shifts only affects the higher bits.
+            word ^= word >> 32
+            word ^= word >> 16
+            word ^= word >> 8
+            word ^= word >> 4
+            word ^= word >> 2
+            word ^= word >> 1
+            c[i, j] = word & 1
+
+    return c
+
+
+_BINARY_UFUNCS = {
+    np.add: np.bitwise_xor,
+    np.subtract: np.bitwise_xor,
+    np.bitwise_xor: np.bitwise_xor,
+    np.multiply: np.bitwise_and,
+    np.bitwise_and: np.bitwise_and,
+    np.bitwise_or: np.bitwise_or,
+    np.divide: np.bitwise_and,
+    np.floor_divide: np.bitwise_and,
+}
+
+_REDUCTIONS = {
+    np.add: _reduce_add,
+    np.subtract: _reduce_add,
+    np.bitwise_xor: _reduce_add,
+    np.multiply: _reduce_multiply,
+    np.bitwise_and: _reduce_multiply,
+    np.bitwise_or: _reduce_or,
+}
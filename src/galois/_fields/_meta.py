@@ -12,6 +12,7 @@ from .._domains._array import ArrayMeta
 from .._modular import totatives
 from .._polys import Poly
 from .._polys._conversions import integer_to_poly, poly_to_str
+from ._element import FieldElement, element_class
 
 # Obtain forward references
 if TYPE_CHECKING:
@@ -46,6 +47,14 @@ class FieldArrayMeta(ArrayMeta):
         # Construct the irreducible polynomial from its integer representation
         cls._irreducible_poly = Poly.Int(cls._irreducible_poly_int, field=cls._prime_subfield)
 
+        if cls._characteristic == 2 and cls._degree > 1 and cls._default_ufunc_mode == "jit-calculate":
+            # Large binary extension fields multiply faster with split tables than with bit-serial calculation
+            cls._default_ufunc_mode = "jit-split-table"
+            cls._ufunc_modes = ["jit-lookup", "jit-calculate", "jit-split-table"]
+
+        # The scalar element class is created on first access, see `Element`
+        cls._element_class: Type[FieldElement] | None = None
+
     ###############################################################################
     # Class properties
     ###############################################################################
@@ -410,6 +419,39 @@ class FieldArrayMeta(ArrayMeta):
         is_square = x.is_square()
         return x[~is_square]  # pylint: disable=unsubscriptable-object
 
+    @property
+    def Element(cls) -> Type[FieldElement]:
+        r"""
+        The :obj:`~galois.FieldElement` subclass for scalar elements of the Galois field.
+
+        Notes:
+            A :obj:`~galois.FieldElement` holds a single element and computes its arithmetic in pure Python, which
+            avoids the overhead of NumPy ufuncs on 0-D arrays. Prime fields use integer arithmetic, small extension
+            fields use the lookup tables of :math:`\mathrm{GF}(p^m)`, and larger binary extension fields use
+            polynomial multiplication modulo the irreducible polynomial.
+
+        See Also:
+            FieldArray.to_elements
+
+        Examples:
+            .. ipython:: python
+
+                GF = galois.GF(2**8)
+                a = GF.Element(85); a
+                b = GF.Element(200); b
+                a * b + a ** -1
+                GF(a)
+
+        Group:
+            Elements
+
+        Order:
+            22
+        """
+        if cls._element_class is None:
+            cls._element_class = element_class(cls)
+        return cls._element_class
+
     @property
     def is_prime_field(cls) -> bool:
         """
@@ -536,7 +578,7 @@ class FieldArrayMeta(ArrayMeta):
         return super().element_repr
 
     @property
-    def ufunc_mode(cls) -> Literal["jit-lookup", "jit-calculate", "python-calculate"]:
+    def ufunc_mode(cls) -> Literal["jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"]:
         """
         The current ufunc compilation mode for this :obj:`~galois.FieldArray` subclass.
 
@@ -544,7 +586,15 @@ class FieldArrayMeta(ArrayMeta):
             The ufuncs may be recompiled with :func:`~galois.FieldArray.compile`.
 
         Examples:
-            Fields with order less than :math:`2^{20}` are compiled, by default, using lookup tables for speed.
+            Small fields are compiled, by default, using full multiplication and division tables. The tables of these
+            fields use at most 128 KB.
+
+            .. ipython:: python
+
+                galois.GF(251).ufunc_mode
+                galois.GF(2**8).ufunc_mode
+
+            Other fields with order less than :math:`2^{20}` are compiled, by default, using lookup tables for speed.
 
             .. ipython:: python
 
@@ -552,7 +602,8 @@ class FieldArrayMeta(ArrayMeta):
                 galois.GF(2**16).ufunc_mode
 
             Fields with order greater than :math:`2^{20}` are compiled, by default, using explicit calculation for
-            memory savings. The field elements and arithmetic must still fit within :obj:`numpy.int64`.
+            memory savings. The field elements and arithmetic must still fit within :obj:`numpy.int64`. Binary extension
+            fields multiply using small split tables.
 
             .. ipython:: python
 
@@ -585,10 +636,12 @@ class FieldArrayMeta(ArrayMeta):
 
         Examples:
             Fields whose elements and arithmetic can fit within :obj:`numpy.int64` can be JIT compiled
-            to use either lookup tables or explicit calculation.
+            to use either lookup tables or explicit calculation. Small fields may also use full multiplication and
+            division tables, and large binary extension fields may multiply using split tables.
 
             .. ipython:: python
 
+                galois.GF(2**8).ufunc_modes
                 galois.GF(65537).ufunc_modes
                 galois.GF(2**32).ufunc_modes
 
@@ -609,7 +662,9 @@ class FieldArrayMeta(ArrayMeta):
         return super().ufunc_modes
 
     @property
-    def default_ufunc_mode(cls) -> Literal["jit-lookup", "jit-calculate", "python-calculate"]:
+    def default_ufunc_mode(
+        cls,
+    ) -> Literal["jit-lookup", "jit-calculate", "jit-split-table", "jit-table", "python-calculate"]:
         """
         The default ufunc compilation mode for this :obj:`~galois.FieldArray` subclass.
 
@@ -617,7 +672,15 @@ class FieldArrayMeta(ArrayMeta):
             The ufuncs may be recompiled with :func:`~galois.FieldArray.compile`.
 
         Examples:
-            Fields with order less than :math:`2^{20}` are compiled, by default, using lookup tables for speed.
+            Small fields are compiled, by default, using full multiplication and division tables. The tables of these
+            fields use at most 128 KB.
+
+            .. ipython:: python
+
+                galois.GF(251).default_ufunc_mode
+                galois.GF(2**8).default_ufunc_mode
+
+            Other fields with order less than :math:`2^{20}` are compiled, by default, using lookup tables for speed.
 
             .. ipython:: python
 
@@ -625,7 +688,8 @@ class FieldArrayMeta(ArrayMeta):
                 galois.GF(2**16).default_ufunc_mode
 
             Fields with order greater than :math:`2^{20}` are compiled, by default, using explicit calculation for
-            memory savings. The field elements and arithmetic must still fit within :obj:`numpy.int64`.
+            memory savings. The field elements and arithmetic must still fit within :obj:`numpy.int64`. Binary extension
+            fields multiply using small split tables.
 
             .. ipython:: python
 
@@ -0,0 +1,66 @@
+"""
+A module containing JIT-compiled kernels that multiply a large region of field elements by a single constant. The
+products of the constant with every possible input are tabulated once, so that each element of the region is multiplied
+with table lookups rather than with the field's general multiplication.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Type
+
+import numba
+import numpy as np
+
+if TYPE_CHECKING:
+    from ._array import FieldArray
+
+FULL_TABLE_MAX_ORDER = 2**16  # The largest field whose constant multiplication table stores every product
+
+
+def constant_tables(field: Type[FieldArray], c: int) -> np.ndarray | None:
+    """
+    Returns the multiplication tables of the constant `c`, or `None` if the field does not support them.
+
+    For fields with order at most FULL_TABLE_MAX_ORDER, this is the 1-D table with `table[x] = c * x`. For larger
+    binary extension fields, multiplication by `c` is linear over GF(2). So, `c * x` is the XOR of the products of `c`
+    with each byte of `x`. This is the 2-D table with `tables[k, b] = c * (b << 8k)`.
+    """
+    if field.dtypes == [np.object_]:
+        return None
+
+    if field.order <= FULL_TABLE_MAX_ORDER:
+        if field._MUL_TABLE.size > 0:
+            # The "jit-table" mode already stores the products of every pair of elements
+            return field._MUL_TABLE[c]
+        x = np.arange(field.order, dtype=np.int64)
+    elif field.characteristic == 2:
+        n_bytes = (field.degree + 7) // 8
+        x = np.arange(256, dtype=np.int64) << (8 * np.arange(n_bytes, dtype=np.int64)[:, np.newaxis])
+        x[x >= field.order] = 0  # These bytes are never set in the field's elements
+    else:
+        return None
+
+    multiply = field._multiply.ufunc_call_only
+    return multiply(np.full(x.shape, c, dtype=np.int64), x).astype(field.dtypes[0])
+
+
+@numba.jit(nopython=True, cache=True)
+def multiply_table(table: np.ndarray, x: np.ndarray, out: np.ndarray):  # pragma: no cover
+    """
+    Computes `out = c * x` for 1-D arrays using the constant's full table.
+    """
+    for i in range(x.size):
+        out[i] = table[x[i]]
+
+
+@numba.jit(nopython=True, cache=True)
+def multiply_split_tables(tables: np.ndarray, x: np.ndarray, out: np.ndarray):  # pragma: no cover
+    """
+    Computes `out = c * x` for 1-D arrays using the constant's byte tables.
+    """
+    n_bytes = tables.shape[0]
+    for i in range(x.size):
+        xi = np.int64(x[i])
+        y = tables[0, xi & 0xFF]
+        for k in range(1, n_bytes):
+            y ^= tables[k, (xi >> (8 * k)) & 0xFF]
+        out[i] = y
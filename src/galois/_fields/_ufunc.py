@@ -22,7 +22,11 @@ class UFuncMixin_p_1(UFuncMixin):
         cls._add = _calculate.add_modular(cls, always_calculate=True)
         cls._negative = _calculate.negative_modular(cls, always_calculate=True)
         cls._subtract = _calculate.subtract_modular(cls, always_calculate=True)
-        cls._multiply = _calculate.multiply_modular(cls)
+        if cls.dtypes != [np.object_] and (cls.order - 1) ** 2 > np.iinfo(np.int64).max:
+            # The products of elements overflow int64, so the JIT-compiled multiplication uses 128-bit products
+            cls._multiply = _calculate.multiply_montgomery(cls)
+        else:
+            cls._multiply = _calculate.multiply_modular(cls)
         cls._reciprocal = _calculate.reciprocal_modular_egcd(cls)
         cls._divide = _calculate.divide(cls)
         cls._power = _calculate.power_square_and_multiply(cls)
@@ -31,21 +35,6 @@ class UFuncMixin_p_1(UFuncMixin):
 
         cls._positive_power = _calculate.positive_power_square_and_multiply(cls)
 
-    @classmethod
-    def _determine_dtypes(cls) -> list[np.dtype]:
-        """
-        The only valid dtypes are ones that can hold x*x for x in [0, order).
-        """
-        max_dtype = DTYPES[-1]
-        dtypes = [
-            dtype
-            for dtype in DTYPES
-            if np.iinfo(dtype).max >= cls.order - 1 and np.iinfo(max_dtype).max >= (cls.order - 1) ** 2
-        ]
-        if len(dtypes) == 0:
-            dtypes = [np.object_]
-        return dtypes
-
 
 class UFuncMixin_2_m(UFuncMixin):
     """
@@ -58,10 +47,16 @@ class UFuncMixin_2_m(UFuncMixin):
         cls._add = _lookup.add_ufunc(cls, override=np.bitwise_xor)
         cls._negative = _lookup.negative_ufunc(cls, override=np.positive)
         cls._subtract = _lookup.subtract_ufunc(cls, override=np.bitwise_xor)
-        cls._multiply = _calculate.multiply_binary(cls)
-        cls._reciprocal = _calculate.reciprocal_itoh_tsujii(cls)
+        if cls.dtypes == [np.object_]:
+            # The elements are too large for NumPy integer data types, so they are computed with limb arithmetic
+            cls._multiply = _calculate.multiply_binary_limbs(cls)
+            cls._reciprocal = _calculate.reciprocal_binary_limbs(cls)
+            cls._power = _calculate.power_binary_limbs(cls)
+        else:
+            cls._multiply = _calculate.multiply_binary(cls)
+            cls._reciprocal = _calculate.reciprocal_itoh_tsujii(cls)
+            cls._power = _calculate.power_square_and_multiply(cls)
         cls._divide = _calculate.divide(cls)
-        cls._power = _calculate.power_square_and_multiply(cls)
         if is_prime(cls.order - 1):
             # When the order of the multiplicative group GF(p^m)* is prime, then the Pollard-rho discrete logarithm
             # algorithm is most efficient.
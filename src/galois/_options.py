@@ -2,11 +2,11 @@
 A module to get or set package-wide options.
 """
 import contextlib
-from typing import Any, Dict, Generator
+from typing import Any, Dict, Generator, Optional
 
 from typing_extensions import Literal
 
-from ._helper import export
+from ._helper import export, verify_isinstance
 
 # The default print options for the package
 PRINTOPTIONS = {}
@@ -131,3 +131,152 @@ def printoptions(**kwargs) -> Generator[None, None, None]:
     set_printoptions(**kwargs)
     yield
     set_printoptions(**options)
+
+
+# The default cache options for the package
+CACHEOPTIONS = {}
+
+
+@export
+def set_cacheoptions(
+    jit: bool = False,
+    parametric: bool = False,
+    tables: bool = False,
+    mmap: bool = False,
+    directory: Optional[str] = None,
+):
+    r"""
+    Modifies the cache options for the package.
+
+    Arguments:
+        jit: Indicates whether to persistently cache the JIT-compiled ufuncs and functions on disk. When enabled, the
+            machine code compiled for a :obj:`~galois.FieldArray` subclass is written to Numba's cache directory and
+            reloaded in later processes, eliminating the JIT compilation latency on the first use of a field. The
+            cache entries are keyed on the field's characteristic, degree, irreducible polynomial, primitive element,
+            and compilation mode. The default is `False`.
+
+            .. info::
+
+                Numba stores cached files in a `__pycache__` directory next to the :obj:`galois` source files. If
+                that directory is not writable, a user-wide cache directory is used. The location may be overridden
+                with the `NUMBA_CACHE_DIR` environment variable.
+
+        parametric: Indicates whether to share field-parametric JIT-compiled functions across fields. By default, the
+            JIT-compiled functions (matrix multiplication, convolution, polynomial division, polynomial evaluation,
+            etc.) are compiled separately for each :obj:`~galois.FieldArray` subclass because the field's arithmetic
+            is frozen into the machine code. When enabled, fields in `"jit-lookup"` or `"jit-table"` mode instead pass
+            their lookup tables as arguments to a single JIT-compiled function, which is compiled once and shared by
+            all fields. This reduces the compilation latency of programs that use many fields, at a small cost in
+            throughput. The default is `False`.
+
+        tables: Indicates whether to persistently cache the EXP, LOG, and Zech log lookup tables on disk. When enabled,
+            the lookup tables of a :obj:`~galois.FieldArray` subclass in `"jit-lookup"` or `"jit-table"` mode are saved
+            as a `.npy` file and reloaded in later processes, eliminating the table construction latency. The cache
+            entries are keyed on the field's characteristic, degree, irreducible polynomial, and primitive element. The
+            default is `False`.
+        mmap: Indicates whether to memory-map the on-disk lookup tables read-only, rather than loading a private copy
+            into each process. This requires the `tables` option. All processes that memory-map the same tables, such as
+            web server workers or :obj:`multiprocessing` pools, share one physical copy of them and do not rebuild
+            them. The default is `False`.
+        directory: The directory of the on-disk lookup table cache. The default is `None`, which corresponds to
+            `$XDG_CACHE_HOME/galois` or `~/.cache/galois`.
+
+    See Also:
+        get_cacheoptions, cacheoptions
+
+    Examples:
+        Enable the persistent JIT cache. The first process to use :math:`\mathrm{GF}(2^8)` compiles and saves its
+        ufuncs, subsequent processes load them from disk.
+
+        .. ipython:: python
+
+            galois.set_cacheoptions(jit=True)
+            GF = galois.GF(2**8)
+            x = GF([3, 7, 11]); x * x
+            @suppress
+            galois.set_cacheoptions()
+
+        Share one JIT-compiled matrix multiplication between two different fields.
+
+        .. ipython:: python
+
+            galois.set_cacheoptions(parametric=True)
+            GF1 = galois.GF(2**4)
+            GF2 = galois.GF(3**3)
+            GF1.Random((2, 2)) @ GF1.Random((2, 2))
+            GF2.Random((2, 2)) @ GF2.Random((2, 2))
+            @suppress
+            galois.set_cacheoptions()
+
+    Group:
+        config
+    """
+    verify_isinstance(jit, bool)
+    verify_isinstance(parametric, bool)
+    verify_isinstance(tables, bool)
+    verify_isinstance(mmap, bool)
+    verify_isinstance(directory, str, optional=True)
+    if mmap and not tables:
+        raise ValueError("Argument 'mmap' requires the on-disk lookup table cache, enable it with 'tables=True'.")
+
+    CACHEOPTIONS["jit"] = jit
+    CACHEOPTIONS["parametric"] = parametric
+    CACHEOPTIONS["tables"] = tables
+    CACHEOPTIONS["mmap"] = mmap
+    CACHEOPTIONS["directory"] = directory
+
+
+# Update the global cache options with the default values
+set_cacheoptions()
+
+
+@export
+def get_cacheoptions() -> Dict[str, Any]:
+    """
+    Returns the current cache options for the package.
+
+    Returns:
+        A dictionary of current cache options.
+
+    See Also:
+        set_cacheoptions, cacheoptions
+
+    Examples:
+        .. ipython:: python
+
+            galois.get_cacheoptions()
+
+    Group:
+        config
+    """
+    return CACHEOPTIONS.copy()
+
+
+@export
+@contextlib.contextmanager
+def cacheoptions(**kwargs) -> Generator[None, None, None]:
+    """
+    A context manager to temporarily modify the cache options for the package.
+
+    See :func:`~galois.set_cacheoptions` for the full list of available options.
+
+    Returns:
+        A context manager for use in a `with` statement. The cache options are only modified inside the `with` block.
+
+    See Also:
+        set_cacheoptions, get_cacheoptions
+
+    Examples:
+        .. ipython:: python
+
+            with galois.cacheoptions(jit=True):
+                galois.get_cacheoptions()
+            galois.get_cacheoptions()
+
+    Group:
+        config
+    """
+    options = get_cacheoptions()
+    set_cacheoptions(**kwargs)
+    yield
+    set_cacheoptions(**options)
@@ -7,7 +7,7 @@ import numba
 import numpy as np
 from numba import int64, uint64
 
-from .._domains import Array
+from .._domains import Array, _parametric
 from .._domains._function import Function
 from .._helper import verify_isinstance
 
@@ -159,7 +159,7 @@ class divmod_jit(Function):
             r_degree = b.shape[-1] - 1
 
             if self.field.ufunc_mode != "python-calculate":
-                qr = self.jit(a.astype(np.int64), b.astype(np.int64))
+                qr = self.jit_call(a.astype(np.int64), b.astype(np.int64))
                 qr = qr.astype(dtype)
             else:
                 qr = self.python(a.view(np.ndarray), b.view(np.ndarray))
@@ -201,6 +201,24 @@ class divmod_jit(Function):
 
         return qr
 
+    @staticmethod
+    def parametric_implementation(a, b, FIELD):  # pragma: no cover
+        assert a.ndim == 2 and b.ndim == 1
+        assert a.shape[-1] >= b.shape[-1]
+
+        q_degree = a.shape[1] - b.shape[-1]
+        qr = a.copy()
+
+        for k in range(a.shape[0]):
+            for i in range(q_degree + 1):
+                if qr[k, i] > 0:
+                    q = _parametric.multiply(qr[k, i], _parametric.reciprocal(b[0], FIELD), FIELD)
+                    for j in range(1, b.size):
+                        qr[k, i + j] = _parametric.subtract(qr[k, i + j], _parametric.multiply(q, b[j], FIELD), FIELD)
+                    qr[k, i] = q
+
+        return qr
+
 
 class floordiv_jit(Function):
     """
@@ -217,7 +235,7 @@ class floordiv_jit(Function):
         dtype = a.dtype
 
         if self.field.ufunc_mode != "python-calculate":
-            q = self.jit(a.astype(np.int64), b.astype(np.int64))
+            q = self.jit_call(a.astype(np.int64), b.astype(np.int64))
             q = q.astype(dtype)
         else:
             q = self.python(a.view(np.ndarray), b.view(np.ndarray))
@@ -255,6 +273,27 @@ class floordiv_jit(Function):
 
         return q
 
+    @staticmethod
+    def parametric_implementation(a, b, FIELD):  # pragma: no cover
+        if b.size == 1 and b[0] == 0:
+            raise ZeroDivisionError("Cannot divide a polynomial by zero.")
+
+        if a.size < b.size:
+            return np.array([0], dtype=a.dtype)
+
+        q_degree = a.size - b.size
+        q = np.zeros(q_degree + 1, dtype=a.dtype)
+        aa = a[0 : q_degree + 1].copy()
+
+        for i in range(q_degree + 1):
+            if aa[i] > 0:
+                q[i] = _parametric.multiply(aa[i], _parametric.reciprocal(b[0], FIELD), FIELD)
+                N = min(b.size, q_degree + 1 - i)  # We don't need to subtract in the "remainder" range
+                for j in range(1, N):
+                    aa[i + j] = _parametric.subtract(aa[i + j], _parametric.multiply(q[i], b[j], FIELD), FIELD)
+
+        return q
+
 
 class mod_jit(Function):
     """
@@ -271,7 +310,7 @@ class mod_jit(Function):
         dtype = a.dtype
 
         if self.field.ufunc_mode != "python-calculate":
-            r = self.jit(a.astype(np.int64), b.astype(np.int64))
+            r = self.jit_call(a.astype(np.int64), b.astype(np.int64))
             r = r.astype(dtype)
         else:
             r = self.python(a.view(np.ndarray), b.view(np.ndarray))
@@ -325,6 +364,43 @@ class mod_jit(Function):
 
         return r
 
+    @staticmethod
+    def parametric_implementation(a, b, FIELD):  # pragma: no cover
+        if b.size == 1 and b[0] == 0:
+            raise ZeroDivisionError("Cannot divide a polynomial by zero.")
+
+        if a.size < b.size:
+            return a.copy()
+
+        if b.size == 1:
+            return np.array([0], dtype=a.dtype)
+
+        q_degree = a.size - b.size
+        r_degree = b.size - 1
+        r = np.zeros(r_degree + 1, dtype=a.dtype)
+        r[1:] = a[0:r_degree]
+
+        for i in range(q_degree + 1):
+            r = np.roll(r, -1)
+            r[-1] = a[i + r_degree]
+
+            if r[0] > 0:
+                q = _parametric.multiply(r[0], _parametric.reciprocal(b[0], FIELD), FIELD)
+                for j in range(1, b.size):
+                    r[j] = _parametric.subtract(r[j], _parametric.multiply(q, b[j], FIELD), FIELD)
+
+        r = r[1:]
+
+        # Trim leading zeros to reduce computations in future calls
+        if r.size > 1:
+            idxs = np.nonzero(r)[0]
+            if idxs.size > 0:
+                r = r[idxs[0] :]
+            else:
+                r = r[-1:]
+
+        return r
+
 
 class pow_jit(Function):
     """
@@ -419,7 +495,7 @@ class evaluate_elementwise_jit(Function):
         x = np.atleast_1d(x.flatten())
 
         if self.field.ufunc_mode != "python-calculate":
-            y = self.jit(coeffs.astype(np.int64), x.astype(np.int64))
+            y = self.jit_call(coeffs.astype(np.int64), x.astype(np.int64))
             y = y.astype(dtype)
         else:
             y = self.python(coeffs.view(np.ndarray), x.view(np.ndarray))
@@ -447,6 +523,16 @@ class evaluate_elementwise_jit(Function):
 
         return y
 
+    @staticmethod
+    def parametric_implementation(coeffs, values, FIELD):  # pragma: no cover
+        y = np.zeros(values.size, dtype=values.dtype)
+        for i in numba.prange(values.size):  # pylint: disable=not-an-iterable
+            y[i] = coeffs[0]
+            for j in range(1, coeffs.size):
+                y[i] = _parametric.add(coeffs[j], _parametric.multiply(y[i], values[i], FIELD), FIELD)
+
+        return y
+
 
 class roots_jit(Function):
     """
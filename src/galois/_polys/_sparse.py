@@ -19,9 +19,11 @@ def add(
     """
     field = type(a_coeffs)
 
-    c = dict(zip(a_degrees, a_coeffs))
-    for b_degree, b_coeff in zip(b_degrees, b_coeffs):
-        c[b_degree] = c.get(b_degree, field(0)) + b_coeff
+    zero = field.Element(0)
+
+    c = dict(zip(a_degrees, a_coeffs.to_elements()))
+    for b_degree, b_coeff in zip(b_degrees, b_coeffs.to_elements()):
+        c[b_degree] = c.get(b_degree, zero) + b_coeff
 
     return np.array(list(c.keys())), field(list(c.values()))
 
@@ -49,9 +51,11 @@ def subtract(
     field = type(a_coeffs)
 
     # c(x) = a(x) - b(x)
-    c = dict(zip(a_degrees, a_coeffs))
-    for b_degree, b_coeff in zip(b_degrees, b_coeffs):
-        c[b_degree] = c.get(b_degree, field(0)) - b_coeff
+    zero = field.Element(0)
+
+    c = dict(zip(a_degrees, a_coeffs.to_elements()))
+    for b_degree, b_coeff in zip(b_degrees, b_coeffs.to_elements()):
+        c[b_degree] = c.get(b_degree, zero) - b_coeff
 
     return np.array(list(c.keys())), field(list(c.values()))
 
@@ -69,9 +73,12 @@ def multiply(
     # c(x) = a(x) * b(x)
     field = type(a_coeffs)
 
+    zero = field.Element(0)
+    b_coeffs = b_coeffs.to_elements()
+
     c = {}
-    for a_degree, a_coeff in zip(a_degrees, a_coeffs):
+    for a_degree, a_coeff in zip(a_degrees, a_coeffs.to_elements()):
         for b_degree, b_coeff in zip(b_degrees, b_coeffs):
-            c[a_degree + b_degree] = c.get(a_degree + b_degree, field(0)) + a_coeff * b_coeff
+            c[a_degree + b_degree] = c.get(a_degree + b_degree, zero) + a_coeff * b_coeff
 
     return np.array(list(c.keys())), field(list(c.values()))
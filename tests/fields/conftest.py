@@ -30,6 +30,7 @@ FIELDS = [
     pytest.param("GF(31)"),
     pytest.param("GF(3191)"),
     pytest.param("GF(2147483647)"),
+    pytest.param("GF(2305843009213693951)"),
     pytest.param("GF(36893488147419103183)"),
     # Prime extension fields
     pytest.param("GF(7^3)"),
@@ -46,9 +47,11 @@ FIELDS_DIFF_MODES = [
     pytest.param("GF(2^3)-jit-calculate"),
     pytest.param("GF(2^8)-jit-lookup"),
     pytest.param("GF(2^8)-jit-calculate"),
+    pytest.param("GF(2^8)-jit-table"),
     pytest.param("GF(2^8, 283, 19)-jit-lookup"),
     pytest.param("GF(2^8, 283, 19)-jit-calculate"),
     pytest.param("GF(2^32)-jit-calculate"),
+    pytest.param("GF(2^32)-jit-split-table"),
     pytest.param("GF(2^100)-python-calculate"),
     # Prime fields
     pytest.param("GF(5)-jit-lookup"),
@@ -57,6 +60,7 @@ FIELDS_DIFF_MODES = [
     pytest.param("GF(7)-jit-calculate"),
     pytest.param("GF(31)-jit-lookup"),
     pytest.param("GF(31)-jit-calculate"),
+    pytest.param("GF(31)-jit-table"),
     pytest.param("GF(3191)-jit-lookup"),
     pytest.param("GF(3191)-jit-calculate"),
     pytest.param("GF(2147483647)-jit-calculate"),
@@ -64,6 +68,7 @@ FIELDS_DIFF_MODES = [
     # Prime extension fields
     pytest.param("GF(7^3)-jit-lookup"),
     pytest.param("GF(7^3)-jit-calculate"),
+    pytest.param("GF(7^3)-jit-table"),
     pytest.param("GF(7^3, 643, 244)-jit-lookup"),
     pytest.param("GF(7^3, 643, 244)-jit-calculate"),
     pytest.param("GF(109987^4)-python-calculate"),
@@ -89,6 +94,8 @@ def construct_field(folder):
         GF = galois.GF(3191, compile=ufunc_mode)
     elif folder == "GF(2147483647)":
         GF = galois.GF(2147483647, compile=ufunc_mode)
+    elif folder == "GF(2305843009213693951)":
+        GF = galois.GF(2305843009213693951, compile=ufunc_mode)
     elif folder == "GF(36893488147419103183)":
         GF = galois.GF(36893488147419103183, compile=ufunc_mode)
 
@@ -1,9 +1,11 @@
 """
 A pytest module to test the accuracy of FieldArray arithmetic.
 """
+import math
 import random
 
 import numpy as np
+import pytest
 
 import galois
 
@@ -61,6 +63,67 @@ def test_multiply(field_multiply):
     assert z.dtype == dtype
 
 
+@pytest.mark.parametrize("order", [2**21, 2**33, 2**63])
+def test_multiply_split_table(order):
+    GF = galois.GF(order, compile="jit-split-table")
+    x = GF.Random(10)
+    y = GF.Random(10, low=1)
+
+    z = x * y
+    for xi, yi, zi in zip(x, y, z):
+        assert galois.Poly.Int(int(zi)) == galois.Poly.Int(int(xi)) * galois.Poly.Int(int(yi)) % GF.irreducible_poly
+    assert np.array_equal((x / y[0]) * y[0], x)
+
+
+@pytest.mark.parametrize("p", [4294967291, 2**61 - 1, 9223372036854775783])
+def test_arithmetic_wide_prime(p):
+    # The products of these elements overflow int64, but the fields are still JIT compiled
+    GF = galois.GF(p)
+    assert GF.ufunc_mode == "jit-calculate"
+    x = GF.Random(10)
+    y = GF.Random(10, low=1)
+    X = [int(xi) for xi in x]
+    Y = [int(yi) for yi in y]
+
+    assert [int(zi) for zi in x + y] == [(xi + yi) % p for xi, yi in zip(X, Y)]
+    assert [int(zi) for zi in x - y] == [(xi - yi) % p for xi, yi in zip(X, Y)]
+    assert [int(zi) for zi in x * y] == [(xi * yi) % p for xi, yi in zip(X, Y)]
+    assert [int(zi) for zi in x / y] == [(xi * pow(yi, p - 2, p)) % p for xi, yi in zip(X, Y)]
+    assert [int(zi) for zi in y**-3] == [pow(yi, p - 4, p) for yi in Y]
+    if p == 2**61 - 1:
+        # The discrete logarithm is only tractable when p - 1 is smooth
+        assert np.array_equal(GF.primitive_element ** y.log(), y)
+
+
+@pytest.mark.parametrize("irreducible_poly", ["x^65 + x^4 + x^3 + x + 1", "x^128 + x^7 + x^2 + x + 1"])
+def test_arithmetic_limbs(irreducible_poly):
+    # The elements are Python integers, but multiplication, division, and exponentiation use JIT-compiled limb
+    # arithmetic
+    GF = galois.GF(2 ** galois.Poly.Str(irreducible_poly).degree, irreducible_poly=irreducible_poly)
+    assert GF.ufunc_mode == "python-calculate"
+    x = GF.Random((4, 10))
+    y = GF.Random(10, low=1)
+    X = x.view(np.ndarray)
+    Y = y.view(np.ndarray)
+
+    assert np.array_equal(x * y, GF._multiply.python_calculate(X, Y))
+    assert np.array_equal(x / y, GF._divide.python_calculate(X, Y))
+    assert np.array_equal(np.reciprocal(y), GF._reciprocal.python_calculate(Y))
+    e = np.array([0, 1, -1, 2, -3, GF.order - 1, GF.order, -(GF.order + 5), 3 * GF.order, 12345], dtype=object)
+    assert np.array_equal(y**e, GF._power.python_calculate(Y, e))
+    assert np.array_equal(x**2, x * x)
+    assert np.array_equal(GF([0, 0]) ** np.array([0, 5], dtype=object), [1, 0])
+
+    z = GF.Zeros((4, 10))
+    np.multiply(x, y, out=z)
+    assert np.array_equal(z, x * y)
+
+    with pytest.raises(ZeroDivisionError):
+        np.reciprocal(GF([1, 0]))
+    with pytest.raises(ZeroDivisionError):
+        GF([1, 0]) ** -1
+
+
 def test_scalar_multiply(field_scalar_multiply):
     GF, X, Y, Z = (
         field_scalar_multiply["GF"],
@@ -103,6 +166,18 @@ def test_multiplicative_inverse(field_multiplicative_inverse):
     assert type(z) is GF
     assert z.dtype == dtype
 
+    z = np.reciprocal(x)
+    assert np.array_equal(z, Z)
+    assert type(z) is GF
+    assert z.dtype == dtype
+
+    # Large arrays of explicitly calculated inverses are inverted simultaneously, in blocks
+    x = GF.Random(1100, low=1, seed=1, dtype=dtype)
+    z = np.reciprocal(x)
+    assert np.all(z * x == 1)
+    assert type(z) is GF
+    assert z.dtype == dtype
+
 
 def test_divide(field_divide):
     GF, X, Y, Z = field_divide["GF"], field_divide["X"], field_divide["Y"], field_divide["Z"]
@@ -121,6 +196,63 @@ def test_divide(field_divide):
     assert z.dtype == dtype
 
 
+def test_in_place(field_divide):
+    GF = field_divide["GF"]
+    dtype = random.choice(GF.dtypes)
+    x = GF.Random(10, dtype=dtype)
+    y = GF.Random(10, low=1, dtype=dtype)
+
+    for ufunc in [np.add, np.subtract, np.multiply, np.divide]:
+        out = GF.Random(10, dtype=dtype)
+        z = ufunc(x, y, out=out)
+        assert z is out
+        assert np.array_equal(z, ufunc(x, y))
+        assert z.dtype == dtype
+
+    z = x.copy()
+    w = z
+    z += y
+    z *= y
+    z /= y
+    assert z is w
+    assert np.array_equal(z, x + y)
+
+
+def test_lazy(field_divide):
+    GF = field_divide["GF"]
+    dtype = random.choice(GF.dtypes)
+    a, b, c = GF.Random((3, 10), dtype=dtype)
+    d = GF.Random(10, low=1, dtype=dtype)
+
+    expression = (a.lazy() * b + c) / d - 3 * c.lazy() ** 2 - a.lazy()
+    z = expression.evaluate()
+    assert np.array_equal(z, (a * b + c) / d - 3 * c**2 - a)
+    assert type(z) is GF
+    assert z.dtype == dtype
+
+
+def test_elements(field_divide):
+    GF = field_divide["GF"]
+    x = GF.Random(10)
+    y = GF.Random(10, low=1)
+    n = random.randint(-10, 10)
+
+    a, b = x.to_elements(), y.to_elements()
+    assert all(type(ai) is GF.Element for ai in a)
+    assert np.array_equal(GF(a), x)
+    assert np.array_equal(GF([ai + bi for ai, bi in zip(a, b)]), x + y)
+    assert np.array_equal(GF([ai - bi for ai, bi in zip(a, b)]), x - y)
+    assert np.array_equal(GF([-ai for ai in a]), -x)
+    assert np.array_equal(GF([ai * bi for ai, bi in zip(a, b)]), x * y)
+    assert np.array_equal(GF([ai * n for ai in a]), x * n)
+    assert np.array_equal(GF([ai / bi for ai, bi in zip(a, b)]), x / y)
+    assert np.array_equal(GF([bi**n for bi in b]), y**n)
+    assert np.array_equal(a[0] * y, x[0] * y)
+
+    with pytest.raises(ZeroDivisionError):
+        a[0] / GF.Element(0)
+
+
 def test_divmod(field_divide):
     GF = field_divide["GF"]
     dtype = random.choice(GF.dtypes)
@@ -199,8 +331,6 @@ def test_square(field_power):
 def test_log(field_log):
     GF, X, Z = field_log["GF"], field_log["X"], field_log["Z"]
     dtype = random.choice(GF.dtypes)
-    if GF.order > 2**16:  # TODO: Skip slow log() for very large fields
-        return
     x = X.astype(dtype)
     z = np.log(x)
     assert np.array_equal(z, Z)
@@ -211,13 +341,22 @@ def test_log(field_log):
 def test_log_different_base(field_log):
     GF, X = field_log["GF"], field_log["X"]
     dtype = random.choice(GF.dtypes)
-    if GF.order > 2**16:  # TODO: Skip slow log() for very large fields
-        return
     x = X.astype(dtype)
-    beta = GF.primitive_elements[-1]
+    if GF.order <= 2**16:
+        beta = GF.primitive_elements[-1]
+    else:
+        # Finding all primitive elements is too slow, so use a power of the primitive element that is also primitive
+        k = next(k for k in range(2, GF.order) if math.gcd(k, GF.order - 1) == 1)
+        beta = GF.primitive_element**k
     z = x.log(beta)
     assert np.array_equal(beta**z, x)
 
+    # Each element may have a different base
+    bases = beta * GF.Ones(x.shape)
+    bases.ravel()[::2] = GF.primitive_element
+    z = x.log(bases)
+    assert np.array_equal(bases**z, x)
+
 
 def test_log_pollard_rho():
     """
@@ -154,6 +154,16 @@ def test_multiplicative_inverse_of_zero(field):
         x**-1
 
 
+def test_multiplicative_inverse_of_zero_batch(field):
+    # Large arrays of explicitly calculated inverses are inverted simultaneously
+    x = field.Random(100, low=1)
+    x[50] = 0  # Ensure one value is zero
+    with pytest.raises(ZeroDivisionError):
+        np.reciprocal(x)
+    with pytest.raises(ZeroDivisionError):
+        field.Random(100) / x
+
+
 # NOTE: Don't test power to integer because that's valid
 
 
@@ -6,6 +6,8 @@ import random
 import numpy as np
 import pytest
 
+import galois
+
 # pylint: disable=unidiomatic-typecheck
 
 
@@ -20,10 +22,6 @@ def test_additive_order(field_additive_order):
 
 def test_multiplicative_order(field_multiplicative_order):
     GF, X, Z = field_multiplicative_order["GF"], field_multiplicative_order["X"], field_multiplicative_order["Z"]
-    if GF.dtypes[-1] == np.object_:
-        # FIXME: Skipping large fields because they're too slow
-        return
-
     dtype = random.choice(GF.dtypes)
     x = X.astype(dtype)
     z = x.multiplicative_order()
@@ -75,6 +73,16 @@ def test_characteristic_poly_matrix(field_characteristic_poly_matrix):
         A.characteristic_poly()
 
 
+@pytest.mark.parametrize("order", [2, 31, 2**8, 3**5, 2**100])
+def test_characteristic_poly_matrix_cayley_hamilton(order):
+    GF = galois.GF(order)
+    A = GF.Random((20, 20))
+    poly = A.characteristic_poly()
+    assert poly.degree == 20
+    assert np.all(poly(A, elementwise=False) == 0)
+    assert poly.coeffs[-1] == np.linalg.det(A) * (-1) ** 20
+
+
 def test_minimal_poly_element(field_minimal_poly_element):
     GF, X, Z = field_minimal_poly_element["GF"], field_minimal_poly_element["X"], field_minimal_poly_element["Z"]
     for x, z_truth in zip(X, Z):
@@ -123,3 +131,12 @@ def test_field_norm(field_norm):
     z = x.field_norm()
     assert np.array_equal(z, Z)
     assert type(z) is GF.prime_subfield
+
+
+@pytest.mark.parametrize("order", [2**8, 3**5, 7**3, 2**100])
+def test_field_trace_conjugates(order):
+    GF = galois.GF(order)
+    x = GF.Random(20)
+    p, m = GF.characteristic, GF.degree
+    conjugates = np.power.outer(x, np.array([p**i for i in range(m)], dtype=GF.dtypes[-1]))
+    assert np.array_equal(x.field_trace(), np.add.reduce(conjugates, axis=-1))
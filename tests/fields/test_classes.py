@@ -58,6 +58,8 @@ def test_dtypes(field):
         assert field.dtypes == [np.uint16, np.uint32, np.int16, np.int32, np.int64]
     elif field.order == 2147483647:
         assert field.dtypes == [np.uint32, np.int32, np.int64]
+    elif field.order == 2305843009213693951:
+        assert field.dtypes == [np.int64]
     elif field.order == 36893488147419103183:
         assert field.dtypes == [np.object_]
     elif field.order == 7**3:
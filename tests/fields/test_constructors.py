@@ -65,6 +65,15 @@ RANDOM_REPRODUCIBLE = {
     "GF(2147483647)-42": galois.GF(2147483647)([191664963, 1662057957, 1405681631, 942484272]),
     "GF(2147483647)-1337": galois.GF(2147483647)([1173222463, 1885709471, 1561234711, 398418263]),
     "GF(2147483647)-27182818284": galois.GF(2147483647)([2109629431, 1184714410, 2107996914, 368533660]),
+    "GF(2305843009213693951)-42": galois.GF(2305843009213693951)(
+        [1784621144001422544, 1011984782196883447, 1979792011353080515, 1608021194655666448]
+    ),
+    "GF(2305843009213693951)-1337": galois.GF(2305843009213693951)(
+        [2024765128292662543, 427798353355711301, 2123451876044790815, 2182632279728676219]
+    ),
+    "GF(2305843009213693951)-27182818284": galois.GF(2305843009213693951)(
+        [1272077413113633021, 395710005357665980, 1222832299012692298, 1267636566820155704]
+    ),
     "GF(36893488147419103183)-42": galois.GF(36893488147419103183)(
         [2053695854357871005, 5073395517033431291, 21020764468182013662, 30929646287488622503]
     ),
@@ -283,6 +292,20 @@ def test_vector_valid_dtype(field, shape):
     assert np.array_equal(a.vector(), v)
 
 
+def test_vector_coefficients(field):
+    dtype = valid_dtype(field)
+    a = field.Random((4, 4), dtype=dtype)
+    v = a.vector()
+    assert type(v) is field.prime_subfield
+    assert v.shape == (4, 4, field.degree)
+
+    # The vectors are the base-p digits of the integer representation, ordered from degree m-1 to degree 0
+    x = a.view(np.ndarray).astype(object)
+    for i in range(field.degree - 1, -1, -1):
+        assert np.array_equal(v[..., i].view(np.ndarray).astype(object), x % field.characteristic)
+        x = x // field.characteristic
+
+
 @pytest.mark.parametrize("shape", [(), (4,), (4, 4)])
 def test_vector_invalid_dtype(field, shape):
     v_dtype = valid_dtype(field.prime_subfield)
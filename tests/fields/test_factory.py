@@ -42,23 +42,50 @@ def test_defaults_dont_modify_ufunc_mode():
     """
     GF = galois.GF(2**8)
     GF.compile("auto")  # Reset to default
-    assert GF.ufunc_mode == "jit-lookup"
+    assert GF.ufunc_mode == "jit-table"
     GF.compile("jit-calculate")
     assert GF.ufunc_mode == "jit-calculate"
     GF = galois.GF(2**8)
     assert GF.ufunc_mode == "jit-calculate"
     GF.compile("auto")  # Reset to default
-    assert GF.ufunc_mode == "jit-lookup"
+    assert GF.ufunc_mode == "jit-table"
+
+
+def test_default_ufunc_mode():
+    # The full multiplication and division tables are only the default when they are small
+    assert galois.GF(2**8).default_ufunc_mode == "jit-table"
+    assert galois.GF(3**5).default_ufunc_mode == "jit-table"
+    assert galois.GF(7**3).default_ufunc_mode == "jit-lookup"
+    assert galois.GF(2**10).default_ufunc_mode == "jit-lookup"
+    assert "jit-table" in galois.GF(2**12).ufunc_modes
+    assert "jit-table" not in galois.GF(2**13).ufunc_modes
 
 
 def test_can_modify_ufunc_mode():
     GF = galois.GF(2**8)
     GF.compile("auto")  # Reset to default
-    assert GF.ufunc_mode == "jit-lookup"
+    assert GF.ufunc_mode == "jit-table"
     GF = galois.GF(2**8, compile="jit-calculate")
     assert GF.ufunc_mode == "jit-calculate"
     GF.compile("auto")  # Reset to default
-    assert GF.ufunc_mode == "jit-lookup"
+    assert GF.ufunc_mode == "jit-table"
+
+
+@pytest.mark.parametrize("mode", ["jit-lookup", "jit-table"])
+def test_parallel_ufuncs(mode):
+    GF = galois.GF(3**5)
+    x = GF.Random(2**17)
+    y = GF.Random(2**17, low=1)
+    results = [x + y, x - y, x * y, x / y, x**3, -x]
+
+    GF.compile(mode, parallel=True)
+    for result, parallel_result in zip(results, [x + y, x - y, x * y, x / y, x**3, -x]):
+        assert type(parallel_result) is GF
+        assert np.array_equal(parallel_result, result)
+    GF.compile("auto")  # Reset to default
+
+    with pytest.raises(ValueError):
+        galois.GF(2**100).compile("python-calculate", parallel=True)
 
 
 def test_defaults_dont_modify_element_repr():
@@ -0,0 +1,168 @@
+"""
+A pytest module to test bit-packed GF(2) arrays.
+"""
+import numpy as np
+import pytest
+
+import galois
+
+GF2 = galois.GF2
+
+SHAPES = [(1,), (63,), (64,), (65,), (3, 130), (2, 3, 200)]
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_pack_unpack(shape):
+    x = GF2.Random(shape)
+    y = x.pack()
+    assert isinstance(y, galois.GF2Packed)
+    assert y.shape == shape
+    assert y.words.dtype == np.uint64
+    assert y.words.shape == (*shape[:-1], (shape[-1] + 63) // 64)
+    assert type(y.unpack()) is GF2
+    assert np.array_equal(y.unpack(), x)
+    assert galois.GF2Packed(x).array_equal(y)
+    assert galois.GF2Packed(x.tolist()).array_equal(y)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("ufunc", [np.add, np.subtract, np.multiply, np.bitwise_xor, np.bitwise_and, np.bitwise_or])
+def test_binary_ufuncs(shape, ufunc):
+    x = GF2.Random(shape)
+    y = GF2.Random(shape)
+    z = ufunc(x, y)
+    assert np.array_equal(ufunc(x.pack(), y.pack()).unpack(), z)
+    assert np.array_equal(ufunc(x.pack(), y).unpack(), z)
+    assert np.array_equal(ufunc(x, y.pack()).unpack(), z)
+
+
+def test_operators():
+    x = GF2.Random((4, 100))
+    y = GF2.Random((4, 100))
+    X, Y = x.pack(), y.pack()
+    assert np.array_equal((X + Y).unpack(), x + y)
+    assert np.array_equal((X - Y).unpack(), x - y)
+    assert np.array_equal((X * Y).unpack(), x * y)
+    assert np.array_equal((-X).unpack(), -x)
+    assert np.array_equal((X + GF2(1)).unpack(), x + GF2(1))
+    assert np.array_equal((X * 3).unpack(), x * 3)
+    assert np.array_equal((X + Y[0]).unpack(), x + y[0])  # Broadcasting in the leading axes
+    assert np.array_equal((X / GF2.Ones(100).pack()).unpack(), x)
+
+    Z = X.copy()
+    Z += Y
+    assert np.array_equal(Z.unpack(), x + y)
+    Z *= Y
+    assert np.array_equal(Z.unpack(), (x + y) * y)
+
+
+def test_arithmetic_exceptions():
+    x = GF2.Random(100).pack()
+    with pytest.raises(TypeError):
+        x + 1
+    with pytest.raises(TypeError):
+        x + np.ones(100, dtype=int)
+    with pytest.raises(ValueError):
+        x + GF2.Random(99).pack()
+    with pytest.raises(ZeroDivisionError):
+        x / GF2([1] * 99 + [0]).pack()
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_reductions(shape):
+    x = GF2.Random(shape)
+    X = x.pack()
+    for axis in range(len(shape)):
+        assert np.array_equal(np.asarray(np.add.reduce(X, axis=axis)), np.add.reduce(x, axis=axis))
+        assert np.array_equal(np.asarray(np.multiply.reduce(X, axis=axis)), np.multiply.reduce(x, axis=axis))
+    assert np.add.reduce(X, axis=None) == np.count_nonzero(x) % 2
+    assert np.sum(X) == np.sum(x)
+    assert np.prod(X) == np.prod(x)
+    assert X.count_nonzero() == np.count_nonzero(x)
+    assert np.array_equal(X.count_nonzero(axis=-1), np.count_nonzero(x.view(np.ndarray), axis=-1))
+
+
+@pytest.mark.parametrize("ufunc", [np.add, np.multiply, np.bitwise_or])
+@pytest.mark.parametrize("axis", [0, -1, None])
+def test_reduction_keyword_arguments(ufunc, axis):
+    x = GF2.Random((3, 130))
+    X = x.pack()
+    z = ufunc.reduce(x, axis=axis, keepdims=True)
+    assert np.array_equal(np.asarray(ufunc.reduce(X, axis=axis, keepdims=True)), z)
+
+    out = GF2.Zeros(z.shape)
+    assert ufunc.reduce(X, axis=axis, keepdims=True, out=out) is out
+    assert np.array_equal(out, z)
+
+    with pytest.raises(TypeError):
+        ufunc.reduce(X, axis=axis, dtype=np.int64)
+    with pytest.raises(TypeError):
+        np.maximum.reduce(X, axis=axis)
+
+
+def test_out():
+    x = GF2.Random((3, 130))
+    y = GF2.Random((3, 130))
+    out = galois.GF2Packed.Zeros((3, 130))
+    assert np.add(x.pack(), y.pack(), out=out) is out
+    assert np.array_equal(out.unpack(), x + y)
+    with pytest.raises(ValueError):
+        np.add(x.pack(), y.pack(), out=galois.GF2Packed.Zeros((2, 130)))
+
+
+def test_equal():
+    x = GF2.Random((3, 130))
+    y = x.copy()
+    y[1, 100] ^= 1
+    X, Y = x.pack(), y.pack()
+    assert np.array_equal(X == Y, x == y)
+    assert np.array_equal(X != Y, x != y)
+    assert np.array_equal(X == y, x == y)
+    assert np.array_equal(X == 1, x == 1)
+    assert X.array_equal(x)
+    assert not X.array_equal(Y)
+
+
+def test_indexing():
+    x = GF2.Random((3, 4, 130))
+    X = x.pack()
+    assert np.array_equal(X[1].unpack(), x[1])
+    assert np.array_equal(X[1:, 2].unpack(), x[1:, 2])
+    assert np.array_equal(X[..., 60:70].unpack(), x[..., 60:70])
+    assert X[0, 1, 2] == x[0, 1, 2]
+
+    X[0, :, 64] = 1
+    x[0, :, 64] = 1
+    assert np.array_equal(X.unpack(), x)
+
+    X[1] = 0
+    x[1] = 0
+    X[2, 1:3] = GF2.Ones(130)
+    x[2, 1:3] = GF2.Ones(130)
+    X[0, 3] = X[2, 0]
+    x[0, 3] = x[2, 0]
+    X[2, 0, -1] = 0
+    x[2, 0, -1] = 0
+    X[1, :, 60:70] = 1
+    x[1, :, 60:70] = 1
+    X[[0, 2], 0, 5] = 1
+    x[[0, 2], 0, 5] = 1
+    assert np.array_equal(X.unpack(), x)
+
+    with pytest.raises(ValueError):
+        X[0] = 2
+    with pytest.raises(ValueError):
+        X[0] = GF2.Ones(129)
+    with pytest.raises(IndexError):
+        X[0, 0, 130] = 1
+
+
+def test_matmul():
+    H = GF2.Random((30, 200))
+    c = GF2.Random(200)
+    B = GF2.Random((200, 70))
+    assert np.array_equal((H.pack() @ c.pack()).unpack(), H @ c)
+    assert np.array_equal((H.pack() @ B.pack()).unpack(), H @ B)
+    assert np.array_equal((H @ B.pack()).unpack(), H @ B)
+    with pytest.raises(ValueError):
+        H.pack() @ GF2.Random(199).pack()
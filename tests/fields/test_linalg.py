@@ -317,6 +317,18 @@ def test_row_reduce_eye_right():
     )
 
 
+def test_row_reduce_compiled(field_row_reduce, monkeypatch):
+    # Invoke the JIT-compiled elimination for the small test matrices
+    monkeypatch.setattr(galois._domains._linalg.row_reduce_jit, "_JIT_THRESHOLD", 0)
+    GF, X, Z = field_row_reduce["GF"], field_row_reduce["X"], field_row_reduce["Z"]
+    for x, z_truth in zip(X, Z):
+        dtype = random.choice(GF.dtypes)
+        x = x.astype(dtype)
+        z = x.row_reduce()
+        assert np.array_equal(z, z_truth)
+        assert type(z) is GF
+
+
 def test_lu_decompose_exceptions():
     GF = galois.GF(2**8)
     with pytest.raises(ValueError):
@@ -339,6 +351,18 @@ def test_lu_decompose(field_lu_decompose):
         assert type(u) is GF
 
 
+def test_lu_decompose_compiled(field_lu_decompose, monkeypatch):
+    # Invoke the JIT-compiled row operations for the small test matrices
+    monkeypatch.setattr(galois._domains._linalg.lu_decompose_jit, "_JIT_THRESHOLD", 0)
+    GF, X, L, U = field_lu_decompose["GF"], field_lu_decompose["X"], field_lu_decompose["L"], field_lu_decompose["U"]
+    for x, l_truth, u_truth in zip(X, L, U):
+        dtype = random.choice(GF.dtypes)
+        x = x.astype(dtype)
+        l, u = x.lu_decompose()
+        assert np.array_equal(l, l_truth)
+        assert np.array_equal(u, u_truth)
+
+
 def test_plu_decompose_exceptions():
     GF = galois.GF(2**8)
     with pytest.raises(ValueError):
@@ -369,6 +393,25 @@ def test_plu_decompose(field_plu_decompose):
         assert type(u) is GF
 
 
+def test_plu_decompose_compiled(field_plu_decompose, monkeypatch):
+    # Invoke the JIT-compiled elimination for the small test matrices
+    monkeypatch.setattr(galois._domains._linalg.plu_decompose_jit, "_JIT_THRESHOLD", 0)
+    GF, X, P, L, U = (
+        field_plu_decompose["GF"],
+        field_plu_decompose["X"],
+        field_plu_decompose["P"],
+        field_plu_decompose["L"],
+        field_plu_decompose["U"],
+    )
+    for x, p_truth, l_truth, u_truth in zip(X, P, L, U):
+        dtype = random.choice(GF.dtypes)
+        x = x.astype(dtype)
+        p, l, u = x.plu_decompose()
+        assert np.array_equal(p, p_truth)
+        assert np.array_equal(l, l_truth)
+        assert np.array_equal(u, u_truth)
+
+
 def test_bug_476():
     """
     See https://github.com/mhostetter/galois/issues/476.
@@ -213,3 +213,119 @@ def test_vector_invalid_dtype(field, shape):
     v_dtype = invalid_dtype(field.prime_subfield)
     with pytest.raises(TypeError):
         a.vector(dtype=v_dtype)
+
+
+@pytest.mark.parametrize("shape", [(), (10,), (1000,), (40, 50)])
+def test_multiply_region(field, shape):
+    dtype = valid_dtype(field)
+    x = field.Random(shape, dtype=dtype)
+    c = field.Random()
+
+    y = field.multiply_region(c, x)
+    assert type(y) is field
+    assert y.dtype == dtype
+    assert np.array_equal(y, c * x)
+
+    # The output array may be non-contiguous
+    out = field.Zeros(shape[::-1], dtype=dtype).T
+    assert field.multiply_region(c, x, out=out) is out
+    assert np.array_equal(out, c * x)
+
+    assert np.array_equal(field.multiply_region(int(c), x.tolist()), c * x)
+
+
+def test_multiply_region_buffer():
+    GF = galois.GF(2**8)
+    data = bytes(range(256)) * 4
+    x = GF(np.frombuffer(data, dtype=np.uint8))
+
+    y = GF.multiply_region(29, data)
+    assert type(y) is GF
+    assert np.array_equal(y, GF(29) * x)
+
+    buffer = bytearray(data)
+    assert GF.multiply_region(29, buffer, out=buffer) is buffer
+    assert bytes(buffer) == y.tobytes()
+
+    out = memoryview(bytearray(len(data)))
+    assert GF.multiply_region(29, x, out=out) is out
+    assert out.tobytes() == y.tobytes()
+
+    GF = galois.GF(7)
+    assert np.array_equal(GF.multiply_region(3, b"\x00\x01\x06"), GF([0, 3, 4]))
+
+
+def test_multiply_region_exceptions():
+    GF = galois.GF(2**8)
+    with pytest.raises(ValueError):
+        GF.multiply_region([1, 2], GF([1, 2]))
+    with pytest.raises(TypeError):
+        GF.multiply_region(1, galois.GF(2**4)([1, 2]))
+    with pytest.raises(TypeError):
+        GF.multiply_region(1, GF([1, 2]), out=np.zeros(2, dtype=np.uint8))
+    with pytest.raises(TypeError):
+        GF.multiply_region(1, b"ab", out=b"ab")
+    with pytest.raises(ValueError):
+        GF.multiply_region(1, b"ab", out=bytearray(3))
+    with pytest.raises(ValueError):
+        GF.multiply_region(1, GF([1, 2]), out=GF([1, 2, 3]))
+    with pytest.raises(TypeError):
+        galois.GF(3**6).multiply_region(1, b"ab")
+    with pytest.raises(ValueError):
+        galois.GF(7).multiply_region(1, b"\x07")
+
+
+@pytest.mark.parametrize("shape", [(), (10,), (1000,), (40, 50)])
+def test_axpy(field, shape):
+    dtype = valid_dtype(field)
+    x = field.Random(shape, dtype=dtype)
+    y = field.Random(shape, dtype=dtype)
+    c = field.Random()
+    y_truth = y + c * x
+
+    assert field.axpy(c, x, y) is y
+    assert y.dtype == dtype
+    assert np.array_equal(y, y_truth)
+
+    # The accumulator may be non-contiguous
+    Y = field.Zeros(shape[::-1], dtype=dtype).T
+    field.axpy(c, x, Y)
+    assert np.array_equal(Y, c * x)
+
+
+@pytest.mark.parametrize("shape", [(), (10,), (1000,), (40, 50)])
+def test_multi_axpy(field, shape):
+    dtype = valid_dtype(field)
+    c = field.Random(3)
+    X = field.Random((3, *shape), dtype=dtype)
+    y = field.Random(shape, dtype=dtype)
+    y_truth = y + c[0] * X[0] + c[1] * X[1] + c[2] * X[2]
+
+    assert field.multi_axpy(c, X, y) is y
+    assert y.dtype == dtype
+    assert np.array_equal(y, y_truth)
+
+    # The accumulator may be non-contiguous
+    Y = field.Zeros(shape[::-1], dtype=dtype).T
+    field.multi_axpy(c, X, Y)
+    assert np.array_equal(Y, c[0] * X[0] + c[1] * X[1] + c[2] * X[2])
+
+
+def test_axpy_exceptions():
+    GF = galois.GF(2**8)
+    with pytest.raises(ValueError):
+        GF.axpy([1, 2], GF([1, 2]), GF([1, 2]))
+    with pytest.raises(ValueError):
+        GF.axpy(1, GF([1, 2]), GF([1, 2, 3]))
+    with pytest.raises(TypeError):
+        GF.axpy(1, GF([1, 2]), np.array([1, 2]))
+    with pytest.raises(ValueError):
+        y = GF([1, 2])
+        y.flags.writeable = False
+        GF.axpy(1, GF([1, 2]), y)
+    with pytest.raises(ValueError):
+        GF.multi_axpy(1, GF([1, 2]), GF([1, 2]))
+    with pytest.raises(ValueError):
+        GF.multi_axpy([1, 2], GF([[1, 2]]), GF([1, 2]))
+    with pytest.raises(TypeError):
+        GF.multi_axpy([1], GF([[1, 2]]), galois.GF(2**4)([1, 2]))
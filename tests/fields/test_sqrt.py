@@ -36,6 +36,7 @@ Sage:
     print(r)
 """
 import numpy as np
+import pytest
 
 import galois
 
@@ -126,3 +127,22 @@ def test_prime_extension_field_3():
     y = np.sqrt(x)
     assert np.array_equal(y, [0, 1, 6, 116, 2, 58, 50, 83, 5, 3, 25, 149, 91, 8, 124, 7, 4, 81, 148, 61, 135, 109, 86, 46, 17, 42, 129, 79, 64, 98, 26, 102, 147, 38, 123, 93, 67, 112, 146, 18, 77, 75, 88, 105, 34, 145, 134, 53, 27, 19, 128, 47, 144, 115, 73, 100, 56, 43, 59, 95, 143, 71, 108, 122, 28, 90, 69, 20, 62, 118, 39, 142, 133, 127, 141, 84, 29, 35, 111, 85, 65, 97, 51, 121, 140, 82, 21, 48, 104, 114, 44, 139, 132, 92, 80, 30, 54, 78, 107, 126, 22, 40, 57, 87, 138, 99, 60, 31, 120, 36, 137, 117, 76, 74, 94, 110, 49, 136, 131, 63, 23, 32, 72, 45, 125, 89, 66, 103, 152, 41, 119, 70, 52, 101, 24, 113, 151, 68, 150, 55, 130, 106, 96, 37, 33])  # fmt: skip
     assert isinstance(y, GF)
+
+
+@pytest.mark.parametrize("order", [3**2, 7**4, 2**16 + 1, 2**61 - 1, 2**127 - 1])
+def test_roots(order):
+    GF = galois.GF(order)
+    x = GF.Random(100, seed=1) ** 2
+    y = np.sqrt(x)
+    assert np.array_equal(y**2, x)
+    assert np.all(y <= -y)
+    assert isinstance(y, GF)
+    assert y.dtype == x.dtype
+
+
+def test_non_squares():
+    GF = galois.GF(2**16 + 1)
+    x = GF.Random(100, low=1, seed=1) ** 2
+    x[50] = GF.non_squares[0]
+    with pytest.raises(ArithmeticError):
+        np.sqrt(x)
@@ -1,6 +1,12 @@
 """
-A pytest module to test the printing options of the package.
+A pytest module to test the printing and cache options of the package.
 """
+import os
+import subprocess
+import sys
+
+import numba
+import numpy as np
 import pytest
 
 import galois
@@ -58,3 +64,154 @@ def test_context_manager():
     assert galois.get_printoptions()["coeffs"] == "desc"
     assert str(a) == "α^4 + 2"
     assert str(f) == "3x^3 + 5x + 2"
+
+
+def test_default_cache_options():
+    assert galois.get_cacheoptions() == {
+        "jit": False,
+        "parametric": False,
+        "tables": False,
+        "mmap": False,
+        "directory": None,
+    }
+
+
+def test_set_cache_exceptions():
+    with pytest.raises(TypeError):
+        galois.set_cacheoptions(jit=1)
+    with pytest.raises(TypeError):
+        galois.set_cacheoptions(parametric=1)
+    with pytest.raises(TypeError):
+        galois.set_cacheoptions(tables=1)
+    with pytest.raises(TypeError):
+        galois.set_cacheoptions(directory=1)
+    with pytest.raises(TypeError):
+        galois.set_cacheoptions(tables=True, mmap=1)
+    with pytest.raises(ValueError):
+        galois.set_cacheoptions(mmap=True)
+
+
+def test_cache_context_manager():
+    galois.set_cacheoptions()  # Ensure the default options are set
+    assert galois.get_cacheoptions()["jit"] is False
+
+    with galois.cacheoptions(jit=True):
+        assert galois.get_cacheoptions()["jit"] is True
+
+    assert galois.get_cacheoptions()["jit"] is False
+
+
+@pytest.mark.parametrize(
+    "mode, irreducible_poly",
+    [("jit-lookup", "x^3 + 2x + 1"), ("jit-calculate", "x^3 + 2x^2 + 1"), ("jit-table", "x^3 + x^2 + x + 2")],
+)
+def test_jit_cache(tmp_path, monkeypatch, mode, irreducible_poly):
+    monkeypatch.setattr(numba.core.config, "CACHE_DIR", str(tmp_path))
+    GF = galois.GF(3**3, irreducible_poly=irreducible_poly)
+    x = GF.Random(10, seed=1)
+    y = GF.Random(10, low=1, seed=2)
+
+    with galois.cacheoptions(jit=True):
+        GF.compile(mode)
+        z = x * y + x / y
+
+    # The JIT-compiled ufuncs were saved to disk
+    assert len(list(tmp_path.glob("**/*.nbi"))) > 0
+
+    GF.compile("jit-calculate" if mode != "jit-calculate" else "jit-lookup")
+    assert np.array_equal(z, x * y + x / y)
+
+
+JIT_CACHE_SCRIPT = """
+import numpy as np
+import galois
+
+galois.set_cacheoptions(jit=True)
+for GF in [galois.GF(2**8, compile="jit-lookup"), galois.GF(3**3, compile="jit-table"), galois.GF(2**61 - 1)]:
+    x = GF.Random(10, seed=1)
+    y = GF.Random(10, low=1, seed=2)
+    z = x * y + x / y - x**3
+    print(GF.name, GF.ufunc_mode, z.tolist(), np.linalg.det(GF.Random((4, 4), seed=3)))
+"""
+
+
+def test_jit_cache_reload(tmp_path):
+    # Run the same script in two processes, the first saves the JIT-compiled ufuncs to disk and the second loads them
+    env = dict(os.environ)
+    env["NUMBA_CACHE_DIR"] = str(tmp_path)
+    env["PYTHONPATH"] = os.pathsep.join([os.path.dirname(os.path.dirname(galois.__file__)), env.get("PYTHONPATH", "")])
+    outputs = []
+    for _ in range(2):
+        result = subprocess.run(
+            [sys.executable, "-c", JIT_CACHE_SCRIPT], env=env, capture_output=True, text=True, check=False
+        )
+        assert result.returncode == 0, result.stderr
+        outputs.append(result.stdout)
+        assert len(list(tmp_path.glob("**/*.nbi"))) > 0
+
+    assert outputs[0] == outputs[1]
+    assert "jit-lookup" in outputs[0] and "jit-table" in outputs[0]
+
+
+def test_table_cache(tmp_path):
+    GF = galois.GF(5**3)
+    EXP, LOG, ZECH_LOG = GF._EXP.copy(), GF._LOG.copy(), GF._ZECH_LOG.copy()
+
+    with galois.cacheoptions(tables=True, directory=str(tmp_path)):
+        GF._build_lookup_tables()
+        assert len(list(tmp_path.glob("*.npy"))) == 1
+
+        # The lookup tables are reloaded from disk
+        GF._build_lookup_tables()
+        assert np.array_equal(GF._EXP, EXP)
+        assert np.array_equal(GF._LOG, LOG)
+        assert np.array_equal(GF._ZECH_LOG, ZECH_LOG)
+
+
+def test_table_cache_mmap(tmp_path):
+    GF = galois.GF(7**3)
+    EXP, LOG, ZECH_LOG = GF._EXP, GF._LOG, GF._ZECH_LOG
+
+    with galois.cacheoptions(tables=True, mmap=True, directory=str(tmp_path)):
+        GF._build_lookup_tables()
+
+    # The lookup tables are read-only views of the file on disk
+    for table, reference in zip([GF._EXP, GF._LOG, GF._ZECH_LOG], [EXP, LOG, ZECH_LOG]):
+        assert isinstance(table, np.memmap)
+        assert not table.flags.writeable
+        assert np.array_equal(table, reference)
+
+    GF._EXP, GF._LOG, GF._ZECH_LOG = EXP, LOG, ZECH_LOG
+
+
+def test_parametric_functions(monkeypatch):
+    # Start from an empty cache, which is restored after the test
+    cache = {}
+    monkeypatch.setattr(galois._domains._function.Function, "_CACHE_PARAMETRIC", cache)
+    compiled = None
+
+    for order in [2**4, 3**3, 31]:
+        GF = galois.GF(order)
+        A = GF.Random((4, 5), seed=1)
+        B = GF.Random((5, 3), seed=2)
+        f = galois.Poly(GF.Random(10, seed=3))
+        g = galois.Poly(GF.Random(4, low=1, seed=4))
+        x = GF.Random(6, seed=5)
+        results = (A @ B, np.convolve(f.coeffs, g.coeffs), divmod(f, g), f // g, f % g, f(x))
+
+        with galois.cacheoptions(parametric=True):
+            assert np.array_equal(A @ B, results[0])
+            assert np.array_equal(np.convolve(f.coeffs, g.coeffs), results[1])
+            assert divmod(f, g) == results[2]
+            assert f // g == results[3]
+            assert f % g == results[4]
+            assert np.array_equal(f(x), results[5])
+
+        if compiled is None:
+            # The field-parametric functions compiled for the first field
+            compiled = dict(cache)
+            assert len(compiled) > 0
+        else:
+            # The other fields reuse the same compiled functions
+            assert len(cache) == len(compiled)
+            assert all(cache[key] is func for key, func in compiled.items())